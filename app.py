@@ -19,7 +19,7 @@ warnings.filterwarnings("ignore", category=FutureWarning, module="streamlit")
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.ui.auth_components import render_auth_sidebar, render_user_profile  # (미사용 시 삭제해도 됨)
-from src.ui.crawler_components import render_single_crawl_form, render_batch_crawl_form, render_crawl_history  # (미사용 시 삭제해도 됨)
+from src.ui.crawler_components import render_single_crawl_form, render_batch_crawl_form, render_crawl_history, poll_crawl_jobs  # (미사용 시 삭제해도 됨)
 from src.ui.project_components import (
     render_single_url_crawl, render_batch_url_crawl,
     render_campaign_management, render_performance_management, render_performance_crawl
@@ -396,6 +396,9 @@ def main():
             <p style="font-size:.9rem; margin:.35rem 0 0;">Made with ❤️ using Streamlit & Supabase</p>
         </div>
         """, unsafe_allow_html=True)
+        
+        # 백그라운드 작업 진행 현황 갱신 (페이지를 모두 그린 뒤 대기)
+        poll_crawl_jobs()
     
     except Exception as e:
         st.error(f"애플리케이션 오류가 발생했습니다: {str(e)}")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+오프라인 크롤링 벤치마크 스크립트 (로컬 픽스처 서버 + 실제 Selenium 경로)
+
+녹화된 픽스처(CRAWLER_FIXTURE_DIR)를 Instagram과 같은 경로로 제공하는 로컬 서버를 띄우고,
+크롤러의 base_url을 그 서버로 돌려 드라이버 시작/대기/추출 전체를 인터넷 없이 측정합니다.
+
+사용 예:
+    python benchmark_crawl.py fixtures/ --concurrency 2 --latency 0.8 --jitter 0.3
+    python benchmark_crawl.py fixtures/ --kind post --repeat 3 --wait-budget 10 --json
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+
+from src.page_fixtures import iter_fixtures
+from src.fixture_server import FixtureServer
+from src.crawl_engine import CrawlEngine
+from src.instagram_crawler import InstagramCrawler, DriverPool, TokenBucket, WaitPolicy
+from src.process_metrics import driver_rss
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * (len(ordered) - 1)))))
+    return ordered[index]
+
+class RssSampler:
+    """주기적으로 풀 드라이버(Chrome 프로세스 트리)의 RSS 합계를 측정"""
+    def __init__(self, pool, interval=1.0):
+        self.pool = pool
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            sizes = [driver_rss(driver) for driver in self.pool.drivers()]
+            sizes = [size for size in sizes if size]
+            if sizes:
+                self.samples.append(sum(sizes))
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 픽스처 서버로 Selenium 크롤링 경로의 처리량/지연/메모리 측정")
+    parser.add_argument("fixture_dir", help="픽스처 디렉터리")
+    parser.add_argument("--kind", choices=["profile", "post"], help="특정 종류만 측정")
+    parser.add_argument("--repeat", type=int, default=1, help="픽스처 목록 반복 횟수")
+    parser.add_argument("--limit", type=int, default=None, help="사용할 최대 픽스처 수")
+    parser.add_argument("--concurrency", type=int, default=2, help="동시 실행 수 (드라이버 풀 크기)")
+    parser.add_argument("--latency", type=float, default=0.5, help="서버 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="응답 지연 편차(초)")
+    parser.add_argument("--requests-per-minute", type=float, default=0, help="분당 요청 예산 (0이면 제한 없음)")
+    parser.add_argument("--wait-budget", type=float, default=None, help="URL당 대기 예산(초, 기본: CRAWLER_WAIT_BUDGET)")
+    parser.add_argument("--http-fast-path", action="store_true", help="프로필 HTTP 빠른 경로도 사용 (기본: Selenium만)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    fixtures = list(iter_fixtures(args.fixture_dir, args.kind))[:args.limit]
+    if not fixtures:
+        print(f"픽스처가 없습니다: {args.fixture_dir}")
+        return 2
+
+    pool = DriverPool(size=args.concurrency, max_pages=0, max_age=0)
+    limiter = TokenBucket(requests_per_minute=args.requests_per_minute)
+    waits = WaitPolicy(budget=args.wait_budget) if args.wait_budget else None
+
+    with FixtureServer(fixtures, latency=args.latency, jitter=args.jitter) as server:
+        def make_crawler():
+            crawler = InstagramCrawler(pool=pool, pacer=limiter, waits=waits, base_url=server.base_url)
+            if not args.http_fast_path:
+                crawler.http_fetcher = None
+            crawler.fixture_recorder = None  # 벤치마크 중 픽스처 재기록 방지
+            return crawler
+
+        engine = CrawlEngine(concurrency=args.concurrency, rate_limiter=limiter, pool=pool, crawler_factory=make_crawler)
+        jobs = [{'kind': fixture['kind'], 'url': fixture['url'], 'force_refresh': True}
+                for _ in range(max(1, args.repeat)) for fixture in fixtures]
+
+        print(f"{len(jobs)}개 URL 크롤링 ({server.base_url}, 동시 {args.concurrency}, 지연 {args.latency}±{args.jitter}초)...", file=sys.stderr)
+        pool.warm()
+        latencies, statuses = [], {}
+        started = time.monotonic()
+        with RssSampler(pool) as sampler:
+            for item in engine.stream(jobs):
+                latencies.append(item['seconds'])
+                status = item['result'].get('status', 'error')
+                statuses[status] = statuses.get(status, 0) + 1
+        elapsed = time.monotonic() - started
+    pool.shutdown()
+
+    mb = 1024 * 1024
+    report = {
+        'urls': len(jobs),
+        'seconds': round(elapsed, 2),
+        'urls_per_minute': round(len(jobs) / elapsed * 60, 2) if elapsed > 0 else 0.0,
+        'latency_p50': round(percentile(latencies, 0.5), 3),
+        'latency_p95': round(percentile(latencies, 0.95), 3),
+        'statuses': statuses,
+        'chrome_rss_mb_avg': round(sum(sampler.samples) / len(sampler.samples) / mb, 1) if sampler.samples else None,
+        'chrome_rss_mb_peak': round(max(sampler.samples) / mb, 1) if sampler.samples else None,
+        'server_requests': server.requests_served
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print("\n=== 크롤링 벤치마크 ===")
+        print(f"URL: {report['urls']}개 / {report['seconds']}초 → {report['urls_per_minute']} URLs/min")
+        print(f"URL당 지연: p50 {report['latency_p50']}초 / p95 {report['latency_p95']}초")
+        print(f"상태별: {report['statuses']}")
+        print(f"Chrome RSS: 평균 {report['chrome_rss_mb_avg']}MB / 최대 {report['chrome_rss_mb_peak']}MB")
+    return 0 if statuses.get('success', 0) == len(jobs) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
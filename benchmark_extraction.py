@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+추출 로직 벤치마크 스크립트 (브라우저/네트워크 없이 녹화된 픽스처로 실행)
+
+사용 예:
+    python benchmark_extraction.py fixtures/ --repeat 5
+    python benchmark_extraction.py fixtures/ --kind post --min-accuracy 0.95 --json
+"""
+
+import sys
+import json
+import argparse
+
+from src.page_fixtures import iter_fixtures, run_benchmark
+
+def print_report(report, show_mismatches=10):
+    for kind, summary in report.items():
+        print(f"\n=== {kind} ===")
+        print(f"픽스처: {summary['fixtures']}개 (확인된 기대값 {summary['verified_fixtures']}개) / 처리 페이지: {summary['pages']}개 / 오류: {summary['errors']}개")
+        print(f"처리량: {summary['pages_per_sec']} pages/sec ({summary['seconds']}초)")
+        print("필드별 정확도:")
+        for field, accuracy in summary['field_accuracy'].items():
+            print(f"  - {field}: {accuracy * 100:.1f}%")
+        for mismatch in summary['mismatches'][:show_mismatches]:
+            if mismatch.get('error'):
+                print(f"  ✗ {mismatch['path']}: {mismatch['error']}")
+            else:
+                print(f"  ✗ {mismatch['path']} [{mismatch['field']}] 기대={mismatch['expected']!r} 결과={mismatch['actual']!r}")
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 페이지 픽스처로 프로필/포스트 추출 성능과 정확도 측정")
+    parser.add_argument("fixture_dir", help="픽스처 디렉터리 (CRAWLER_FIXTURE_DIR로 기록한 위치)")
+    parser.add_argument("--kind", choices=["profile", "post"], help="특정 종류만 측정")
+    parser.add_argument("--repeat", type=int, default=1, help="처리량 측정 반복 횟수 (정확도는 첫 회차 기준)")
+    parser.add_argument("--min-accuracy", type=float, default=None, help="필드 정확도가 이 값보다 낮으면 종료 코드 1")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    fixtures = list(iter_fixtures(args.fixture_dir, args.kind))
+    if not fixtures:
+        print(f"픽스처가 없습니다: {args.fixture_dir}")
+        return 2
+
+    report = run_benchmark(fixtures, repeat=args.repeat)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+    if args.min_accuracy is not None:
+        below = [f"{kind}.{field}" for kind, summary in report.items()
+                 for field, accuracy in summary['field_accuracy'].items() if accuracy < args.min_accuracy]
+        if below:
+            print(f"\n정확도 기준 미달: {', '.join(below)}", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+-- crawl_jobs 테이블 스키마 (CRAWLER_JOB_QUEUE=postgresql://... 사용 시)
+-- UI가 등록하고 워커 프로세스(python -m src.crawl_worker)가 실행하는 일괄 크롤링 작업 큐
+-- 기본값인 SQLite 큐는 같은 구조의 테이블을 자동으로 만듭니다.
+
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL CHECK (kind IN ('profile', 'post')),
+    params JSONB NOT NULL DEFAULT '{}'::jsonb,
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'done', 'failed', 'cancelled')),
+    submitted_by TEXT,
+    worker_id TEXT,
+    total INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    summary JSONB,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    heartbeat_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+-- 인덱스 생성 (대기 작업 할당 / 최근 작업 조회)
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_submitted_by ON crawl_jobs(submitted_by, created_at DESC);
+
+-- 테이블 설명
+COMMENT ON TABLE crawl_jobs IS '일괄 크롤링 작업 큐 (진행 레코드 포함)';
+COMMENT ON COLUMN crawl_jobs.params IS '작업 입력 (session_id: 크롤링 세션 ID, force_refresh 등)';
+COMMENT ON COLUMN crawl_jobs.status IS '상태 (queued: 대기, running: 워커 실행 중, done: 완료, failed: 실패, cancelled: 취소)';
+COMMENT ON COLUMN crawl_jobs.heartbeat_at IS '워커 마지막 응답 시각 (오래되면 다른 워커가 다시 가져감)';
+COMMENT ON COLUMN crawl_jobs.summary IS '완료 요약 (성공/실패 수, 단계별 소요 시간)';
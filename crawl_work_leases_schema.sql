@@ -0,0 +1,178 @@
+-- 다중 노드 크롤링 워커용 스키마 (instagram_crawl_session_items_schema.sql 이후 실행)
+-- 여러 워커 호스트가 세션 항목을 임대(lease)해 나눠 크롤링하고, 전역 요청 예산을 DB에서 공유합니다.
+-- 워커: python -m src.crawl_worker --lease-items
+-- 함수는 서비스 역할(service_role, 워커의 SUPABASE_SERVICE_KEY)만 실행할 수 있습니다.
+
+-- 항목 임대 워커 전용 세션 표시 (python -m src.cli ... --enqueue-only로 만든 세션만 임대 대상)
+ALTER TABLE instagram_crawl_sessions
+    ADD COLUMN IF NOT EXISTS lease_mode BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- 세션 항목 임대 컬럼
+ALTER TABLE instagram_crawl_session_items
+    ADD COLUMN IF NOT EXISTS lease_owner TEXT,
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+-- 인덱스 생성 (임대 대상 조회)
+CREATE INDEX IF NOT EXISTS idx_crawl_session_items_lease
+    ON instagram_crawl_session_items(item_kind, status, lease_expires_at);
+
+-- 항목 임대: 임대 전용 세션에서 대기 중이거나 임대가 만료된 항목을 SKIP LOCKED로 가져가 in_flight로 표시
+-- (앱/CLI/작업 큐가 실행하는 일반 세션의 항목은 가져가지 않음)
+CREATE OR REPLACE FUNCTION claim_crawl_session_items(
+    p_worker TEXT,
+    p_limit INTEGER,
+    p_lease_seconds INTEGER,
+    p_item_kind TEXT DEFAULT 'profile',
+    p_session_id UUID DEFAULT NULL,
+    p_max_attempts INTEGER DEFAULT 3
+) RETURNS SETOF instagram_crawl_session_items
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    -- 임대 만료가 반복된 항목은 실패 처리 (워커를 계속 죽이는 항목이 큐를 막지 않도록)
+    UPDATE instagram_crawl_session_items AS items
+    SET status = 'failed', lease_owner = NULL, error_message = '임대 만료 횟수 초과', updated_at = NOW()
+    FROM instagram_crawl_sessions AS sessions
+    WHERE sessions.id = items.session_id
+      AND sessions.lease_mode
+      AND items.item_kind = p_item_kind
+      AND (p_session_id IS NULL OR items.session_id = p_session_id)
+      AND items.status = 'in_flight'
+      AND items.lease_expires_at < NOW()
+      AND items.attempts >= p_max_attempts;
+
+    RETURN QUERY
+    UPDATE instagram_crawl_session_items AS items
+    SET status = 'in_flight',
+        lease_owner = p_worker,
+        lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = items.attempts + 1,
+        updated_at = NOW()
+    WHERE items.id IN (
+        SELECT candidates.id FROM instagram_crawl_session_items AS candidates
+        JOIN instagram_crawl_sessions AS sessions ON sessions.id = candidates.session_id
+        WHERE sessions.lease_mode
+          AND candidates.item_kind = p_item_kind
+          AND (p_session_id IS NULL OR candidates.session_id = p_session_id)
+          AND (candidates.status = 'pending' OR (candidates.status = 'in_flight' AND candidates.lease_expires_at < NOW()))
+        ORDER BY candidates.created_at, candidates.item_index
+        LIMIT p_limit
+        FOR UPDATE OF candidates SKIP LOCKED
+    )
+    RETURNING items.*;
+END;
+$$;
+
+-- 임대 연장 (워커 하트비트), 아직 소유한 항목 수 반환
+CREATE OR REPLACE FUNCTION renew_crawl_session_item_leases(
+    p_worker TEXT,
+    p_item_ids UUID[],
+    p_lease_seconds INTEGER
+) RETURNS INTEGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    renewed INTEGER;
+BEGIN
+    UPDATE instagram_crawl_session_items
+    SET lease_expires_at = NOW() + make_interval(secs => p_lease_seconds)
+    WHERE id = ANY(p_item_ids) AND lease_owner = p_worker AND status = 'in_flight';
+    GET DIAGNOSTICS renewed = ROW_COUNT;
+    RETURN renewed;
+END;
+$$;
+
+-- 임대 항목 완료 처리 (임대를 잃은 워커의 결과는 반영하지 않음)
+CREATE OR REPLACE FUNCTION finish_crawl_session_item(
+    p_worker TEXT,
+    p_item_id UUID,
+    p_status TEXT,
+    p_result_ref UUID DEFAULT NULL,
+    p_error_message TEXT DEFAULT NULL
+) RETURNS BOOLEAN
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+    UPDATE instagram_crawl_session_items
+    SET status = p_status,
+        result_ref = COALESCE(p_result_ref, result_ref),
+        error_message = COALESCE(p_error_message, error_message),
+        lease_owner = NULL,
+        lease_expires_at = NULL,
+        updated_at = NOW()
+    WHERE id = p_item_id AND lease_owner = p_worker AND status = 'in_flight';
+    RETURN FOUND;
+END;
+$$;
+
+-- 끝내지 못한 임대 항목 반환 (워커 종료 시)
+CREATE OR REPLACE FUNCTION release_crawl_session_item_leases(
+    p_worker TEXT,
+    p_item_ids UUID[]
+) RETURNS INTEGER
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    released INTEGER;
+BEGIN
+    UPDATE instagram_crawl_session_items
+    SET status = 'pending', lease_owner = NULL, lease_expires_at = NULL,
+        attempts = GREATEST(attempts - 1, 0), updated_at = NOW()
+    WHERE id = ANY(p_item_ids) AND lease_owner = p_worker AND status = 'in_flight';
+    GET DIAGNOSTICS released = ROW_COUNT;
+    RETURN released;
+END;
+$$;
+
+-- 클러스터 전역 요청 예산 (토큰 버킷)
+CREATE TABLE IF NOT EXISTS crawl_rate_limits (
+    name TEXT PRIMARY KEY,
+    requests_per_minute NUMERIC NOT NULL DEFAULT 12,
+    burst INTEGER NOT NULL DEFAULT 1,
+    tokens DOUBLE PRECISION NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO crawl_rate_limits (name) VALUES ('instagram') ON CONFLICT (name) DO NOTHING;
+
+-- 예산은 워커(서비스 역할)만 읽고 씀 (정책이 없으므로 anon/authenticated는 접근 불가)
+ALTER TABLE crawl_rate_limits ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON crawl_rate_limits FROM PUBLIC, anon, authenticated;
+
+-- 토큰 1개 예약 후 사용 가능해질 때까지 기다릴 시간(초) 반환
+-- (부족분은 음수로 남겨 다음 요청자가 뒤에 줄을 서게 함, 예산이 0 이하이거나 행이 없으면 제한 없음)
+CREATE OR REPLACE FUNCTION take_crawl_rate_token(p_name TEXT DEFAULT 'instagram')
+RETURNS DOUBLE PRECISION
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+    bucket crawl_rate_limits%ROWTYPE;
+    rate DOUBLE PRECISION;
+    available DOUBLE PRECISION;
+BEGIN
+    SELECT * INTO bucket FROM crawl_rate_limits WHERE name = p_name FOR UPDATE;
+    IF NOT FOUND OR bucket.requests_per_minute <= 0 THEN
+        RETURN 0;
+    END IF;
+    rate := bucket.requests_per_minute / 60.0;
+    available := LEAST(bucket.burst, bucket.tokens + EXTRACT(EPOCH FROM (clock_timestamp() - bucket.updated_at)) * rate) - 1;
+    UPDATE crawl_rate_limits SET tokens = available, updated_at = clock_timestamp() WHERE name = p_name;
+    RETURN GREATEST(0, -available / rate);
+END;
+$$;
+
+-- 함수 실행 권한: SECURITY DEFINER 함수는 RLS를 우회하므로 워커의 서비스 역할에만 허용
+REVOKE EXECUTE ON FUNCTION claim_crawl_session_items(TEXT, INTEGER, INTEGER, TEXT, UUID, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION renew_crawl_session_item_leases(TEXT, UUID[], INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION finish_crawl_session_item(TEXT, UUID, TEXT, UUID, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION release_crawl_session_item_leases(TEXT, UUID[]) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION take_crawl_rate_token(TEXT) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION claim_crawl_session_items(TEXT, INTEGER, INTEGER, TEXT, UUID, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION renew_crawl_session_item_leases(TEXT, UUID[], INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION finish_crawl_session_item(TEXT, UUID, TEXT, UUID, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION release_crawl_session_item_leases(TEXT, UUID[]) TO service_role;
+GRANT EXECUTE ON FUNCTION take_crawl_rate_token(TEXT) TO service_role;
+
+-- 테이블 설명
+COMMENT ON COLUMN instagram_crawl_sessions.lease_mode IS '항목 임대 워커 전용 세션 여부 (--enqueue-only로 생성, 앱/작업 큐 재개 대상에서 제외)';
+COMMENT ON COLUMN instagram_crawl_session_items.lease_owner IS '항목을 임대한 워커 ID';
+COMMENT ON COLUMN instagram_crawl_session_items.lease_expires_at IS '임대 만료 시각 (하트비트로 연장, 만료되면 다른 워커가 다시 임대)';
+COMMENT ON COLUMN instagram_crawl_session_items.attempts IS '임대 횟수';
+COMMENT ON TABLE crawl_rate_limits IS '워커 전체가 공유하는 분당 요청 예산 (예: UPDATE crawl_rate_limits SET requests_per_minute = 30 WHERE name = ''instagram'')';
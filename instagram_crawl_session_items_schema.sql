@@ -0,0 +1,52 @@
+-- instagram_crawl_session_items 테이블 스키마
+-- 일괄 크롤링 세션의 항목별 작업 원장 (중단된 세션 재개용)
+
+CREATE TABLE IF NOT EXISTS instagram_crawl_session_items (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    session_id UUID REFERENCES instagram_crawl_sessions(id) ON DELETE CASCADE NOT NULL,
+    item_index INTEGER NOT NULL,
+    item_kind TEXT NOT NULL CHECK (item_kind IN ('profile', 'post')),
+    item_key TEXT NOT NULL,
+    item_url TEXT,
+    payload JSONB DEFAULT '{}'::jsonb,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'in_flight', 'done', 'failed')),
+    result_ref UUID REFERENCES instagram_crawl_results(id) ON DELETE SET NULL,
+    error_message TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    CONSTRAINT uq_session_item_index UNIQUE (session_id, item_index)
+);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_crawl_session_items_session_status ON instagram_crawl_session_items(session_id, status);
+
+-- RLS (Row Level Security) 정책 설정 - 세션 소유자만 접근
+ALTER TABLE instagram_crawl_session_items ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own crawl session items" ON instagram_crawl_session_items
+    FOR SELECT USING (EXISTS (
+        SELECT 1 FROM instagram_crawl_sessions s WHERE s.id = session_id AND s.user_id = auth.uid()
+    ));
+
+CREATE POLICY "Users can insert own crawl session items" ON instagram_crawl_session_items
+    FOR INSERT WITH CHECK (EXISTS (
+        SELECT 1 FROM instagram_crawl_sessions s WHERE s.id = session_id AND s.user_id = auth.uid()
+    ));
+
+CREATE POLICY "Users can update own crawl session items" ON instagram_crawl_session_items
+    FOR UPDATE USING (EXISTS (
+        SELECT 1 FROM instagram_crawl_sessions s WHERE s.id = session_id AND s.user_id = auth.uid()
+    ));
+
+-- 업데이트 시간 트리거
+CREATE TRIGGER update_instagram_crawl_session_items_updated_at
+    BEFORE UPDATE ON instagram_crawl_session_items
+    FOR EACH ROW EXECUTE FUNCTION public.update_updated_at_column();
+
+-- 테이블 설명
+COMMENT ON TABLE instagram_crawl_session_items IS '일괄 크롤링 세션 항목별 작업 원장';
+COMMENT ON COLUMN instagram_crawl_session_items.item_kind IS '항목 종류 (profile: 인플루언서 프로필, post: 엑셀 포스트)';
+COMMENT ON COLUMN instagram_crawl_session_items.item_key IS '항목 식별자 (인플루언서 ID 또는 포스트 이름)';
+COMMENT ON COLUMN instagram_crawl_session_items.payload IS '재개 시 작업을 다시 만들기 위한 입력 데이터';
+COMMENT ON COLUMN instagram_crawl_session_items.status IS '상태 (pending: 대기, in_flight: 실행 중인 세션에 할당, done: 완료, failed: 실패)';
+COMMENT ON COLUMN instagram_crawl_session_items.result_ref IS 'instagram_crawl_results 결과 ID';
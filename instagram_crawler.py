@@ -14,7 +14,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import pandas as pd
 
 # src 디렉토리의 InstagramCrawler 클래스 import
-from src.instagram_crawler import InstagramCrawler
+from src.instagram_crawler import InstagramCrawler, RequestPacer, driver_pool
+from src.crawl_engine import CrawlEngine
 
 def single_crawl_tab():
     """단일 포스트 크롤링 탭"""
@@ -46,7 +47,7 @@ def single_crawl_tab():
                 return
             
             with st.spinner("크롤링 중..."):
-                crawler = InstagramCrawler()
+                crawler = InstagramCrawler(pool=driver_pool)
                 result = crawler.crawl_instagram_post(url, debug_mode)
                 crawler.close_driver()
             
@@ -146,14 +147,16 @@ def batch_crawl_tab():
                 # 크롤링 실행 (안전한 WebSocket 업데이트 사용)
                 with results_container:
                     with st.spinner("일괄 크롤링을 시작합니다..."):
-                        crawler = InstagramCrawler()
+                        crawler = InstagramCrawler(pool=driver_pool)
                         # 새로운 안전한 progress callback 사용
                         results = crawler.batch_crawl_instagram_posts(
                             valid_df, 
                             progress_callback=None,  # 기존 콜백 대신 안전한 방식 사용
                             progress_bar=progress_bar,
                             progress_text=progress_text,
-                            status_text=status_text
+                            status_text=status_text,
+                            # 포스트 시작 간격 30-60초는 유지하고 동시 실행은 엔진이 담당
+                            engine=CrawlEngine(job_pacer=RequestPacer(30, 60))
                         )
                         crawler.close_driver()
                 
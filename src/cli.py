@@ -0,0 +1,494 @@
+"""
+Streamlit 없이 일괄 크롤링을 실행하는 명령줄 도구 (cron/워커 머신용)
+
+사용 예 (SUPABASE_SERVICE_KEY와 CRAWLER_OWNER_USER_ID 또는 --owner 필요):
+    python -m src.cli crawl-profiles --from-db --platform instagram --limit 200
+    python -m src.cli crawl-profiles --from-db --prioritize --time-budget 60 --json
+    python -m src.cli crawl-profiles --resume <SESSION_ID>
+    python -m src.cli crawl-posts --file posts.xlsx --session-name "nightly posts"
+
+종료 코드:
+    0 전체 성공 (또는 대상 없음) / 1 일부 실패·보류 / 2 잘못된 인자·입력 파일
+    3 전체 실패·예기치 않은 오류 / 4 DB 설정 오류 / 130 중단(SIGINT/SIGTERM)
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+import contextlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, TextIO
+
+import pandas as pd
+import streamlit.config
+
+# DB 모듈이 streamlit을 임포트할 때 나오는 "streamlit run으로 실행하세요" 경고 숨김
+streamlit.config.set_option("global.showWarningOnDirectExecution", False)
+
+from .instagram_crawler import InstagramCrawler, RequestPacer, driver_pool, driver_supervisor
+from .crawl_engine import CrawlEngine
+from .crawl_pipeline import CrawlPipeline, parse_profile_result, persist_profile_batch
+from .crawl_session import CrawlSessionLedger, profile_ledger_item, post_ledger_items
+from .refresh_scheduler import RefreshScheduler
+from .crawl_timing import StageStats
+from .db.database import db_manager
+from .db.models import InstagramCrawlResult
+from .supabase.config import supabase_config
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_USAGE = 2
+EXIT_ALL_FAILED = 3
+EXIT_CONFIG = 4
+EXIT_INTERRUPTED = 130
+
+class ProgressReporter:
+    """항목별 진행 상황과 최종 요약을 사람이 읽는 줄 또는 JSON lines로 출력"""
+    def __init__(self, stream: TextIO = None, json_lines: bool = False, quiet: bool = False):
+        self.stream = stream or sys.stdout
+        self.json_lines = json_lines
+        self.quiet = quiet  # 사람이 읽는 형식에서 항목별 줄 생략 (요약만 출력)
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.deferred = 0  # 차단기로 보류한 항목 (세션 원장에 대기 상태로 남음)
+        self._started = time.monotonic()
+
+    def emit(self, event: str, **fields):
+        if self.json_lines:
+            record = {'event': event, 'ts': datetime.now().isoformat(timespec='seconds')}
+            record.update(fields)
+            self.stream.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        else:
+            self.stream.write(self._format(event, fields) + "\n")
+        self.stream.flush()
+
+    def _format(self, event: str, fields: Dict[str, Any]) -> str:
+        if event == 'start':
+            session = f" (세션 {fields['session_id']})" if fields.get('session_id') else ""
+            return f"{fields['kind']} {fields['total']}건 크롤링 시작{session}"
+        if event == 'enqueued':
+            return f"{fields['kind']} {fields['total']}건 세션 원장 등록 (세션 {fields['session_id']})"
+        if event == 'item':
+            mark = {'success': "✅", 'deferred': "⏸️"}.get(fields['status'], "❌")
+            detail = fields.get('detail') or fields.get('error') or ''
+            return f"[{fields['index']}/{fields['total']}] {mark} {fields['name']} {detail}".rstrip()
+        if event == 'summary':
+            deferred = f" / 보류 {fields['deferred']}" if fields.get('deferred') else ""
+            lines = [f"완료: 성공 {fields['succeeded']} / 실패 {fields['failed']}{deferred} / 전체 {fields['total']} ({fields['seconds']}초)"]
+            if fields.get('driver_restarts'):
+                restarts = ", ".join(f"{reason} {count}회" for reason, count in fields['driver_restarts'].items())
+                lines.append(f"드라이버 재시작: {restarts}")
+            for row in fields.get('timings') or []:
+                lines.append(f"  {row['stage']:<24} n={row['count']:<5} p50 {row['p50']}초 / p95 {row['p95']}초")
+            return "\n".join(lines)
+        return " ".join([event] + [f"{key}={value}" for key, value in fields.items()])
+
+    def start(self, kind: str, total: int, session_id: Optional[str] = None):
+        self.total = total
+        self.emit('start', kind=kind, total=total, session_id=session_id)
+
+    def item(self, name: str, url: str, status: str, error: str = '', **fields):
+        self.done += 1
+        if status == 'deferred':
+            self.deferred += 1
+        elif status != 'success':
+            self.failed += 1
+        if self.quiet and not self.json_lines:
+            return
+        self.emit('item', index=self.done, total=self.total, name=name, url=url, status=status, error=error or '', **fields)
+
+    def summary(self, stage_stats: StageStats = None, driver_restarts: Dict[str, int] = None, session_id: Optional[str] = None):
+        self.emit('summary', total=self.done, succeeded=self.done - self.failed - self.deferred, failed=self.failed, deferred=self.deferred,
+                  seconds=round(time.monotonic() - self._started, 1), session_id=session_id,
+                  driver_restarts=driver_restarts or {}, timings=stage_stats.summary() if stage_stats else [])
+
+    def error(self, message: str):
+        self.emit('error', message=message)
+
+    def exit_code(self) -> int:
+        """보류 항목이 있으면 부분 성공 (재개하면 이어서 크롤링)"""
+        if not self.done or not (self.failed or self.deferred):
+            return EXIT_OK
+        return EXIT_ALL_FAILED if self.failed == self.done else EXIT_PARTIAL
+
+def _save_crawl_result(crawl_result: InstagramCrawlResult, stage_stats: StageStats) -> Optional[str]:
+    """크롤링 결과 1건 저장, 저장된 행 ID 반환"""
+    with stage_stats.timer('save_crawl_result'):
+        save = db_manager.save_instagram_crawl_result(crawl_result)
+    if not save["success"]:
+        logger.warning(save["message"])
+        return None
+    return save["data"][0].get("id") if save["data"] else None
+
+def _open_ledger(args, kind: str, items: List[Dict[str, Any]], default_name: str) -> Optional[CrawlSessionLedger]:
+    """세션과 원장 생성 (--no-session이거나 생성에 실패하면 None, 원장 없이 등록된 세션은 실패 처리)"""
+    if args.no_session:
+        return None
+    ledger = CrawlSessionLedger.create(args.session_name or default_name, kind, items, lease_mode=args.enqueue_only)
+    if ledger is not None and items and not ledger.items:
+        db_manager.update_instagram_crawl_session(ledger.session_id, 0, 0, "failed")
+        return None
+    return ledger
+
+def _ledger_error(reporter: ProgressReporter) -> int:
+    reporter.error("크롤링 세션/원장을 만들지 못했습니다. SUPABASE_SERVICE_KEY와 --owner를 확인하세요. "
+                   "(--no-session으로 재개 없이 실행할 수 있습니다)")
+    return EXIT_CONFIG
+
+def select_influencers(args) -> List[Dict[str, Any]]:
+    """DB에서 크롤링 대상 인플루언서 선택 (--ids, --prioritize, --limit 적용)"""
+    influencers = db_manager.get_influencers(args.platform, args.first_crawled_only)
+    if args.ids:
+        wanted = {value.strip() for value in args.ids.split(',') if value.strip()}
+        influencers = [inf for inf in influencers if str(inf['id']) in wanted or inf['sns_id'].lstrip('@') in wanted]
+
+    if args.prioritize:
+        scheduler = RefreshScheduler(concurrency=args.concurrency)
+        scheduler.load(
+            influencers,
+            db_manager.get_influencer_campaign_counts(["planned", "active"]),
+            db_manager.get_influencer_crawl_outcomes(),
+            platform=args.platform
+        )
+        budget = args.time_budget * 60 if args.time_budget else None
+        return [target['influencer'] for target in scheduler.next_targets(limit=args.limit, time_budget_seconds=budget)]
+    return influencers[:args.limit] if args.limit else influencers
+
+def run_profile_items(ledger_items: List[Dict[str, Any]], reporter: ProgressReporter, stage_stats: StageStats,
+                      ledger: Optional[CrawlSessionLedger] = None, force_refresh: bool = False,
+                      concurrency: int = None, rate_limiter=None):
+    """원장 항목의 프로필 크롤링 (크롤 → 파싱 → 저장 파이프라인, 항목마다 결과와 원장 상태 저장)
+
+    항목에 session_id가 있으면 그 세션으로 결과를 저장합니다 (여러 세션의 항목을 임대한 워커용).
+    """
+    default_session_id = ledger.session_id if ledger else None
+    jobs = []
+    for item in ledger_items:
+        influencer = item['payload']
+        display_name = influencer.get('influencer_name') or influencer['sns_id']
+        if influencer['platform'] == 'instagram':
+            jobs.append({'kind': 'profile', 'url': item['item_url'], 'debug_mode': False, 'force_refresh': force_refresh,
+                         'influencer': influencer, 'ledger_item': item})
+            continue
+        error = f"{influencer['platform']} 크롤링은 아직 지원되지 않습니다."
+        if ledger:
+            ledger.fail(item, error)
+        reporter.item(display_name, '', 'error', error)
+
+    pipeline = CrawlPipeline(CrawlEngine(concurrency=concurrency, rate_limiter=rate_limiter), parse_profile_result, persist_profile_batch)
+    for item in pipeline.run(jobs):
+        job, result, persisted = item['job'], item['result'], item['persisted']
+        stage_stats.add_result(result)
+        stage_stats.add(persisted.get('timings'))
+        influencer = job['influencer']
+        display_name = influencer.get('influencer_name') or influencer['sns_id']
+
+        result_ref = None
+        if result['status'] == 'success':
+            result_ref = _save_crawl_result(InstagramCrawlResult(
+                session_id=job['ledger_item'].get('session_id') or default_session_id,
+                post_name=f"Profile - {display_name}",
+                post_url=job['url'],
+                likes=0,
+                comments=0,
+                status=result['status']
+            ), stage_stats)
+        if ledger:
+            if result['status'] == 'success':
+                ledger.complete(job['ledger_item'], result_ref)
+            elif result['status'] == 'deferred':
+                ledger.defer(job['ledger_item'], result.get('error', ''))
+            else:
+                ledger.fail(job['ledger_item'], result.get('error', ''))
+
+        reporter.item(
+            display_name, job['url'], result['status'], result.get('error', ''),
+            followers=result.get('followers_count', 0), posts=result.get('post_count', 0),
+            updated=bool(persisted.get('updated')), cached=bool(result.get('cache')), error_class=result.get('error_class', ''),
+            detail=f"팔로워 {result.get('followers_count', 0):,} / 게시물 {result.get('post_count', 0):,}" if result['status'] == 'success' else ''
+        )
+
+def _resume_ledger(session_id: str, reporter: ProgressReporter) -> Optional[CrawlSessionLedger]:
+    """세션 재개 원장 (임대 전용 세션이거나, 미완료 항목이 남았는데 하나도 읽지 못하면 None)"""
+    session = db_manager.get_instagram_crawl_session(session_id)
+    if session and session.get("lease_mode"):
+        reporter.error("항목 임대 워커 전용 세션입니다. python -m src.crawl_worker --lease-items로 크롤링하세요.")
+        return None
+    ledger = CrawlSessionLedger.resume(session_id)
+    if not ledger.items and ledger.leased:
+        reporter.error(f"미완료 항목 {ledger.leased}건을 다른 워커가 임대 중입니다. 임대가 끝난 뒤 다시 재개하세요.")
+        return None
+    if not ledger.items:
+        counts = db_manager.get_crawl_session_item_counts(session_id)
+        unfinished = counts["pending"] + counts["in_flight"]
+        if unfinished:
+            reporter.error(f"세션의 미완료 항목 {unfinished}건을 불러오지 못했습니다. "
+                           "서비스 역할 키(SUPABASE_SERVICE_KEY)와 세션 상태를 확인하세요.")
+            return None
+    return ledger
+
+def crawl_profiles(args, reporter: ProgressReporter) -> int:
+    """프로필 일괄 크롤링"""
+    if args.resume:
+        ledger = _resume_ledger(args.resume, reporter)
+        if ledger is None:
+            return EXIT_CONFIG
+        ledger_items = ledger.items
+    else:
+        influencers = select_influencers(args)
+        ledger_items = [profile_ledger_item(influencer) for influencer in influencers]
+        ledger = _open_ledger(args, 'profile', ledger_items, f"CLI Batch Crawl - {len(ledger_items)} influencers")
+        if ledger:
+            ledger_items = ledger.items
+        elif not args.no_session and ledger_items:
+            return _ledger_error(reporter)
+
+    session_id = ledger.session_id if ledger else None
+    if args.enqueue_only:
+        return _report_enqueued(reporter, 'profile', ledger, ledger_items)
+    reporter.start('profile', len(ledger_items), session_id)
+    if not ledger_items:
+        reporter.summary(session_id=session_id)
+        return EXIT_OK
+
+    supervisor_snapshot = driver_supervisor.stats()
+    stage_stats = StageStats()
+    if ledger:
+        ledger.claim()
+    try:
+        run_profile_items(ledger_items, reporter, stage_stats, ledger, args.force_refresh, args.concurrency)
+    finally:
+        if ledger:
+            ledger.finish()
+
+    reporter.summary(stage_stats, driver_supervisor.restarts_since(supervisor_snapshot), session_id)
+    return reporter.exit_code()
+
+def read_post_file(path: str) -> pd.DataFrame:
+    """엑셀/CSV에서 유효한 포스트 행만 읽기 (A열: name, B열: instagram_link)"""
+    if path.lower().endswith('.csv'):
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_excel(path)
+    df = df.dropna(how='all')
+    if len(df.columns) < 2:
+        raise ValueError("입력 파일에 최소 2개의 컬럼(name, instagram_link)이 필요합니다.")
+    df.columns = ['name', 'instagram_link'] + list(df.columns[2:])
+    valid_df = df.dropna(subset=['instagram_link'])
+    return valid_df[valid_df['instagram_link'].astype(str).str.contains('instagram.com', na=False)]
+
+def run_post_items(ledger_items: List[Dict[str, Any]], reporter: ProgressReporter, stage_stats: StageStats,
+                   ledger: Optional[CrawlSessionLedger] = None, force_refresh: bool = False, concurrency: int = None,
+                   min_interval: float = 30, max_interval: float = 60, rate_limiter=None):
+    """원장 항목의 포스트 크롤링 (항목마다 결과와 원장 상태 저장)"""
+    default_session_id = ledger.session_id if ledger else None
+
+    def save_result(position, result):
+        if result['status'] == 'deferred':
+            # 요청하지 않은 항목이므로 결과를 저장하지 않고 원장에서 대기 상태로 되돌림
+            if ledger:
+                ledger.defer(ledger_items[position], result.get('error', ''))
+            reporter.item(result['name'], result['url'], result['status'], result.get('error', ''), error_class=result.get('error_class', ''))
+            return
+        result_ref = _save_crawl_result(InstagramCrawlResult(
+            session_id=ledger_items[position].get('session_id') or default_session_id,
+            post_name=result['name'],
+            post_url=result['url'],
+            likes=result['likes'],
+            comments=result['comments'],
+            status=result['status'],
+            error_message=result.get('error', '')
+        ), stage_stats)
+        if ledger:
+            if result['status'] == 'success':
+                ledger.complete(ledger_items[position], result_ref)
+            else:
+                ledger.fail(ledger_items[position], result.get('error', ''), result_ref)
+        reporter.item(
+            result['name'], result['url'], result['status'], result.get('error', ''),
+            likes=result['likes'], comments=result['comments'], error_class=result.get('error_class', ''),
+            detail=f"좋아요 {result['likes']:,} / 댓글 {result['comments']:,}" if result['status'] == 'success' else ''
+        )
+
+    batch_df = pd.DataFrame([item['payload'] for item in ledger_items], columns=['name', 'instagram_link'])
+    crawler = InstagramCrawler(pool=driver_pool)
+    try:
+        crawler.batch_crawl_instagram_posts(
+            batch_df,
+            engine=CrawlEngine(concurrency=concurrency, rate_limiter=rate_limiter, job_pacer=RequestPacer(min_interval, max_interval)),
+            on_result=save_result,
+            force_refresh=force_refresh,
+            stage_stats=stage_stats
+        )
+    finally:
+        crawler.close_driver()
+
+def crawl_posts(args, reporter: ProgressReporter) -> int:
+    """엑셀/CSV 포스트 일괄 크롤링"""
+    if args.resume:
+        ledger = _resume_ledger(args.resume, reporter)
+        if ledger is None:
+            return EXIT_CONFIG
+        ledger_items = ledger.items
+    else:
+        try:
+            valid_df = read_post_file(args.file)
+        except (OSError, ValueError) as e:
+            reporter.error(f"입력 파일을 읽을 수 없습니다: {str(e)}")
+            return EXIT_USAGE
+        ledger_items = post_ledger_items(valid_df)
+        ledger = _open_ledger(args, 'post', ledger_items, f"CLI Batch Crawl - {len(ledger_items)} posts")
+        if ledger:
+            ledger_items = ledger.items
+        elif not args.no_session and ledger_items:
+            return _ledger_error(reporter)
+
+    session_id = ledger.session_id if ledger else None
+    if args.enqueue_only:
+        return _report_enqueued(reporter, 'post', ledger, ledger_items)
+    reporter.start('post', len(ledger_items), session_id)
+    if not ledger_items:
+        reporter.summary(session_id=session_id)
+        return EXIT_OK
+
+    supervisor_snapshot = driver_supervisor.stats()
+    stage_stats = StageStats()
+    if ledger:
+        ledger.claim()
+    try:
+        run_post_items(ledger_items, reporter, stage_stats, ledger, args.force_refresh, args.concurrency,
+                       args.min_interval, args.max_interval)
+    finally:
+        if ledger:
+            ledger.finish()
+
+    reporter.summary(stage_stats, driver_supervisor.restarts_since(supervisor_snapshot), session_id)
+    return reporter.exit_code()
+
+def _report_enqueued(reporter: ProgressReporter, kind: str, ledger: Optional[CrawlSessionLedger], ledger_items: List[Dict[str, Any]]) -> int:
+    """--enqueue-only: 세션 원장만 만들고 종료 (항목 임대 워커가 나눠서 크롤링)"""
+    if not ledger:
+        if not ledger_items:
+            reporter.emit('enqueued', kind=kind, session_id=None, total=0)
+            return EXIT_OK
+        return _ledger_error(reporter)
+    reporter.emit('enqueued', kind=kind, session_id=ledger.session_id, total=len(ledger_items))
+    return EXIT_OK
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Streamlit 없이 Instagram 일괄 크롤링 실행")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub):
+        sub.add_argument("--owner", default=os.getenv("CRAWLER_OWNER_USER_ID"), metavar="USER_ID",
+                         help="새 세션/결과를 기록할 사용자 ID (기본: CRAWLER_OWNER_USER_ID, --resume은 세션 소유자 사용)")
+        sub.add_argument("--session-name", help="크롤링 세션 이름")
+        sub.add_argument("--no-session", action="store_true", help="크롤링 세션/작업 원장을 만들지 않음 (재개 불가)")
+        sub.add_argument("--resume", metavar="SESSION_ID", help="중단된 세션의 미완료 항목만 재개")
+        sub.add_argument("--force-refresh", action="store_true", help="최근 크롤링 결과(캐시)를 사용하지 않음")
+        sub.add_argument("--concurrency", type=int, default=None, help="동시 실행 수 (기본: CRAWLER_CONCURRENCY)")
+        sub.add_argument("--enqueue-only", action="store_true", help="세션 원장만 만들고 종료 (python -m src.crawl_worker --lease-items가 크롤링)")
+        sub.add_argument("--json", action="store_true", help="진행 상황을 JSON lines로 출력")
+        sub.add_argument("--quiet", action="store_true", help="항목별 줄은 생략하고 요약만 출력")
+        sub.add_argument("--log-level", default=os.getenv("CRAWLER_LOG_LEVEL", "WARNING"), help="로그 레벨 (stderr, 기본: WARNING)")
+
+    profiles = subparsers.add_parser("crawl-profiles", help="인플루언서 프로필 일괄 크롤링")
+    profiles.add_argument("--from-db", action="store_true", help="connecta_influencers에서 대상 조회")
+    profiles.add_argument("--platform", default="instagram", help="플랫폼 필터 (기본: instagram)")
+    profiles.add_argument("--first-crawled-only", action="store_true", help="아직 첫 크롤링을 하지 않은 인플루언서만")
+    profiles.add_argument("--ids", help="쉼표로 구분한 인플루언서 ID 또는 SNS ID만 크롤링")
+    profiles.add_argument("--limit", type=int, default=None, help="최대 대상 수")
+    profiles.add_argument("--prioritize", action="store_true", help="갱신 우선순위 점수가 높은 순으로 선택")
+    profiles.add_argument("--time-budget", type=float, default=None, help="우선순위 선택 시 시간 예산(분)")
+    add_common(profiles)
+
+    posts = subparsers.add_parser("crawl-posts", help="엑셀/CSV의 포스트 일괄 크롤링")
+    posts.add_argument("--file", help="입력 파일 (.xlsx/.xls/.csv, A열: name, B열: instagram_link)")
+    posts.add_argument("--min-interval", type=float, default=30, help="포스트 시작 간격 최소(초)")
+    posts.add_argument("--max-interval", type=float, default=60, help="포스트 시작 간격 최대(초)")
+    add_common(posts)
+    return parser
+
+def configure_headless(reporter: ProgressReporter) -> Optional[int]:
+    """로그인 사용자가 없는 프로세스용 Supabase 설정 (서비스 역할 키 필수), 문제가 있으면 종료 코드 반환
+
+    익명 키로는 RLS(auth.uid() = user_id) 때문에 세션/원장/결과를 읽거나 쓸 수 없습니다.
+    """
+    if not supabase_config.url:
+        reporter.error("SUPABASE_URL 환경변수가 설정되어야 합니다.")
+        return EXIT_CONFIG
+    if not supabase_config.use_service_role():
+        reporter.error("헤드리스 실행에는 SUPABASE_SERVICE_KEY(서비스 역할 키) 환경변수가 필요합니다.")
+        return EXIT_CONFIG
+    try:
+        db_manager.get_client()
+    except Exception as e:
+        reporter.error(f"Supabase 클라이언트를 만들 수 없습니다: {str(e)}")
+        return EXIT_CONFIG
+    return None
+
+def set_owner(args, reporter: ProgressReporter) -> Optional[int]:
+    """세션/결과 소유자 지정 (--resume은 세션 소유자, 새 실행은 --owner 필수)"""
+    if args.resume:
+        session = db_manager.get_instagram_crawl_session(args.resume)
+        if session is None:
+            reporter.error(f"크롤링 세션을 찾을 수 없습니다: {args.resume}")
+            return EXIT_USAGE
+        db_manager.set_headless_owner(session["user_id"])
+        return None
+    if not args.owner:
+        reporter.error("새 크롤링에는 결과를 기록할 사용자 ID가 필요합니다. (--owner 또는 CRAWLER_OWNER_USER_ID)")
+        return EXIT_CONFIG
+    db_manager.set_headless_owner(args.owner)
+    return None
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt()
+
+def main(argv: List[str] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "crawl-profiles" and not (args.from_db or args.resume):
+        parser.error("crawl-profiles에는 --from-db 또는 --resume이 필요합니다.")
+    if args.command == "crawl-posts" and not (args.file or args.resume):
+        parser.error("crawl-posts에는 --file 또는 --resume이 필요합니다.")
+    if args.enqueue_only and (args.no_session or args.resume):
+        parser.error("--enqueue-only는 --no-session/--resume과 함께 쓸 수 없습니다.")
+
+    logging.basicConfig(level=getattr(logging, str(args.log_level).upper(), logging.WARNING), stream=sys.stderr,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    reporter = ProgressReporter(json_lines=args.json, quiet=args.quiet)
+    code = configure_headless(reporter)
+    if code is not None:
+        return code
+    code = set_owner(args, reporter)
+    if code is not None:
+        return code
+
+    # cron/프로세스 관리자의 SIGTERM도 Ctrl+C와 같이 정리 후 종료 (중단된 항목은 --resume으로 재개)
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    command = crawl_profiles if args.command == "crawl-profiles" else crawl_posts
+    try:
+        # 크롤러/DB 코드의 print가 진행 출력(JSON lines)에 섞이지 않도록 실행 중 stdout은 stderr로 (리포터는 원래 stdout 유지)
+        with contextlib.redirect_stdout(sys.stderr):
+            return command(args, reporter)
+    except KeyboardInterrupt:
+        reporter.error("중단되었습니다. 미완료 항목은 --resume으로 재개할 수 있습니다.")
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        logger.exception("일괄 크롤링 실패")
+        reporter.error(f"일괄 크롤링 중 오류가 발생했습니다: {str(e)}")
+        return EXIT_ALL_FAILED
+    finally:
+        driver_pool.shutdown()
+
+if __name__ == "__main__":
+    sys.exit(main())
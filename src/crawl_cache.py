@@ -0,0 +1,149 @@
+import os
+import re
+import time
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 결과 캐시에 보관하지 않는 큰 필드 (메모리 절약)
+UNCACHED_FIELDS = ('page_source',)
+
+def canonical_url(kind: str, url: str) -> str:
+    """캐시 키용 정규화 URL (스킴/호스트/쿼리/대소문자 차이 제거)"""
+    url = (url or '').strip()
+    if kind == 'post':
+        match = re.search(r'/(?:p|reel|reels|tv)/([^/?#]+)', url)
+        if match:
+            return f"https://www.instagram.com/p/{match.group(1)}/"
+    else:
+        match = re.search(r'instagram\.com/([^/?#]+)', url)
+        if match:
+            return f"https://www.instagram.com/{match.group(1).lstrip('@').lower()}/"
+    return url.split('#')[0].split('?')[0].rstrip('/').lower() + '/'
+
+class CrawlCache:
+    """최근 크롤링 결과 캐시 (정규화 URL 키, 종류별 TTL)
+
+    로컬 LRU 저장소를 먼저 확인하고, 프로필은 connecta_influencer_crawl_raw의 최신 행도 조회합니다.
+    성공한 결과만 저장하며 종류별 적중/미적중 횟수를 집계합니다.
+    """
+    def __init__(self, ttl_by_kind: Dict[str, float] = None, max_entries: int = 2048, use_db: bool = True):
+        self.ttl_by_kind = ttl_by_kind or {'profile': 6 * 3600, 'post': 3600}
+        self.max_entries = max_entries
+        self.use_db = use_db
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def ttl(self, kind: str) -> float:
+        return self.ttl_by_kind.get(kind, 0)
+
+    def _count(self, kind: str, outcome: str):
+        with self._lock:
+            kind_stats = self._stats.setdefault(kind, {'hits': 0, 'db_hits': 0, 'misses': 0, 'bypass': 0})
+            kind_stats[outcome] += 1
+
+    def record_bypass(self, kind: str):
+        """강제 새로고침 등으로 캐시를 건너뛴 요청 집계"""
+        self._count(kind, 'bypass')
+
+    def get(self, kind: str, url: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """max_age(초, 기본: 종류별 TTL) 이내의 결과 반환, 없으면 None"""
+        max_age = self.ttl(kind) if max_age is None else max_age
+        if max_age <= 0:
+            self.record_bypass(kind)
+            return None
+
+        key = (kind, canonical_url(kind, url))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+        if entry and time.time() - entry[0] <= max_age:
+            self._count(kind, 'hits')
+            return self._serve(entry[1], 'memory', time.time() - entry[0])
+
+        if self.use_db and kind == 'profile':
+            stored = self._lookup_db(key[1], max_age)
+            if stored:
+                stored_at, result = stored
+                slim = self._store(key, stored_at, result)
+                self._count(kind, 'db_hits')
+                return self._serve(slim, 'db', time.time() - stored_at)
+
+        self._count(kind, 'misses')
+        return None
+
+    def put(self, kind: str, url: str, result: Dict[str, Any]):
+        """성공한 크롤링 결과 저장"""
+        if result.get('status') != 'success' or result.get('cache'):
+            return
+        self._store((kind, canonical_url(kind, url)), time.time(), result)
+
+    def invalidate(self, kind: str, url: str):
+        with self._lock:
+            self._entries.pop((kind, canonical_url(kind, url)), None)
+
+    def _store(self, key, stored_at: float, result: Dict[str, Any]):
+        slim = {field: value for field, value in result.items() if field not in UNCACHED_FIELDS}
+        with self._lock:
+            self._entries[key] = (stored_at, slim)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return slim
+
+    def _serve(self, result: Dict[str, Any], source: str, age: float) -> Dict[str, Any]:
+        served = copy.deepcopy(result)
+        served['cache'] = {'source': source, 'age_seconds': round(age, 1)}
+        debug_info = served.setdefault('debug_info', {})
+        if isinstance(debug_info, dict):
+            debug_info['cache'] = served['cache']
+        return served
+
+    def _lookup_db(self, canonical: str, max_age: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """connecta_influencer_crawl_raw의 최신 프로필 행에서 결과 복원"""
+        try:
+            from .db.database import db_manager  # 크롤러 단독 사용 시 Supabase 설정을 요구하지 않도록 지연 import
+            sns_id = canonical.rstrip('/').rsplit('/', 1)[-1]
+            row = db_manager.get_latest_crawl_raw('instagram', sns_id, 'profile', max_age)
+            if not row:
+                return None
+            profile_data = dict((row.get('raw_json') or {}).get('profile_data') or {})
+            # 단일 크롤링 페이지는 추출 필드만(status 없이) 저장하므로 필수 필드로 판단
+            if profile_data.get('status', 'success') != 'success' or not profile_data.get('followers_count'):
+                return None
+            profile_data.setdefault('status', 'success')
+            profile_data.setdefault('url', canonical)
+            # crawled_at은 timestamptz이고 UTC로 기록하므로 항상 시간대가 붙어 있음
+            crawled_at = datetime.fromisoformat(str(row['crawled_at']).replace('Z', '+00:00'))
+            return crawled_at.timestamp(), profile_data
+        except Exception as e:
+            logger.debug(f"크롤링 원시 데이터 캐시 조회 실패: {str(e)}")
+            return None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """종류별 적중/미적중 횟수 및 적중률"""
+        with self._lock:
+            summary = {}
+            for kind, kind_stats in self._stats.items():
+                lookups = kind_stats['hits'] + kind_stats['db_hits'] + kind_stats['misses']
+                hits = kind_stats['hits'] + kind_stats['db_hits']
+                summary[kind] = dict(kind_stats, hit_rate=round(hits / lookups, 3) if lookups else 0.0)
+            summary['entries'] = len(self._entries)
+            return summary
+
+# 전역 크롤링 결과 캐시 (TTL 0이면 해당 종류는 캐시하지 않음)
+crawl_cache = CrawlCache(
+    ttl_by_kind={
+        'profile': float(os.getenv("CRAWLER_CACHE_PROFILE_TTL", str(6 * 3600))),
+        'post': float(os.getenv("CRAWLER_CACHE_POST_TTL", "3600"))
+    },
+    max_entries=int(os.getenv("CRAWLER_CACHE_MAX_ENTRIES", "2048")),
+    use_db=os.getenv("CRAWLER_CACHE_DB", "1") == "1"
+)
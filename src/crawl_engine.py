@@ -0,0 +1,129 @@
+import os
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List
+
+from .instagram_crawler import InstagramCrawler, driver_pool, global_rate_limiter
+from .crawl_errors import crawl_breaker
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+class CrawlEngine:
+    """asyncio 기반 동시 크롤링 엔진
+
+    최대 concurrency개의 크롤을 동시에 실행하며, 각 작업 스레드는 드라이버 풀에서
+    드라이버를 임대한 자체 InstagramCrawler를 사용합니다. 모든 요청은 전역 토큰 버킷
+    (분당 요청 예산)을 거치므로 동시 실행 수와 무관하게 요청 속도는 설정값을 넘지 않습니다.
+    로그인/차단 화면이 반복되면 차단기(crawl_breaker)가 열려 작업 스레드가 함께 멈추고, 멈춘 동안 남은 작업은
+    status 'deferred'로 돌려줍니다. 결과는 완료되는 순서대로 비동기 이터레이터로 전달됩니다.
+    """
+    def __init__(self, concurrency: int = None, rate_limiter=None, pool=None,
+                 crawler_factory: Callable[[], InstagramCrawler] = None, job_pacer=None,
+                 thread_initializer: Callable[[], None] = None, breaker=None):
+        self.concurrency = max(1, concurrency or int(os.getenv("CRAWLER_CONCURRENCY", "2")))
+        self.rate_limiter = rate_limiter or global_rate_limiter
+        self.job_pacer = job_pacer  # 작업 시작 간격 (예: 포스트 일괄 크롤링 쿨다운), 없으면 요청 예산만 적용
+        self.pool = pool or driver_pool
+        self.crawler_factory = crawler_factory or self._default_crawler
+        self.thread_initializer = thread_initializer  # 작업 스레드 초기화 (예: Streamlit 스크립트 컨텍스트 연결)
+        self.breaker = breaker or crawl_breaker
+        self._local = threading.local()
+        self._crawlers: List[InstagramCrawler] = []
+        self._crawlers_lock = threading.Lock()
+
+    def _default_crawler(self) -> InstagramCrawler:
+        return InstagramCrawler(pool=self.pool, pacer=self.rate_limiter)
+
+    def _thread_crawler(self) -> InstagramCrawler:
+        """작업 스레드별 크롤러 (작업 사이에 임대한 드라이버를 유지)"""
+        crawler = getattr(self._local, 'crawler', None)
+        if crawler is None:
+            crawler = self.crawler_factory()
+            self._local.crawler = crawler
+            with self._crawlers_lock:
+                self._crawlers.append(crawler)
+        return crawler
+
+    def _run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 스레드에서 크롤 1건 실행 (예외는 오류 결과로 변환)"""
+        url = job.get('url')
+        kind = job.get('kind', 'profile')
+        debug_mode = job.get('debug_mode', False)
+        try:
+            crawler = self._thread_crawler()
+            # 캐시 적중 시 작업 간격/요청 예산을 소비하지 않음
+            cached = crawler.cached_result(kind, url, job.get('max_age'), job.get('force_refresh', False) or debug_mode)
+            if cached is not None:
+                return cached
+            # 차단기가 열려 있으면 탐침 차례까지 대기, 보류 한도를 넘기면 요청하지 않고 보류
+            if not self.breaker.acquire():
+                return self.breaker.deferred_result(url)
+            if self.job_pacer is not None:
+                self.job_pacer.wait()
+            result = crawler.crawl_fresh(kind, url, debug_mode)
+        except Exception as e:
+            logger.error(f"크롤링 작업 실패 ({url}): {str(e)}")
+            result = {'url': url, 'status': 'error', 'error': str(e)}
+        self.breaker.record(result)
+        return result
+
+    def _close_crawlers(self):
+        with self._crawlers_lock:
+            crawlers, self._crawlers = self._crawlers, []
+        for crawler in crawlers:
+            crawler.close_driver()
+
+    async def crawl(self, jobs: Iterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """작업 목록을 동시 실행하고 {'job': 작업, 'result': 결과, 'seconds': 소요 시간}을 완료 순서대로 전달
+
+        작업은 {'kind': 'profile'|'post', 'url': ...} 형태이며 (선택: debug_mode, max_age, force_refresh)
+        그 외 키는 결과와 함께 그대로 돌려줍니다.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="crawl-engine",
+                                      initializer=self.thread_initializer)
+        pending: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue()
+        for job in jobs:
+            pending.put_nowait(job)
+        total = pending.qsize()
+
+        async def worker():
+            while True:
+                try:
+                    job = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                metrics.queue_depth.set(pending.qsize(), queue='crawl_pending')
+                started = loop.time()
+                result = await loop.run_in_executor(executor, self._run_job, job)
+                await results.put({'job': job, 'result': result, 'seconds': loop.time() - started})
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, total))]
+        try:
+            for _ in range(total):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # 진행 중인 크롤이 끝난 뒤 드라이버를 풀에 반납
+            await loop.run_in_executor(None, executor.shutdown, True)
+            self._close_crawlers()
+
+    def stream(self, jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """동기 코드(Streamlit 스크립트 등)에서 결과를 완료 순서대로 순회하기 위한 래퍼"""
+        loop = asyncio.new_event_loop()
+        results = self.crawl(jobs)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
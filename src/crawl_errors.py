@@ -0,0 +1,208 @@
+import os
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# 오류 분류 (결과의 error_class, 메트릭 라벨로도 사용)
+TIMEOUT = 'timeout'
+LOGIN_WALL = 'login_wall'
+NOT_FOUND = 'not_found'
+BLOCKED = 'blocked'
+PARSE_MISS = 'parse_miss'
+
+ERROR_CLASS_LABELS = {
+    TIMEOUT: '페이지 로딩 시간 초과',
+    LOGIN_WALL: '로그인 화면',
+    NOT_FOUND: '존재하지 않는 페이지',
+    BLOCKED: '차단/제한 화면',
+    PARSE_MISS: '데이터 추출 실패',
+}
+
+# 페이지 자체가 실패 원인인 분류 (크롤링이 성공으로 끝나도 오류로 바꿈)
+PAGE_ERROR_CLASSES = (LOGIN_WALL, BLOCKED, NOT_FOUND)
+
+# 디버그 모드의 타임아웃 점검(로그인 리다이렉트, 차단/제한 페이지)을 URL/제목/본문 표식으로 구체화
+PAGE_MARKERS = {
+    LOGIN_WALL: {
+        'url': ('/accounts/login', '/login/'),
+        'title': ('login • instagram', '로그인 • instagram'),
+        'source': ('id="loginform"', 'name="password"'),
+    },
+    BLOCKED: {
+        'url': ('/challenge', '/accounts/suspended'),
+        'title': ('http error 429', 'too many requests'),
+        'source': ('please wait a few minutes before you try again', '잠시 후 다시 시도하세요',
+                   'we restrict certain activity', 'your account has been temporarily restricted'),
+    },
+    NOT_FOUND: {
+        'url': (),
+        'title': ('page not found', '페이지를 찾을 수 없습니다'),
+        'source': ("sorry, this page isn't available", "sorry, this page isn&#x27;t available",
+                   '죄송합니다. 페이지를 사용할 수 없습니다'),
+    },
+}
+
+def classify_page(current_url: str = '', title: str = '', page_source: str = '') -> Optional[str]:
+    """현재 페이지가 로그인 화면/차단 화면/없는 페이지인지 판별 (해당 없으면 None)"""
+    current_url = (current_url or '').lower()
+    title = (title or '').lower()
+    page_source = (page_source or '').lower()
+    for error_class, markers in PAGE_MARKERS.items():
+        if (any(marker in current_url for marker in markers['url'])
+                or any(marker in title for marker in markers['title'])
+                or any(marker in page_source for marker in markers['source'])):
+            return error_class
+    return None
+
+def looks_empty(kind: str, result: Dict[str, Any]) -> bool:
+    """성공 결과에 핵심 값이 하나도 없는지 (프로필: 이름/팔로워, 포스트: 좋아요/댓글)"""
+    if kind == 'profile':
+        return not result.get('influencer_name') and not result.get('followers_count')
+    return not result.get('likes') and not result.get('comments')
+
+def classify_result(kind: str, result: Dict[str, Any], current_url: str = '', title: str = '', page_source: str = '') -> Optional[str]:
+    """크롤링 결과의 오류 분류 (페이지 표식 → 상태 → 빈 값 순서, 분류할 수 없으면 None)"""
+    page_class = classify_page(current_url, title, page_source)
+    if page_class:
+        return page_class
+    status = result.get('status')
+    if status == 'timeout':
+        return TIMEOUT
+    if status == 'success' and looks_empty(kind, result):
+        return PARSE_MISS
+    return None
+
+def parse_thresholds(value: str) -> Dict[str, int]:
+    """'login_wall:3,blocked:2' 형식의 분류별 연속 실패 한도"""
+    thresholds = {}
+    for entry in (value or '').split(','):
+        name, _, count = entry.strip().partition(':')
+        if name and count.strip().isdigit() and int(count) > 0:
+            thresholds[name.strip()] = int(count)
+    return thresholds
+
+class CircuitBreaker:
+    """오류 분류별 연속 실패가 한도를 넘으면 크롤링을 멈추는 차단기 (프로세스 전역, 작업 스레드 공유)
+
+    열리면 acquire()가 다음 탐침 시각까지 요청을 붙잡아 두고, 탐침 시각이 되면 한 작업만 통과시켜
+    결과로 닫을지(정상 페이지) 다시 열지(같은 화면) 정합니다. 탐침 간격은 base_delay부터 두 배씩 max_delay까지
+    늘어나며, 한 번 열린 뒤 max_pause초가 지나면 남은 작업은 기다리지 않고 바로 보류(deferred)됩니다.
+    """
+    def __init__(self, thresholds: Dict[str, int] = None, base_delay: float = 60.0, max_delay: float = 1800.0, max_pause: float = 600.0):
+        self.thresholds = dict(thresholds or {})
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_pause = max_pause
+        self.open_class: Optional[str] = None  # 열리게 한 오류 분류 (닫혀 있으면 None)
+        self.trips = 0  # 이번에 열린 뒤 연속으로 실패한 탐침 포함 열림 횟수
+        self.total_trips: Dict[str, int] = {}
+        self._streaks: Dict[str, int] = {}
+        self._opened_at = 0.0
+        self._probe_at = 0.0
+        self._probing = False
+        self._probe_thread = None  # 탐침 요청을 맡은 스레드 (그 스레드의 결과만 탐침 결과로 판단)
+        self._cond = threading.Condition()
+
+    @property
+    def is_open(self) -> bool:
+        return self.open_class is not None
+
+    def seconds_until_probe(self) -> float:
+        """다음 탐침까지 남은 시간 (닫혀 있으면 0)"""
+        with self._cond:
+            if self.open_class is None:
+                return 0.0
+            return max(0.0, self._probe_at - time.monotonic())
+
+    def acquire(self) -> bool:
+        """요청 진행 여부 (닫혀 있으면 바로 True, 열려 있으면 탐침 차례가 올 때까지 대기, 보류할 항목이면 False)"""
+        with self._cond:
+            while True:
+                if self.open_class is None:
+                    return True
+                now = time.monotonic()
+                if not self._probing and now >= self._probe_at:
+                    self._probing = True
+                    self._probe_thread = threading.get_ident()
+                    logger.info(f"차단기 탐침 요청 ({self.open_class})")
+                    return True
+                pause_deadline = self._opened_at + self.max_pause
+                if now >= pause_deadline:
+                    return False
+                # 탐침 결과나 탐침 시각, 보류 한도 중 먼저 오는 것까지 대기
+                wake_at = pause_deadline if self._probing else min(self._probe_at, pause_deadline)
+                self._cond.wait(max(0.05, wake_at - now))
+
+    def record(self, result: Dict[str, Any]):
+        """크롤링 결과 반영 (보류/캐시 결과는 무시)"""
+        if result.get('status') == 'deferred' or result.get('cache'):
+            return
+        error_class = result.get('error_class')
+        with self._cond:
+            probing = self._probing and self._probe_thread == threading.get_ident()
+            if probing:
+                self._probing = False
+            if error_class in self.thresholds:
+                self._streaks[error_class] = self._streaks.get(error_class, 0) + 1
+                if probing or (self.open_class is None and self._streaks[error_class] >= self.thresholds[error_class]):
+                    self._trip(error_class)
+            elif result.get('status') == 'success' or error_class in (NOT_FOUND, PARSE_MISS):
+                # 정상적으로 렌더링된 페이지 → 연속 실패 초기화, 탐침이었으면 닫음
+                self._streaks.clear()
+                if self.open_class is not None:
+                    logger.warning(f"차단기 닫힘 ({self.open_class}) - 크롤링을 재개합니다.")
+                    self.open_class = None
+                    self.trips = 0
+            elif probing and self.open_class is not None:
+                self._trip(self.open_class)  # 분류되지 않은 오류로 끝난 탐침은 실패로 간주
+            self._cond.notify_all()
+
+    def _trip(self, error_class: str):
+        now = time.monotonic()
+        if self.open_class is None:
+            self._opened_at = now
+            self.trips = 0
+        self.open_class = error_class
+        self.trips += 1
+        self.total_trips[error_class] = self.total_trips.get(error_class, 0) + 1
+        self._streaks[error_class] = 0
+        delay = min(self.base_delay * (2 ** (self.trips - 1)), self.max_delay)
+        self._probe_at = now + delay
+        logger.warning(f"차단기 열림 ({error_class}) - {delay:.0f}초 후 탐침합니다.")
+
+    def deferred_result(self, url: str) -> Dict[str, Any]:
+        """차단기가 열려 보류한 항목의 결과 (원장에서 실패가 아닌 대기 상태로 남김)"""
+        error_class = self.open_class
+        probe_at = datetime.now() + timedelta(seconds=self.seconds_until_probe())
+        label = ERROR_CLASS_LABELS.get(error_class, error_class or '오류')
+        return {
+            'url': url,
+            'status': 'deferred',
+            'error': f"{label} 반복 감지로 보류 (다음 확인 {probe_at.strftime('%H:%M:%S')})",
+            'error_class': error_class
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {'open_class': self.open_class, 'trips': dict(self.total_trips), 'streaks': dict(self._streaks)}
+
+# 전역 차단기 (한도가 비어 있으면 열리지 않음)
+crawl_breaker = CircuitBreaker(
+    thresholds=parse_thresholds(os.getenv("CRAWLER_BREAKER_THRESHOLDS", "login_wall:3,blocked:2,timeout:5")),
+    base_delay=float(os.getenv("CRAWLER_BREAKER_BASE_DELAY", "60")),
+    max_delay=float(os.getenv("CRAWLER_BREAKER_MAX_DELAY", "1800")),
+    max_pause=float(os.getenv("CRAWLER_BREAKER_MAX_PAUSE", "600"))
+)
+
+metrics.register_collector("crawler_circuit_open", "차단기 열림 여부 (error_class별)",
+                           lambda: {metrics.labels(error_class=error_class): 1 if crawl_breaker.open_class == error_class else 0
+                                    for error_class in crawl_breaker.thresholds})
+metrics.register_collector("crawler_circuit_trips", "차단기 열림 횟수 (error_class별)",
+                           lambda: {metrics.labels(error_class=error_class): count for error_class, count in crawl_breaker.stats()['trips'].items()},
+                           counter=True)
@@ -0,0 +1,173 @@
+import os
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from .db.database import db_manager
+from .page_store import release_page_source
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+class CrawlPipeline:
+    """크롤(브라우저) → 파싱(워커 풀) → 저장(일괄 쓰기) 단계 파이프라인
+
+    단계 사이는 크기가 제한된 큐로 연결되어 있어 브라우저는 파싱이나 DB 응답을 기다리지 않고,
+    전체 처리량은 세 단계의 합이 아니라 가장 느린 단계에 의해 결정됩니다.
+    """
+    def __init__(self, engine, parse_fn: Callable[[Dict[str, Any], Dict[str, Any]], Any],
+                 persist_fn: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+                 parse_workers: int = None, queue_size: int = None,
+                 batch_size: int = None, flush_interval: float = None):
+        self.engine = engine
+        self.parse_fn = parse_fn  # (job, result) -> 저장용 레코드 (CPU 작업)
+        self.persist_fn = persist_fn  # [item, ...] -> item별 저장 결과 목록 (일괄 쓰기)
+        self.parse_workers = max(1, parse_workers or int(os.getenv("CRAWLER_PARSE_WORKERS", "2")))
+        self.queue_size = max(1, queue_size or int(os.getenv("CRAWLER_PIPELINE_QUEUE", "8")))
+        self.batch_size = max(1, batch_size or int(os.getenv("CRAWLER_PERSIST_BATCH", "10")))
+        self.flush_interval = flush_interval if flush_interval is not None else float(os.getenv("CRAWLER_PERSIST_FLUSH", "2"))
+        self._stop = threading.Event()
+
+    def _crawl_stage(self, jobs, parse_queue: queue.Queue):
+        try:
+            for item in self.engine.stream(jobs):
+                parse_queue.put(item)  # 파싱 단계가 밀리면 여기서 대기 (역압)
+                metrics.queue_depth.set(parse_queue.qsize(), queue='parse')
+                if self._stop.is_set():
+                    break
+        except Exception as e:
+            logger.error(f"크롤 단계 오류: {str(e)}")
+        finally:
+            for _ in range(self.parse_workers):
+                parse_queue.put(_DONE)
+
+    def _parse_stage(self, parse_queue: queue.Queue, persist_queue: queue.Queue):
+        while True:
+            item = parse_queue.get()
+            if item is _DONE:
+                persist_queue.put(_DONE)
+                return
+            item['record'] = None
+            # 캐시에서 가져온 결과는 이미 저장된 데이터이므로 다시 파싱/저장하지 않음
+            if item['result'].get('status') == 'success' and not item['result'].get('cache'):
+                try:
+                    item['record'] = self.parse_fn(item['job'], item['result'])
+                except Exception as e:
+                    logger.error(f"파싱 단계 오류 ({item['job'].get('url')}): {str(e)}")
+                    item['parse_error'] = str(e)
+            persist_queue.put(item)
+            metrics.queue_depth.set(persist_queue.qsize(), queue='persist')
+
+    def _persist_stage(self, persist_queue: queue.Queue, outcomes: queue.Queue):
+        remaining_parsers = self.parse_workers
+        batch: List[Dict[str, Any]] = []
+        batch_started = None
+        while remaining_parsers:
+            timeout = None
+            if batch:
+                timeout = max(0.0, batch_started + self.flush_interval - time.monotonic())
+            try:
+                item = persist_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _DONE:
+                remaining_parsers -= 1
+            elif item is not None:
+                if not batch:
+                    batch_started = time.monotonic()
+                batch.append(item)
+            if batch and (len(batch) >= self.batch_size or item is None or not remaining_parsers):
+                self._flush(batch, outcomes)
+                batch = []
+        outcomes.put(_DONE)
+
+    def _flush(self, batch: List[Dict[str, Any]], outcomes: queue.Queue):
+        try:
+            persisted = self.persist_fn(batch)
+        except Exception as e:
+            logger.error(f"저장 단계 오류: {str(e)}")
+            persisted = [{"success": False, "message": str(e)} for _ in batch]
+        for item, outcome in zip(batch, persisted):
+            item['persisted'] = outcome
+            for stage, seconds in (outcome.get('timings') or {}).items():
+                metrics.record_stage('profile', stage, seconds)
+            # 저장이 끝난 결과의 page_source 블롭은 바로 해제 (배치 크기와 무관하게 메모리/디스크 일정)
+            release_page_source(item['result'])
+            outcomes.put(item)
+
+    def run(self, jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """파이프라인 실행, 저장까지 끝난 항목({'job', 'result', 'record', 'persisted'})을 완료 순서대로 전달"""
+        parse_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        persist_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        outcomes: queue.Queue = queue.Queue()
+        self._stop.clear()
+
+        threads = [threading.Thread(target=self._crawl_stage, args=(list(jobs), parse_queue), name="pipeline-crawl", daemon=True)]
+        threads += [threading.Thread(target=self._parse_stage, args=(parse_queue, persist_queue), name=f"pipeline-parse-{i}", daemon=True)
+                    for i in range(self.parse_workers)]
+        threads.append(threading.Thread(target=self._persist_stage, args=(persist_queue, outcomes), name="pipeline-persist", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = outcomes.get()
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            # 소비자가 중단되면 (예: Streamlit 재실행) 새 크롤은 시작하지 않고 진행 중인 항목만 마무리
+            self._stop.set()
+
+def parse_profile_result(job: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    """프로필 크롤 결과를 원시 데이터 레코드로 변환 (BeautifulSoup 파싱)"""
+    influencer = job['influencer']
+    return db_manager.build_crawl_raw_record(
+        influencer['id'],
+        influencer['platform'],
+        influencer['sns_id'],
+        result.get('page_source', ''),
+        result,
+        result.get('debug_info', {})
+    )
+
+def persist_profile_batch(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """프로필 결과 일괄 저장: 인플루언서 업데이트 후 원시 데이터를 한 번에 저장"""
+    outcomes = []
+    for item in items:
+        if item['result'].get('status') != 'success':
+            outcomes.append({"success": False, "updated": False, "message": item['result'].get('error', '')})
+            continue
+        if item['result'].get('cache'):
+            outcomes.append({"success": True, "updated": False, "message": "캐시된 결과 (저장 생략)"})
+            continue
+        started = time.perf_counter()
+        update_result = db_manager.update_influencer_data(item['job']['influencer']['id'], item['result'])
+        outcomes.append({"success": update_result["success"], "updated": update_result["success"], "message": update_result["message"],
+                         "timings": {"update_influencer_data": round(time.perf_counter() - started, 4)}})
+
+    records = [item['record'] for item in items if item.get('record') is not None]
+    started = time.perf_counter()
+    raw_result = db_manager.save_crawl_raw_records(records)
+    # 일괄 저장 시간은 레코드 수로 나눠 항목별로 기록
+    raw_seconds = round((time.perf_counter() - started) / max(1, len(records)), 4)
+    if not raw_result["success"] and len(records) > 1:
+        # 일괄 저장 실패 시 레코드별로 재시도하여 나머지 결과는 보존
+        logger.warning(raw_result["message"])
+        for item, outcome in zip(items, outcomes):
+            if item.get('record') is not None:
+                started = time.perf_counter()
+                single = db_manager.save_crawl_raw_records([item['record']])
+                outcome['raw_saved'] = single["success"]
+                outcome.setdefault('timings', {})['save_crawl_raw_data'] = round(raw_seconds + time.perf_counter() - started, 4)
+    else:
+        for item, outcome in zip(items, outcomes):
+            if item.get('record') is not None:
+                outcome['raw_saved'] = raw_result["success"]
+                outcome.setdefault('timings', {})['save_crawl_raw_data'] = raw_seconds
+    return outcomes
@@ -0,0 +1,131 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .db.database import db_manager
+
+logger = logging.getLogger(__name__)
+
+# 재개 대상 상태 (in_flight는 중단된 실행에 할당되었던 항목)
+UNFINISHED_STATUSES = ["pending", "in_flight"]
+
+def lease_is_live(item: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+    """항목 임대 워커가 아직 임대 중인 항목인지 (임대 컬럼이 없거나 만료되었으면 False)"""
+    expires_at = item.get("lease_expires_at")
+    if item.get("status") != "in_flight" or not expires_at:
+        return False
+    try:
+        expires = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return expires > (now or datetime.now(timezone.utc))
+
+def profile_url_for(influencer: Dict[str, Any]) -> Optional[str]:
+    """인플루언서 프로필 URL (Instagram 외 플랫폼은 None)"""
+    if influencer['platform'] != 'instagram':
+        return None
+    # Instagram 프로필 URL 생성
+    sns_id_clean = influencer['sns_id'].replace('@', '')
+    return f"https://www.instagram.com/{sns_id_clean}/"
+
+def profile_ledger_item(influencer: Dict[str, Any]) -> Dict[str, Any]:
+    """프로필 원장 항목 (재개 시 작업을 다시 만들 수 있도록 인플루언서 정보 포함)"""
+    return {
+        'item_key': influencer['id'],
+        'item_url': profile_url_for(influencer),
+        'payload': {
+            'id': influencer['id'],
+            'platform': influencer['platform'],
+            'sns_id': influencer['sns_id'],
+            'influencer_name': influencer.get('influencer_name')
+        }
+    }
+
+def post_ledger_items(valid_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """포스트 원장 항목 (재개 시 엑셀 없이 작업을 다시 만들 수 있도록 행 정보 포함)"""
+    items = []
+    for index, row in valid_df.iterrows():
+        name = row.get('name', f'Post_{index+1}')
+        if pd.isna(name):
+            name = f'Post_{index+1}'
+        items.append({
+            'item_key': str(name),
+            'item_url': str(row['instagram_link']),
+            'payload': {'name': str(name), 'instagram_link': str(row['instagram_link'])}
+        })
+    return items
+
+class CrawlSessionLedger:
+    """instagram_crawl_sessions 세션의 항목별 작업 원장
+
+    항목이 끝날 때마다 결과와 상태를 바로 기록하므로, 재실행/연결 끊김/크래시 후에도
+    완료된 항목은 보존되고 재개 시 미완료 항목만 다시 크롤링합니다.
+    """
+    def __init__(self, session_id: str, items: List[Dict[str, Any]], leased: int = 0):
+        self.session_id = session_id
+        self.items = items  # 이번 실행에서 처리할 원장 항목
+        self.leased = leased  # 다른 워커가 임대 중이라 제외한 항목 수
+
+    @classmethod
+    def create(cls, session_name: str, item_kind: str, items: List[Dict[str, Any]], lease_mode: bool = False) -> Optional["CrawlSessionLedger"]:
+        """세션과 원장 생성 (items: item_key, item_url, payload, lease_mode: 항목 임대 워커 전용), 실패 시 None"""
+        session_result = db_manager.create_instagram_crawl_session(session_name, len(items), lease_mode)
+        if not session_result["success"]:
+            logger.warning(session_result["message"])
+            return None
+        session_id = session_result["data"][0]["id"]
+        rows = [dict(item, item_index=index, item_kind=item_kind) for index, item in enumerate(items)]
+        items_result = db_manager.create_crawl_session_items(session_id, rows)
+        if not items_result["success"]:
+            logger.warning(items_result["message"])
+            return cls(session_id, [])
+        return cls(session_id, sorted(items_result["data"], key=lambda item: item["item_index"]))
+
+    @classmethod
+    def resume(cls, session_id: str) -> "CrawlSessionLedger":
+        """미완료 항목만 불러와 세션 재개 (항목 임대 워커가 임대 중인 항목은 제외해 중복 크롤링 방지)"""
+        items = db_manager.get_crawl_session_items(session_id, UNFINISHED_STATUSES)
+        now = datetime.now(timezone.utc)
+        free_items = [item for item in items if not lease_is_live(item, now)]
+        return cls(session_id, free_items, leased=len(items) - len(free_items))
+
+    def claim(self):
+        """이번 실행에 할당된 항목을 in_flight로 표시 (요청 1회)"""
+        result = db_manager.mark_crawl_session_items([item["id"] for item in self.items if item.get("id")], "in_flight")
+        if not result["success"]:
+            logger.warning(result["message"])
+
+    def complete(self, item: Dict[str, Any], result_ref: str = None):
+        if not item.get("id"):  # 원장 등록에 실패한 항목
+            return
+        result = db_manager.mark_crawl_session_items([item["id"]], "done", result_ref=result_ref)
+        if not result["success"]:
+            logger.warning(result["message"])
+
+    def fail(self, item: Dict[str, Any], error_message: str = "", result_ref: str = None):
+        if not item.get("id"):
+            return
+        result = db_manager.mark_crawl_session_items([item["id"]], "failed", result_ref=result_ref, error_message=error_message or "")
+        if not result["success"]:
+            logger.warning(result["message"])
+
+    def defer(self, item: Dict[str, Any], reason: str = ""):
+        """차단기로 보류한 항목을 pending으로 되돌림 (실패로 세지 않고 재개 시 다시 크롤링)"""
+        if not item.get("id"):
+            return
+        result = db_manager.mark_crawl_session_items([item["id"]], "pending", error_message=reason or "")
+        if not result["success"]:
+            logger.warning(result["message"])
+
+    def finish(self) -> Dict[str, int]:
+        """원장 기준으로 세션 집계 갱신, 미완료 항목이 없으면 completed로 종료"""
+        counts = db_manager.get_crawl_session_item_counts(self.session_id)
+        unfinished = sum(counts[status] for status in UNFINISHED_STATUSES)
+        db_manager.update_instagram_crawl_session(
+            self.session_id, counts["done"], counts["failed"], "running" if unfinished else "completed"
+        )
+        return counts
@@ -0,0 +1,86 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+# 요약 표시 순서 (여기 없는 단계는 뒤에 이름순)
+STAGE_ORDER = [
+    'driver_startup', 'pacing', 'http_fetch', 'navigate', 'network_capture', 'wait',
+    'human_simulation', 'extraction', 'driver_check', 'update_influencer_data', 'save_crawl_raw_data',
+    'save_crawl_result', 'total'
+]
+
+class StageTimer:
+    """크롤링 1건의 단계별 소요 시간(초) 기록 (같은 단계가 여러 번이면 합산)"""
+    def __init__(self):
+        self.spans: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage: str, seconds: float):
+        self.spans[stage] = self.spans.get(stage, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        timings = {stage: round(seconds, 4) for stage, seconds in self.spans.items()}
+        timings['total'] = round(time.perf_counter() - self._started, 4)
+        return timings
+
+def percentile(values: List[float], ratio: float) -> float:
+    """최근접 순위 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * (len(ordered) - 1)))))
+    return ordered[index]
+
+class StageStats:
+    """일괄 크롤링 세션 단위 단계별 소요 시간 집계 (p50/p95)"""
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, timings: Optional[Dict[str, float]]):
+        if not timings:
+            return
+        with self._lock:
+            for stage, seconds in timings.items():
+                self._samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """크롤링 밖의 단계(예: 결과 저장) 소요 시간을 한 건으로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add({stage: round(time.perf_counter() - started, 4)})
+
+    def add_result(self, result: Optional[Dict[str, Any]]):
+        """크롤링 결과의 debug_info['timings'] 추가 (캐시 적중 결과는 제외)"""
+        if not result or result.get('cache'):
+            return
+        debug_info = result.get('debug_info')
+        if isinstance(debug_info, dict):
+            self.add(debug_info.get('timings'))
+
+    def _ordered_stages(self) -> Iterable[str]:
+        known = [stage for stage in STAGE_ORDER if stage in self._samples]
+        return known + sorted(stage for stage in self._samples if stage not in STAGE_ORDER)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """단계별 {'stage', 'count', 'p50', 'p95', 'total'} 목록"""
+        with self._lock:
+            return [{
+                'stage': stage,
+                'count': len(self._samples[stage]),
+                'p50': round(percentile(self._samples[stage], 0.5), 3),
+                'p95': round(percentile(self._samples[stage], 0.95), 3),
+                'total': round(sum(self._samples[stage]), 3)
+            } for stage in self._ordered_stages()]
@@ -0,0 +1,255 @@
+"""
+크롤링 작업 큐 워커 (UI가 등록한 일괄 크롤링 작업을 Streamlit 밖에서 실행)
+
+사용 예:
+    python -m src.crawl_worker                 # 작업을 기다리며 계속 실행
+    python -m src.crawl_worker --once --json   # 대기 작업을 모두 처리하면 종료 (cron용)
+    python -m src.crawl_worker --lease-items --kind profile --concurrency 2   # 여러 호스트에서 세션 항목을 나눠 크롤링
+
+워커 하나가 드라이버 풀 하나를 소유하므로, 여러 운영자가 작업을 넣어도 Chrome은 워커 수만큼만 뜹니다.
+종료 코드는 src.cli와 같습니다 (0 정상 종료, 4 설정 오류, 130 중단).
+"""
+
+import os
+import sys
+import time
+import socket
+import signal
+import logging
+import argparse
+import threading
+import contextlib
+from typing import Any, Callable, Dict, List, Optional
+
+from .cli import (ProgressReporter, build_parser, configure_headless, crawl_profiles, crawl_posts, run_profile_items, run_post_items,
+                  set_owner, EXIT_OK, EXIT_PARTIAL, EXIT_ALL_FAILED, EXIT_CONFIG, EXIT_INTERRUPTED)
+from .instagram_crawler import driver_pool, driver_supervisor
+from .crawl_timing import StageStats
+from .crawl_errors import crawl_breaker
+from .job_queue import JobQueue, job_queue
+from .work_leases import LeasedSessionLedger, DatabaseRateLimiter
+
+logger = logging.getLogger(__name__)
+
+class QueueProgressReporter(ProgressReporter):
+    """작업 진행 상황을 작업 큐의 진행 레코드에도 기록 (항목 갱신은 min_interval초에 한 번으로 묶음)
+
+    재개된 작업은 이전 실행에서 끝난 항목 수를 더해 작업 전체 기준 진행률을 유지합니다.
+    """
+    def __init__(self, queue: JobQueue, job: Dict[str, Any], min_interval: float = 2.0, **kwargs):
+        super().__init__(**kwargs)
+        self.queue = queue
+        self.job = job
+        self.min_interval = min_interval
+        self.summary_fields: Optional[Dict[str, Any]] = None
+        self._done_offset = 0
+        self._failed_offset = job.get('failed') or 0
+        self._last_flush = 0.0
+
+    def emit(self, event: str, **fields):
+        super().emit(event, job_id=self.job['id'], **fields)
+        if event == 'summary':
+            self.summary_fields = fields
+
+    def start(self, kind: str, total: int, session_id: Optional[str] = None):
+        super().start(kind, total, session_id)
+        job_total = self.job.get('total') or total
+        self._done_offset = max(0, job_total - total)
+        self.queue.update_progress(self.job['id'], self._done_offset, self._failed_offset, total=job_total, message="크롤링 시작")
+
+    def item(self, name: str, url: str, status: str, error: str = '', **fields):
+        super().item(name, url, status, error, **fields)
+        now = time.monotonic()
+        if now - self._last_flush >= self.min_interval or self.done >= self.total:
+            self._last_flush = now
+            if status == 'success':
+                message = f"완료: {name}"
+            elif status == 'deferred':
+                message = f"보류: {name} ({error})"
+            else:
+                message = f"실패: {name} ({error})"
+            self.queue.update_progress(self.job['id'], self._done_offset + self.done, self._failed_offset + self.failed, message=message)
+
+class Heartbeat:
+    """긴 크롤링(쿨다운 포함) 중에도 작업 하트비트/항목 임대를 주기적으로 갱신"""
+    def __init__(self, beat: Callable[[], Any], interval: float = 30.0):
+        self.beat = beat
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="worker-heartbeat", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.beat()
+            except Exception as e:
+                logger.warning(f"하트비트 실패: {str(e)}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+def job_argv(job: Dict[str, Any]) -> List[str]:
+    """작업 레코드를 src.cli 인자로 변환 (작업은 항상 크롤링 세션 원장을 재개하는 형태로 실행)"""
+    params = job['params']
+    argv = ['crawl-profiles' if job['kind'] == 'profile' else 'crawl-posts', '--resume', params['session_id']]
+    if params.get('force_refresh'):
+        argv.append('--force-refresh')
+    if params.get('concurrency'):
+        argv += ['--concurrency', str(params['concurrency'])]
+    return argv
+
+def run_job(queue: JobQueue, job: Dict[str, Any], json_lines: bool = False, heartbeat_interval: float = 30.0, stream=None):
+    """작업 1건 실행 후 완료/실패 기록"""
+    args = build_parser().parse_args(job_argv(job))
+    reporter = QueueProgressReporter(queue, job, stream=stream, json_lines=json_lines)
+    command = crawl_profiles if job['kind'] == 'profile' else crawl_posts
+    try:
+        # 결과는 작업을 넣은 운영자가 아닌 세션 소유자 기준으로 기록
+        code = set_owner(args, reporter)
+        if code is None:
+            with Heartbeat(lambda: queue.heartbeat(job['id']), heartbeat_interval):
+                code = command(args, reporter)
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        logger.exception(f"작업 실행 실패 ({job['id']})")
+        queue.finish(job['id'], 'failed', f"작업 실행 중 오류가 발생했습니다: {str(e)}", reporter.summary_fields)
+        return
+
+    if reporter.deferred:
+        # 차단기로 보류한 항목은 세션 원장에 대기 상태로 남아 있으므로 작업을 다시 대기열로
+        queue.requeue(job['id'], f"보류 {reporter.deferred}건 - 차단 해제 후 다시 실행")
+        return
+    if code in (EXIT_OK, EXIT_PARTIAL, EXIT_ALL_FAILED):
+        summary = reporter.summary_fields or {}
+        message = f"성공 {summary.get('succeeded', 0)} / 실패 {summary.get('failed', 0)}"
+        queue.finish(job['id'], 'done', message, reporter.summary_fields)
+    else:
+        queue.finish(job['id'], 'failed', f"종료 코드 {code}", reporter.summary_fields)
+
+def run_leased_items(args, reporter: ProgressReporter) -> int:
+    """항목 임대 모드: 여러 호스트의 워커가 세션 항목을 나눠 임대해 크롤링 (동시 실행 수만큼씩)"""
+    concurrency = args.concurrency or int(os.getenv("CRAWLER_CONCURRENCY", "2"))
+    batch_size = args.batch_size or concurrency * 2
+    rate_limiter = DatabaseRateLimiter(args.rate_limit) if args.rate_limit else None
+    stage_stats = StageStats()
+    supervisor_snapshot = driver_supervisor.stats()
+    reporter.start(args.kind, 0, args.session)
+
+    while True:
+        if args.once and crawl_breaker.is_open:
+            break
+        wait_breaker(args.poll)
+        ledger = LeasedSessionLedger.lease(args.worker_id, batch_size, args.lease_seconds, args.kind, args.session, args.max_attempts)
+        if not ledger.items:
+            if args.once:
+                break
+            time.sleep(args.poll)
+            continue
+
+        reporter.total += len(ledger.items)
+        reporter.emit('lease', items=len(ledger.items), sessions=ledger.session_ids)
+        try:
+            with Heartbeat(ledger.renew, max(5.0, args.lease_seconds / 3)):
+                if args.kind == 'profile':
+                    run_profile_items(ledger.items, reporter, stage_stats, ledger, args.force_refresh, concurrency, rate_limiter)
+                else:
+                    run_post_items(ledger.items, reporter, stage_stats, ledger, args.force_refresh, concurrency,
+                                   args.min_interval, args.max_interval, rate_limiter)
+        finally:
+            # 중단/오류로 끝내지 못한 항목은 바로 반환해 다른 워커가 임대 만료를 기다리지 않게 함
+            released = ledger.release()
+            if released:
+                logger.warning(f"끝내지 못한 항목 {released}건을 반환했습니다.")
+            ledger.finish()
+
+    reporter.summary(stage_stats, driver_supervisor.restarts_since(supervisor_snapshot), args.session)
+    return reporter.exit_code()
+
+def wait_breaker(poll: float):
+    """차단기가 열려 있으면 다음 탐침 시각까지 작업/항목을 가져오지 않고 대기 (보류만 반복하지 않도록)"""
+    delay = crawl_breaker.seconds_until_probe()
+    if delay > 0:
+        logger.warning(f"차단기 열림 ({crawl_breaker.open_class}) - {delay:.0f}초 후 다시 시도합니다.")
+        time.sleep(max(delay, poll))
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt()
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.crawl_worker", description="크롤링 작업 큐 워커")
+    parser.add_argument("--once", action="store_true", help="대기 중인 작업이 없으면 종료")
+    parser.add_argument("--poll", type=float, default=float(os.getenv("CRAWLER_WORKER_POLL_SECONDS", "5")), help="작업 조회 간격(초)")
+    parser.add_argument("--stale-after", type=float, default=float(os.getenv("CRAWLER_JOB_STALE_SECONDS", "600")),
+                        help="하트비트가 이 시간(초) 이상 끊긴 실행 중 작업을 다시 대기열로")
+    parser.add_argument("--worker-id", default=f"{socket.gethostname()}-{os.getpid()}", help="워커 식별자")
+    parser.add_argument("--json", action="store_true", help="진행 상황을 JSON lines로 출력")
+    lease = parser.add_argument_group("항목 임대 모드 (여러 호스트에서 세션 항목을 나눠 크롤링, crawl_work_leases_schema.sql 필요)")
+    lease.add_argument("--lease-items", action="store_true", help="작업 큐 대신 세션 항목을 직접 임대해 크롤링")
+    lease.add_argument("--kind", choices=["profile", "post"], default="profile", help="임대할 항목 종류")
+    lease.add_argument("--session", metavar="SESSION_ID", help="특정 세션의 항목만 임대")
+    lease.add_argument("--concurrency", type=int, default=None, help="워커당 동시 실행 수 (기본: CRAWLER_CONCURRENCY)")
+    lease.add_argument("--batch-size", type=int, default=None, help="한 번에 임대할 항목 수 (기본: 동시 실행 수 x 2)")
+    lease.add_argument("--lease-seconds", type=int, default=int(os.getenv("CRAWLER_LEASE_SECONDS", "300")), help="임대 유효 시간(초, 하트비트로 연장)")
+    lease.add_argument("--max-attempts", type=int, default=3, help="임대 만료가 이 횟수만큼 반복되면 항목 실패 처리")
+    lease.add_argument("--rate-limit", default=os.getenv("CRAWLER_RATE_LIMIT_NAME", "instagram"),
+                       help="공유 요청 예산 이름 (crawl_rate_limits, 빈 값이면 프로세스 전역 예산)")
+    lease.add_argument("--force-refresh", action="store_true", help="최근 크롤링 결과(캐시)를 사용하지 않음")
+    lease.add_argument("--min-interval", type=float, default=30, help="포스트 시작 간격 최소(초)")
+    lease.add_argument("--max-interval", type=float, default=60, help="포스트 시작 간격 최대(초)")
+    parser.add_argument("--log-level", default=os.getenv("CRAWLER_LOG_LEVEL", "WARNING"), help="로그 레벨 (stderr, 기본: WARNING)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, str(args.log_level).upper(), logging.WARNING), stream=sys.stderr,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    reporter = ProgressReporter(json_lines=args.json)
+    if job_queue is None and not args.lease_items:
+        reporter.error("작업 큐를 열 수 없습니다. CRAWLER_JOB_QUEUE 설정을 확인하세요.")
+        return EXIT_CONFIG
+    # 워커는 로그인 사용자가 없으므로 서비스 역할 키로 세션 원장을 읽고 씀 (익명 키로는 RLS에 막혀 빈 작업으로 끝남)
+    code = configure_headless(reporter)
+    if code is not None:
+        return code
+
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    job = None
+    stdout = sys.stdout
+    try:
+        # 크롤러/DB 코드의 print가 진행 출력(JSON lines)에 섞이지 않도록 실행 중 stdout은 stderr로 (리포터는 원래 stdout 유지)
+        with contextlib.redirect_stdout(sys.stderr):
+            if args.lease_items:
+                return run_leased_items(args, reporter)
+            while True:
+                requeued = job_queue.requeue_stale(args.stale_after)
+                if requeued:
+                    logger.warning(f"응답 없는 작업 {requeued}건을 다시 대기열에 넣었습니다.")
+                if args.once and crawl_breaker.is_open:
+                    # cron 실행은 차단이 풀릴 때까지 기다리지 않고 종료 (보류된 작업은 대기열에 남음)
+                    reporter.error(f"차단기 열림 ({crawl_breaker.open_class}) - 남은 작업은 다음 실행에서 처리합니다.")
+                    return EXIT_OK
+                wait_breaker(args.poll)
+                job = job_queue.claim(args.worker_id)
+                if job is None:
+                    if args.once:
+                        return EXIT_OK
+                    time.sleep(args.poll)
+                    continue
+                reporter.emit('job', job_id=job['id'], kind=job['kind'], submitted_by=job.get('submitted_by'))
+                run_job(job_queue, job, json_lines=args.json, stream=stdout)
+                job = None
+    except KeyboardInterrupt:
+        # 세션 원장에 완료 항목이 남아 있으므로 다른 워커가 이어서 실행
+        if job is not None:
+            job_queue.requeue(job['id'], "워커 종료 - 다시 대기")
+        reporter.error("워커가 중단되었습니다.")
+        return EXIT_INTERRUPTED
+    finally:
+        driver_pool.shutdown()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,37 @@
 import streamlit as st
 import hashlib
 import json
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import logging
+from typing import List, Dict, Any, Optional, Set
+from datetime import datetime, timedelta, timezone
 from .models import InstagramCrawlResult, InstagramCrawlSession, UserStats
 from ..supabase.config import supabase_config
+from ..page_store import load_page_source
+from ..metrics import InstrumentedClient
+
+logger = logging.getLogger(__name__)
 
 class DatabaseManager:
     def __init__(self):
         self.client = None
+        self.headless_user_id = None  # CLI/워커에서 세션/결과를 기록할 소유자 (로그인 사용자가 없을 때)
+        self._session_owners: Dict[str, str] = {}
         
     def get_client(self):
         """Supabase 클라이언트 반환"""
         if not self.client:
-            self.client = supabase_config.get_client()
+            # 테이블별 요청 수/지연 계측 (OpenMetrics)
+            self.client = InstrumentedClient(supabase_config.get_client())
         return self.client
     
+    def set_headless_owner(self, user_id: Optional[str]):
+        """헤드리스 실행의 소유자 지정 (서비스 역할 키로 쓰는 행의 user_id)"""
+        self.headless_user_id = user_id
+    
     def get_current_user_id(self) -> Optional[str]:
-        """현재 로그인된 사용자 ID 반환 (비로그인시 None)"""
+        """현재 로그인된 사용자 ID 반환 (비로그인시 None, 헤드리스 실행은 지정한 소유자)"""
+        if self.headless_user_id:
+            return self.headless_user_id
         if 'user' in st.session_state and st.session_state.authenticated:
             return st.session_state.user.id
         return None
@@ -34,7 +48,8 @@ class DatabaseManager:
         """Instagram 크롤링 결과 저장"""
         try:
             client = self.get_client()
-            user_id = self.get_current_user_id()
+            # 여러 세션의 항목을 처리하는 워커는 결과를 세션 소유자 이름으로 기록
+            user_id = self.get_current_user_id() or self.get_crawl_session_owner(result.session_id)
             
             data = {
                 "user_id": user_id,
@@ -114,8 +129,8 @@ class DatabaseManager:
             }
     
     # Instagram 크롤링 세션 관련 메서드
-    def create_instagram_crawl_session(self, session_name: str, total_posts: int) -> Dict[str, Any]:
-        """Instagram 크롤링 세션 생성"""
+    def create_instagram_crawl_session(self, session_name: str, total_posts: int, lease_mode: bool = False) -> Dict[str, Any]:
+        """Instagram 크롤링 세션 생성 (lease_mode: 항목 임대 워커 전용 세션, crawl_work_leases_schema.sql 필요)"""
         try:
             client = self.get_client()
             user_id = self.get_current_user_id()
@@ -127,6 +142,8 @@ class DatabaseManager:
                 "status": "running",
                 "created_at": datetime.now().isoformat()
             }
+            if lease_mode:
+                data["lease_mode"] = True
             
             response = client.table("instagram_crawl_sessions").insert(data).execute()
             return {
@@ -173,6 +190,32 @@ class DatabaseManager:
                 "message": f"Instagram 크롤링 세션 업데이트 중 오류가 발생했습니다: {str(e)}"
             }
     
+    def get_instagram_crawl_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """크롤링 세션 1건 조회 (없거나 볼 권한이 없으면 None)"""
+        try:
+            client = self.get_client()
+            response = client.table("instagram_crawl_sessions")\
+                .select("*")\
+                .eq("id", session_id)\
+                .limit(1)\
+                .execute()
+            if not response.data:
+                return None
+            self._session_owners[session_id] = response.data[0].get("user_id")
+            return response.data[0]
+        except Exception as e:
+            st.error(f"Instagram 크롤링 세션 조회 중 오류가 발생했습니다: {str(e)}")
+            return None
+    
+    def get_crawl_session_owner(self, session_id: Optional[str]) -> Optional[str]:
+        """세션 소유자 user_id (세션별로 한 번만 조회)"""
+        if not session_id:
+            return None
+        if session_id not in self._session_owners:
+            self.get_instagram_crawl_session(session_id)
+            self._session_owners.setdefault(session_id, None)
+        return self._session_owners.get(session_id)
+    
     def get_user_instagram_sessions(self, limit: int = 50) -> List[Dict[str, Any]]:
         """사용자의 Instagram 크롤링 세션 목록 조회"""
         try:
@@ -194,6 +237,235 @@ class DatabaseManager:
             st.error(f"Instagram 크롤링 세션 조회 중 오류가 발생했습니다: {str(e)}")
             return []
     
+    # 크롤링 세션 작업 원장 관련 메서드
+    def create_crawl_session_items(self, session_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """세션 항목 원장 생성 (items: item_index, item_kind, item_key, item_url, payload)"""
+        try:
+            client = self.get_client()
+            
+            rows = [{
+                "session_id": session_id,
+                "item_index": item["item_index"],
+                "item_kind": item["item_kind"],
+                "item_key": str(item["item_key"]),
+                "item_url": item.get("item_url"),
+                "payload": item.get("payload", {}),
+                "status": "pending"
+            } for item in items]
+            
+            data = []
+            for start in range(0, len(rows), 500):
+                response = client.table("instagram_crawl_session_items").insert(rows[start:start + 500]).execute()
+                data.extend(response.data)
+            
+            return {"success": True, "data": data, "message": f"세션 항목 {len(data)}건이 등록되었습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "message": f"세션 항목 등록 중 오류가 발생했습니다: {str(e)}"}
+    
+    def get_crawl_session_items(self, session_id: str, statuses: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """세션 항목 원장 조회 (statuses 지정 시 해당 상태만)"""
+        try:
+            client = self.get_client()
+            
+            all_data = []
+            page_size = 1000
+            offset = 0
+            
+            while True:
+                query = client.table("instagram_crawl_session_items")\
+                    .select("*")\
+                    .eq("session_id", session_id)\
+                    .order("item_index")\
+                    .range(offset, offset + page_size - 1)
+                
+                if statuses:
+                    query = query.in_("status", statuses)
+                
+                response = query.execute()
+                
+                if not response.data:
+                    break
+                
+                all_data.extend(response.data)
+                
+                if len(response.data) < page_size:
+                    break
+                
+                offset += page_size
+            
+            return all_data
+        except Exception as e:
+            st.error(f"세션 항목 조회 중 오류가 발생했습니다: {str(e)}")
+            return []
+    
+    def mark_crawl_session_items(self, item_ids: List[str], status: str, result_ref: str = None, error_message: str = None) -> Dict[str, Any]:
+        """세션 항목 상태 변경 (pending, in_flight, done, failed)"""
+        if not item_ids:
+            return {"success": True, "data": [], "message": "변경할 세션 항목이 없습니다."}
+        try:
+            client = self.get_client()
+            
+            data = {
+                "status": status,
+                "updated_at": datetime.now().isoformat()
+            }
+            if result_ref is not None:
+                data["result_ref"] = result_ref
+            if error_message is not None:
+                data["error_message"] = error_message
+            
+            response = None
+            for start in range(0, len(item_ids), 200):
+                response = client.table("instagram_crawl_session_items")\
+                    .update(data)\
+                    .in_("id", item_ids[start:start + 200])\
+                    .execute()
+            
+            return {"success": True, "data": response.data, "message": "세션 항목 상태가 변경되었습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "message": f"세션 항목 상태 변경 중 오류가 발생했습니다: {str(e)}"}
+    
+    def get_crawl_session_item_counts(self, session_id: str) -> Dict[str, int]:
+        """세션 항목 상태별 개수"""
+        counts = {"pending": 0, "in_flight": 0, "done": 0, "failed": 0}
+        try:
+            client = self.get_client()
+            for status in counts:
+                response = client.table("instagram_crawl_session_items")\
+                    .select("id", count="exact")\
+                    .eq("session_id", session_id)\
+                    .eq("status", status)\
+                    .limit(1)\
+                    .execute()
+                counts[status] = response.count or 0
+        except Exception as e:
+            st.error(f"세션 항목 집계 중 오류가 발생했습니다: {str(e)}")
+        return counts
+    
+    def get_resumable_crawl_sessions(self, item_kind: str, limit: int = 20, exclude_session_ids: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """미완료 항목이 남은 사용자 세션 목록 (최근 순)
+
+        항목 임대 워커 전용 세션(lease_mode)과 exclude_session_ids(백그라운드 작업이 맡은 세션)는 제외하고,
+        미완료 항목 수는 세션마다 집계하지 않고 항목 조회 한 번으로 셉니다.
+        """
+        try:
+            client = self.get_client()
+            user_id = self.get_current_user_id()
+            
+            if not user_id:
+                return []
+            
+            sessions = client.table("instagram_crawl_sessions")\
+                .select("*")\
+                .eq("user_id", user_id)\
+                .eq("status", "running")\
+                .order("created_at", desc=True)\
+                .limit(limit)\
+                .execute().data
+            
+            exclude_session_ids = exclude_session_ids or set()
+            sessions = [session for session in sessions
+                        if not session.get("lease_mode") and session["id"] not in exclude_session_ids]
+            if not sessions:
+                return []
+            
+            unfinished_counts: Dict[str, int] = {}
+            page_size = 1000
+            offset = 0
+            while True:
+                rows = client.table("instagram_crawl_session_items")\
+                    .select("session_id")\
+                    .in_("session_id", [session["id"] for session in sessions])\
+                    .eq("item_kind", item_kind)\
+                    .in_("status", ["pending", "in_flight"])\
+                    .order("id")\
+                    .range(offset, offset + page_size - 1)\
+                    .execute().data
+                for row in rows:
+                    unfinished_counts[row["session_id"]] = unfinished_counts.get(row["session_id"], 0) + 1
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+            
+            resumable = []
+            for session in sessions:
+                if unfinished_counts.get(session["id"]):
+                    session["unfinished_items"] = unfinished_counts[session["id"]]
+                    resumable.append(session)
+            
+            return resumable
+        except Exception as e:
+            st.error(f"재개 가능한 세션 조회 중 오류가 발생했습니다: {str(e)}")
+            return []
+    
+    # 다중 노드 워커용 세션 항목 임대 (crawl_work_leases_schema.sql의 함수 사용)
+    def claim_crawl_session_items(self, worker_id: str, limit: int, lease_seconds: int, item_kind: str = "profile",
+                                  session_id: Optional[str] = None, max_attempts: int = 3) -> Dict[str, Any]:
+        """대기 중이거나 임대가 만료된 항목을 FOR UPDATE SKIP LOCKED로 임대 (다른 워커와 겹치지 않음)"""
+        try:
+            client = self.get_client()
+            response = client.rpc("claim_crawl_session_items", {
+                "p_worker": worker_id,
+                "p_limit": limit,
+                "p_lease_seconds": lease_seconds,
+                "p_item_kind": item_kind,
+                "p_session_id": session_id,
+                "p_max_attempts": max_attempts
+            }).execute()
+            return {"success": True, "data": response.data or [], "message": f"세션 항목 {len(response.data or [])}건을 임대했습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": [], "message": f"세션 항목 임대 중 오류가 발생했습니다: {str(e)}"}
+    
+    def renew_crawl_session_item_leases(self, worker_id: str, item_ids: List[str], lease_seconds: int) -> Dict[str, Any]:
+        """임대 연장 (하트비트), data: 연장된 항목 수 (워커가 아직 소유한 항목만)"""
+        try:
+            client = self.get_client()
+            response = client.rpc("renew_crawl_session_item_leases", {
+                "p_worker": worker_id,
+                "p_item_ids": item_ids,
+                "p_lease_seconds": lease_seconds
+            }).execute()
+            return {"success": True, "data": response.data or 0, "message": "세션 항목 임대를 연장했습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": 0, "message": f"세션 항목 임대 연장 중 오류가 발생했습니다: {str(e)}"}
+    
+    def finish_crawl_session_item(self, worker_id: str, item_id: str, status: str, result_ref: str = None,
+                                  error_message: str = None) -> Dict[str, Any]:
+        """임대한 항목 완료 처리 (done/failed), data: 임대가 유효해 반영되었는지 여부"""
+        try:
+            client = self.get_client()
+            response = client.rpc("finish_crawl_session_item", {
+                "p_worker": worker_id,
+                "p_item_id": item_id,
+                "p_status": status,
+                "p_result_ref": result_ref,
+                "p_error_message": error_message
+            }).execute()
+            return {"success": True, "data": bool(response.data), "message": "세션 항목 상태가 변경되었습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": False, "message": f"세션 항목 완료 처리 중 오류가 발생했습니다: {str(e)}"}
+    
+    def release_crawl_session_item_leases(self, worker_id: str, item_ids: List[str]) -> Dict[str, Any]:
+        """끝내지 못한 임대 항목을 pending으로 반환 (워커 종료 시)"""
+        try:
+            client = self.get_client()
+            response = client.rpc("release_crawl_session_item_leases", {
+                "p_worker": worker_id,
+                "p_item_ids": item_ids
+            }).execute()
+            return {"success": True, "data": response.data or 0, "message": "세션 항목 임대를 반환했습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": 0, "message": f"세션 항목 임대 반환 중 오류가 발생했습니다: {str(e)}"}
+    
+    def take_crawl_rate_token(self, limit_name: str = "instagram") -> Dict[str, Any]:
+        """클러스터 전역 요청 예산에서 토큰 1개 예약, data: 사용 가능해질 때까지 기다릴 시간(초)"""
+        try:
+            client = self.get_client()
+            response = client.rpc("take_crawl_rate_token", {"p_name": limit_name}).execute()
+            return {"success": True, "data": float(response.data or 0), "message": "요청 토큰을 예약했습니다."}
+        except Exception as e:
+            return {"success": False, "error": str(e), "data": 0.0, "message": f"요청 토큰 예약 중 오류가 발생했습니다: {str(e)}"}
+    
     # 사용자 통계 관련 메서드
     def get_user_stats(self) -> Optional[Dict[str, Any]]:
         """사용자 통계 조회"""
@@ -467,6 +739,76 @@ class DatabaseManager:
             st.error(f"인플루언서 조회 중 오류가 발생했습니다: {str(e)}")
             return []
     
+    def get_influencer_campaign_counts(self, campaign_statuses: Optional[List[str]] = None) -> Dict[str, int]:
+        """인플루언서별 캠페인 참여 수 (campaign_statuses 지정 시 해당 상태 캠페인만)"""
+        try:
+            client = self.get_client()
+            
+            counts: Dict[str, int] = {}
+            page_size = 1000
+            offset = 0
+            
+            while True:
+                response = client.table("campaign_influencer_participations")\
+                    .select("influencer_id, campaigns(status)")\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                
+                if not response.data:
+                    break
+                
+                for row in response.data:
+                    campaign = row.get("campaigns") or {}
+                    if campaign_statuses and campaign.get("status") not in campaign_statuses:
+                        continue
+                    counts[row["influencer_id"]] = counts.get(row["influencer_id"], 0) + 1
+                
+                if len(response.data) < page_size:
+                    break
+                
+                offset += page_size
+            
+            return counts
+        except Exception as e:
+            print(f"캠페인 참여 집계 실패: {e}")
+            return {}
+    
+    def get_influencer_crawl_outcomes(self, since_days: int = 30) -> Dict[str, Dict[str, int]]:
+        """인플루언서별 최근 프로필 크롤링 성공/실패 횟수 (세션 작업 원장 기준)"""
+        try:
+            client = self.get_client()
+            since = (datetime.now(timezone.utc) - timedelta(days=since_days)).isoformat()
+            
+            outcomes: Dict[str, Dict[str, int]] = {}
+            page_size = 1000
+            offset = 0
+            
+            while True:
+                response = client.table("instagram_crawl_session_items")\
+                    .select("item_key, status")\
+                    .eq("item_kind", "profile")\
+                    .in_("status", ["done", "failed"])\
+                    .gte("updated_at", since)\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                
+                if not response.data:
+                    break
+                
+                for row in response.data:
+                    outcome = outcomes.setdefault(row["item_key"], {"done": 0, "failed": 0})
+                    outcome[row["status"]] += 1
+                
+                if len(response.data) < page_size:
+                    break
+                
+                offset += page_size
+            
+            return outcomes
+        except Exception as e:
+            print(f"크롤링 성공/실패 집계 실패: {e}")
+            return {}
+    
     def delete_influencer(self, influencer_id: str) -> Dict[str, Any]:
         """인플루언서 삭제 - connecta_influencers 테이블 사용"""
         try:
@@ -760,7 +1102,7 @@ class DatabaseManager:
             raw_name = profile_data.get('influencer_name', '')
             if raw_name and raw_name.strip():
                 update_data["influencer_name"] = raw_name.strip()
-                print(f"DEBUG UPDATE - influencer_name: '{raw_name.strip()}'")
+                logger.debug(f"UPDATE - influencer_name: '{raw_name.strip()}'")
             
             if profile_data.get('followers_count', 0) > 0:
                 update_data["followers_count"] = profile_data['followers_count']
@@ -806,7 +1148,7 @@ class DatabaseManager:
             profile_text = raw_text.strip() if raw_text and raw_text.strip() else ''
             
             # 디버깅: 최종 influencer_name 확인
-            print(f"DEBUG - raw_name: '{raw_name}', influencer_name: '{influencer_name}', sns_id: '{sns_id}'")
+            logger.debug(f"raw_name: '{raw_name}', influencer_name: '{influencer_name}', sns_id: '{sns_id}'")
             
             influencer_data = {
                 "platform": platform,
@@ -837,34 +1179,8 @@ class DatabaseManager:
         try:
             client = self.get_client()
             
-            # 유효한 정보만 추출
-            extracted_info = self._extract_meaningful_content(page_source, profile_data)
-            
-            # 원시 데이터 구성 (HTML/CSS 제거된 유효 정보만)
-            raw_data = {
-                "page_source_length": len(page_source),
-                "extracted_content": extracted_info,
-                "profile_data": profile_data,
-                "debug_info": debug_info or {},
-                "crawled_at": datetime.now().isoformat()
-            }
-            
-            # 콘텐츠 해시 생성 (중복 방지용)
-            content_hash = hashlib.md5(
-                json.dumps(raw_data, sort_keys=True).encode('utf-8')
-            ).hexdigest()
-            
-            # 저장할 데이터
-            crawl_data = {
-                "influencer_id": influencer_id,
-                "platform": platform,
-                "sns_id": sns_id,
-                "data_type": "profile",
-                "raw_json": raw_data,
-                "content_hash": content_hash,
-                "source_name": "instagram_crawler",
-                "crawled_at": datetime.now().isoformat()
-            }
+            # 저장할 데이터 (HTML 파싱 포함)
+            crawl_data = self.build_crawl_raw_record(influencer_id, platform, sns_id, page_source, profile_data, debug_info)
             
             # connecta_influencer_crawl_raw 테이블에 저장
             response = client.table("connecta_influencer_crawl_raw")\
@@ -876,6 +1192,92 @@ class DatabaseManager:
         except Exception as e:
             return {"success": False, "message": f"크롤링 원시 데이터 저장 중 오류가 발생했습니다: {str(e)}"}
     
+    def build_crawl_raw_record(self, influencer_id: str, platform: str, sns_id: str,
+                               page_source: str, profile_data: Dict[str, Any],
+                               debug_info: Dict[str, Any] = None) -> Dict[str, Any]:
+        """connecta_influencer_crawl_raw 저장용 레코드 생성 (DB 호출 없음, 파싱 단계에서 사용)"""
+        # page_source는 원문 또는 PageHandle (필요한 시점에만 압축 해제)
+        page_source = load_page_source(page_source)
+        # 유효한 정보만 추출
+        extracted_info = self._extract_meaningful_content(page_source, profile_data)
+        
+        # 원시 데이터 구성 (HTML/CSS 제거된 유효 정보만, 결과의 page_source 원문/핸들은 제외)
+        raw_data = {
+            "page_source_length": len(page_source),
+            "extracted_content": extracted_info,
+            "profile_data": self._json_fields(profile_data, exclude=("page_source",)),
+            "debug_info": self._json_fields(debug_info),
+            "crawled_at": datetime.now(timezone.utc).isoformat()
+        }
+        
+        # 콘텐츠 해시 생성 (중복 방지용)
+        content_hash = hashlib.md5(
+            json.dumps(raw_data, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        
+        return {
+            "influencer_id": influencer_id,
+            "platform": platform,
+            "sns_id": sns_id,
+            "data_type": "profile",
+            "raw_json": raw_data,
+            "content_hash": content_hash,
+            "source_name": "instagram_crawler",
+            "crawled_at": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def save_crawl_raw_records(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 크롤링 원시 데이터 레코드를 한 번의 요청으로 저장"""
+        if not records:
+            return {"success": True, "data": [], "message": "저장할 원시 데이터가 없습니다."}
+        try:
+            client = self.get_client()
+            response = client.table("connecta_influencer_crawl_raw")\
+                .insert(records)\
+                .execute()
+            
+            return {"success": True, "data": response.data, "message": f"크롤링 원시 데이터 {len(records)}건이 저장되었습니다."}
+            
+        except Exception as e:
+            return {"success": False, "message": f"크롤링 원시 데이터 일괄 저장 중 오류가 발생했습니다: {str(e)}"}
+    
+    def get_latest_crawl_raw(self, platform: str, sns_id: str, data_type: str = "profile", max_age_seconds: float = None) -> Optional[Dict[str, Any]]:
+        """가장 최근 크롤링 원시 데이터 행 조회 (max_age_seconds 이내만, 없으면 None)"""
+        try:
+            client = self.get_client()
+            
+            query = client.table("connecta_influencer_crawl_raw")\
+                .select("influencer_id, raw_json, crawled_at")\
+                .eq("platform", platform)\
+                .eq("sns_id", sns_id)\
+                .eq("data_type", data_type)\
+                .order("crawled_at", desc=True)\
+                .limit(1)
+            
+            if max_age_seconds is not None:
+                since = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+                query = query.gte("crawled_at", since.isoformat())
+            
+            response = query.execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.warning(f"크롤링 원시 데이터 조회 실패: {e}")
+            return None
+    
+    @staticmethod
+    def _json_fields(data: Optional[Dict[str, Any]], exclude: tuple = ()) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 필드만 남김 (PageHandle 등 직렬화할 수 없는 값은 제외)"""
+        fields = {}
+        for key, value in (data or {}).items():
+            if key in exclude:
+                continue
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue
+            fields[key] = value
+        return fields
+    
     def _extract_meaningful_content(self, page_source: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """HTML에서 유효한 정보만 추출 (HTML 태그, CSS 제거)"""
         import re
@@ -921,7 +1323,7 @@ class DatabaseManager:
                     meta_info['title'] = title.get_text().strip()
                     
             except Exception as e:
-                print(f"Meta 정보 추출 실패: {e}")
+                logger.warning(f"Meta 정보 추출 실패: {e}")
             
             # 해시태그 추출
             hashtags = re.findall(r'#\w+', clean_text)
@@ -952,7 +1354,7 @@ class DatabaseManager:
             }
             
         except Exception as e:
-            print(f"유효 정보 추출 실패: {e}")
+            logger.warning(f"유효 정보 추출 실패: {e}")
             return {
                 "error": str(e),
                 "fallback_text": page_source[:1000] if page_source else "",  # 실패시 원본 일부만
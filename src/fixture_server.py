@@ -0,0 +1,87 @@
+import time
+import random
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .crawl_cache import canonical_url
+
+logger = logging.getLogger(__name__)
+
+class FixtureServer:
+    """녹화된 프로필/포스트 페이지를 Instagram과 같은 경로(/<username>/, /p/<shortcode>/)로 제공하는 로컬 HTTP 서버
+
+    응답마다 latency ± jitter(초)만큼 지연시켜 실제 네트워크와 비슷한 조건에서
+    Selenium 경로 전체(드라이버 시작, 대기, 추출)를 오프라인으로 측정할 수 있게 합니다.
+    """
+    def __init__(self, fixtures: List[Dict[str, Any]], latency: float = 0.5, jitter: float = 0.2,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.pages: Dict[str, str] = {}
+        for fixture in fixtures:
+            self.pages[self.path_for(fixture['kind'], fixture['url'])] = fixture['page_source']
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self.requests_served = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(kind: str, url: str) -> str:
+        return urlsplit(canonical_url(kind, url)).path
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, kind: str, url: str) -> str:
+        return self.base_url + self.path_for(kind, url)
+
+    def delay(self) -> float:
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                if not path.endswith('/'):
+                    path += '/'
+                page = server.pages.get(path.lower()) or server.pages.get(path)
+                time.sleep(server.delay())
+                with server._lock:
+                    server.requests_served += 1
+                if page is None:
+                    self.send_error(404)
+                    return
+                body = page.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
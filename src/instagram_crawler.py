@@ -12,9 +12,30 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 import asyncio
 import logging
+import os
+import json
+import subprocess
+import threading
+import atexit
+import requests
+from collections import OrderedDict, deque
+from requests.adapters import HTTPAdapter
+from .crawl_cache import crawl_cache
+from .page_fixtures import fixture_recorder as default_fixture_recorder
+from .page_store import page_store as default_page_store, load_page_source
+from .process_metrics import driver_rss
+from .crawl_timing import StageTimer
+from .crawl_errors import classify_result, crawl_breaker, looks_empty, ERROR_CLASS_LABELS, PAGE_ERROR_CLASSES
+from . import metrics
+from contextlib import nullcontext
+from .network_capture import (
+    NetworkCapture, PROFILE_COUNT_PATHS, PROFILE_MATCH_KEYS, POST_COUNT_PATHS, POST_MATCH_KEYS,
+    username_from_url, shortcode_from_url
+)
 
 # WebSocket 에러 방어를 위한 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -33,130 +54,954 @@ def safe_streamlit_update(progress_bar, progress_text, status_text, progress, cu
         logger.warning(f"Streamlit 업데이트 실패 (정상적인 상황일 수 있음): {str(e)}")
         pass
 
-class InstagramCrawler:
+class StreamlitProgress:
+    """일괄 크롤링 진행 표시를 일정 간격으로 묶어 갱신하는 리포터
+
+    항목마다 advance()/status()를 호출해도 min_interval(초)에 한 번만 위젯을 갱신하고, 그 사이 상태 메시지는
+    마지막 것만 남깁니다. 진행률 바 하나, 롤링 요약 한 줄, 최근 실패 표만 같은 자리에 다시 그리므로
+    항목 수가 많아도 화면 요소가 늘어나지 않습니다.
+    """
+    def __init__(self, total, min_interval=None, max_failures=20, item_label="항목"):
+        self.total = max(0, total)
+        self.min_interval = float(os.getenv("CRAWLER_PROGRESS_INTERVAL", "1.0")) if min_interval is None else min_interval
+        self.item_label = item_label
+        self.done = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.deferred = 0  # 차단기로 보류한 항목 (원장에 대기 상태로 남음)
+        self.updated = 0
+        self.failures = deque(maxlen=max_failures)  # 최근 실패 (이름, 오류)
+        self.message = ""
+        self._started = time.monotonic()
+        self._last_flush = 0.0
+        self._failures_dirty = False
+        self._lock = threading.Lock()
+        self.progress_bar = st.progress(0.0)
+        self.summary_text = st.empty()
+        self.failure_table = st.empty()
+    
+    def status(self, message):
+        """상태 메시지 갱신 (다음 갱신 때 마지막 메시지만 표시)"""
+        with self._lock:
+            self.message = message
+        self._maybe_flush()
+    
+    def advance(self, name, status, error='', updated=False):
+        """항목 1건 완료 반영"""
+        with self._lock:
+            self.done += 1
+            if status == 'success':
+                self.succeeded += 1
+                self.message = f"완료: {name}"
+            elif status == 'deferred':
+                self.deferred += 1
+                self.message = f"보류: {name} ({error})"
+            else:
+                self.failed += 1
+                self.failures.append({'이름': name, '오류': (error or '')[:200]})
+                self._failures_dirty = True
+                self.message = f"실패: {name}"
+            if updated:
+                self.updated += 1
+        self._maybe_flush(force=self.done >= self.total)
+    
+    def finish(self, message="크롤링 완료"):
+        with self._lock:
+            self.message = message
+        self._maybe_flush(force=True)
+    
+    def _maybe_flush(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.min_interval:
+            return
+        self._last_flush = now
+        self.flush()
+    
+    def summary_line(self):
+        elapsed = time.monotonic() - self._started
+        parts = [f"✅ 성공 {self.succeeded:,}", f"❌ 실패 {self.failed:,}"]
+        if self.deferred:
+            parts.append(f"⏸️ 보류 {self.deferred:,}")
+        if self.updated:
+            parts.append(f"🔄 DB 업데이트 {self.updated:,}")
+        parts.append(f"⏱️ 경과 {elapsed / 60:.1f}분")
+        if 0 < self.done < self.total:
+            parts.append(f"남은 예상 {elapsed / self.done * (self.total - self.done) / 60:.1f}분")
+        return " · ".join(parts)
+    
+    def flush(self):
+        """위젯 갱신 (WebSocket 오류는 로그만 남기고 무시)"""
+        with self._lock:
+            progress = min(max(self.done / self.total, 0.0), 1.0) if self.total else 1.0
+            progress_label = f"{self.item_label} {self.done:,}/{self.total:,} ({progress * 100:.1f}%) · {self.message}"
+            summary = self.summary_line()
+            failures = list(self.failures) if self._failures_dirty else None
+            failure_count = self.failed
+            self._failures_dirty = False
+        try:
+            self.progress_bar.progress(progress, text=progress_label)
+            self.summary_text.caption(summary)
+            if failures is not None:
+                with self.failure_table.container():
+                    st.caption(f"⚠️ 실패 {failure_count:,}건" + (f" (최근 {len(failures)}건 표시)" if failure_count > len(failures) else ""))
+                    st.dataframe(pd.DataFrame(failures), use_container_width=True, hide_index=True)
+        except Exception as e:
+            logger.warning(f"Streamlit 업데이트 실패 (정상적인 상황일 수 있음): {str(e)}")
+
+class ChromeDriverResolver:
+    """chromedriver 경로 확인 결과를 프로세스/호스트 단위로 캐시 (오프라인 환경 지원)"""
+    def __init__(self, pinned_path=None, manifest_path=None, revalidate_hours=24):
+        # .env 값은 셸을 거치지 않으므로 ~를 직접 확장 (그대로 두면 ./~ 디렉터리가 생김)
+        self.pinned_path = os.path.expanduser(pinned_path) if pinned_path else None
+        self.manifest_path = os.path.expanduser(manifest_path) if manifest_path else os.path.join(
+            os.path.expanduser("~"), ".cache", "insta-crawler", "chromedriver.json"
+        )
+        self.revalidate_seconds = revalidate_hours * 3600
+        self._resolved = None  # 프로세스 내 캐시 {'path', 'version', 'checked_at'}
+        self._lock = threading.Lock()
+    
+    def _read_version(self, path):
+        """chromedriver --version 출력에서 버전 추출"""
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+            match = re.search(r'ChromeDriver\s+([\d.]+)', output)
+            return match.group(1) if match else output.strip()
+        except Exception as e:
+            logger.warning(f"chromedriver 버전 확인 실패: {str(e)}")
+            return ''
+    
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_manifest(self, entry):
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            tmp_path = f"{self.manifest_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"chromedriver 매니페스트 저장 실패: {str(e)}")
+    
+    def _is_fresh(self, entry):
+        return (
+            entry
+            and os.path.exists(entry.get('path', ''))
+            and time.time() - entry.get('checked_at', 0) < self.revalidate_seconds
+        )
+    
+    def resolve(self):
+        """chromedriver 실행 파일 경로 반환 (설정 고정 경로 > 유효한 캐시 > webdriver-manager 순)"""
+        with self._lock:
+            if self.pinned_path:
+                if not os.path.exists(self.pinned_path):
+                    raise FileNotFoundError(f"CHROMEDRIVER_PATH 경로에 chromedriver가 없습니다: {self.pinned_path}")
+                if not self._resolved:
+                    self._resolved = {
+                        'path': self.pinned_path,
+                        'version': self._read_version(self.pinned_path),
+                        'checked_at': time.time(),
+                        'source': 'pinned'
+                    }
+                return self._resolved['path']
+            
+            if self._is_fresh(self._resolved):
+                return self._resolved['path']
+            
+            manifest = self._load_manifest()
+            if self._is_fresh(manifest):
+                self._resolved = manifest
+                return manifest['path']
+            
+            # 재검증 주기가 지났거나 캐시가 없으면 webdriver-manager로 확인
+            try:
+                path = ChromeDriverManager().install()
+            except Exception as e:
+                if manifest and os.path.exists(manifest.get('path', '')):
+                    # 네트워크 없이도 마지막으로 확인된 드라이버로 계속 진행
+                    logger.warning(f"chromedriver 재검증 실패, 캐시된 경로 사용: {str(e)}")
+                    self._resolved = manifest
+                    return manifest['path']
+                raise
+            
+            entry = {
+                'path': path,
+                'version': self._read_version(path),
+                'checked_at': time.time(),
+                'source': 'webdriver-manager'
+            }
+            self._save_manifest(entry)
+            self._resolved = entry
+            return path
+    
+    def info(self):
+        """마지막으로 확인된 경로/버전 정보"""
+        with self._lock:
+            return dict(self._resolved) if self._resolved else None
+
+# 전역 chromedriver 경로 확인기
+chromedriver_resolver = ChromeDriverResolver(
+    pinned_path=os.getenv("CHROMEDRIVER_PATH") or None,
+    manifest_path=os.getenv("CHROMEDRIVER_MANIFEST") or None,
+    revalidate_hours=float(os.getenv("CHROMEDRIVER_REVALIDATE_HOURS", "24"))
+)
+
+# 포스트 좋아요/댓글 폴백 추출용 XPath 패턴 (패턴 순서 = 우선순위)
+LIKE_XPATH_PATTERNS = [
+    "//span[contains(text(), 'likes')]",
+    "//span[contains(text(), '좋아요')]",
+    "//article//span[contains(text(), 'likes')]",
+    "//main//span[contains(text(), 'likes')]",
+]
+
+COMMENT_XPATH_PATTERNS = [
+    "//span[contains(text(), 'View all') and contains(text(), 'comments')]",
+    "//span[contains(text(), 'comments')]",
+    "//article//span[contains(text(), 'comments')]",
+    "//main//span[contains(text(), 'comments')]",
+]
+
+# 키별 XPath 패턴을 페이지 안에서 평가하고 후보 텍스트를 JSON 문자열로 반환
+XPATH_TEXTS_SCRIPT = """
+const patternsByKey = JSON.parse(arguments[0]);
+const result = {};
+for (const [key, patterns] of Object.entries(patternsByKey)) {
+    const texts = [];
+    for (const pattern of patterns) {
+        try {
+            const snapshot = document.evaluate(pattern, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < snapshot.snapshotLength; i++) {
+                const node = snapshot.snapshotItem(i);
+                const text = (node.innerText || node.textContent || '').trim();
+                if (text) texts.push(text);
+            }
+        } catch (e) {}
+    }
+    result[key] = texts;
+}
+return JSON.stringify(result);
+"""
+
+def create_chrome_driver():
+    """Chrome 드라이버 생성 (Instagram 자동화 감지 우회)"""
+    chrome_options = Options()
+    
+    # 기본 헤드리스 설정
+    chrome_options.add_argument("--headless")  # 브라우저 창을 숨김
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    
+    # 랜덤 User-Agent (실제 브라우저 시뮬레이션)
+    user_agents = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ]
+    selected_ua = random.choice(user_agents)
+    chrome_options.add_argument(f"--user-agent={selected_ua}")
+    
+    # 자동화 감지 우회 옵션들 (강화)
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    
+    # 봇 탐지 회피를 위한 추가 옵션들
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-field-trial-config")
+    chrome_options.add_argument("--disable-back-forward-cache")
+    chrome_options.add_argument("--disable-hang-monitor")
+    chrome_options.add_argument("--disable-prompt-on-repost")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-plugins")
+    
+    # 추가 봇 탐지 회피 옵션들
+    chrome_options.add_argument("--disable-client-side-phishing-detection")
+    chrome_options.add_argument("--disable-component-extensions-with-background-pages")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-domain-reliability")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--disable-hang-monitor")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-prompt-on-repost")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-web-resources")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-field-trial-config")
+    chrome_options.add_argument("--disable-back-forward-cache")
+    
+    # GPU 관련 경고 제거 및 로그 레벨 설정
+    chrome_options.add_argument("--enable-unsafe-swiftshader")
+    chrome_options.add_argument("--disable-software-rasterizer")
+    chrome_options.add_argument("--disable-gpu-sandbox")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_argument("--silent")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--disable-gpu-logging")
+    chrome_options.add_argument("--disable-gpu-watchdog")
+    chrome_options.add_argument("--disable-gpu-process-crash-limit")
+    
+    # 추가 보안 및 성능 옵션
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    
+    # 네트워크 이벤트 수집용 성능 로그 (리소스 차단 통계 등)
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
+    service = Service(chromedriver_resolver.resolve())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    
+    # JavaScript로 자동화 속성 숨기기 (강화)
+    stealth_scripts = [
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
+        "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})",
+        "Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})",
+        "Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})})",
+        "Object.defineProperty(navigator, 'platform', {get: () => 'Win32'})",
+        "Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 4})",
+        "Object.defineProperty(navigator, 'deviceMemory', {get: () => 8})",
+        "Object.defineProperty(navigator, 'maxTouchPoints', {get: () => 0})",
+        "Object.defineProperty(navigator, 'vendor', {get: () => 'Google Inc.'})",
+        "Object.defineProperty(navigator, 'vendorSub', {get: () => ''})",
+        "Object.defineProperty(navigator, 'productSub', {get: () => '20030107'})",
+        "Object.defineProperty(navigator, 'appName', {get: () => 'Netscape'})",
+        "Object.defineProperty(navigator, 'appVersion', {get: () => '5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'})",
+        "Object.defineProperty(navigator, 'userAgent', {get: () => arguments[0]})",
+        "delete navigator.__proto__.webdriver"
+    ]
+    
+    for script in stealth_scripts:
+        try:
+            if "userAgent" in script:
+                driver.execute_script(script, selected_ua)
+            else:
+                driver.execute_script(script)
+        except:
+            pass
+    
+    return driver
+
+class _PooledDriver:
+    """풀에서 관리되는 드라이버와 사용 이력"""
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.pages = 0
+
+class DriverPool:
+    """프로세스 전역 WebDriver 풀 (미리 띄워둔 드라이버를 임대/반납하여 Chrome 콜드 스타트 제거)"""
+    def __init__(self, size=2, max_pages=50, max_age=1800, factory=None):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self._factory = factory or create_chrome_driver
+        self._idle = []  # 반납되어 대기 중인 드라이버
+        self._leased = {}  # id(driver) -> _PooledDriver
+        self._starting = 0  # 생성 중인 드라이버 수
+        self._cond = threading.Condition()
+        self._closed = False
+    
+    def _live_count(self):
+        return len(self._idle) + len(self._leased) + self._starting
+    
+    def _expiry_reason(self, entry):
+        """페이지 수 또는 사용 시간 기준 재활용 사유 ('pages', 'age', 해당 없으면 None)"""
+        if self.max_pages and entry.pages >= self.max_pages:
+            return 'pages'
+        if self.max_age and time.monotonic() - entry.created_at >= self.max_age:
+            return 'age'
+        return None
+    
+    def _is_expired(self, entry):
+        return self._expiry_reason(entry) is not None
+    
+    def _is_healthy(self, entry):
+        """드라이버가 응답하는지 확인"""
+        try:
+            entry.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+    
+    def _quit(self, entry):
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            logger.warning(f"풀 드라이버 종료 중 오류: {str(e)}")
+    
+    def _spawn(self):
+        """새 드라이버 생성 (락 밖에서 호출, _starting 카운트는 호출 전에 증가)"""
+        try:
+            return _PooledDriver(self._factory())
+        finally:
+            with self._cond:
+                self._starting -= 1
+                self._cond.notify_all()
+    
+    def warm(self, count=None):
+        """지정한 수만큼 드라이버를 미리 띄워 둠"""
+        target = min(count or self.size, self.size)
+        while True:
+            with self._cond:
+                if self._closed or self._live_count() >= target:
+                    return
+                self._starting += 1
+            try:
+                entry = self._spawn()
+            except Exception as e:
+                logger.warning(f"드라이버 예열 실패: {str(e)}")
+                return
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify_all()
+    
+    def warm_async(self, count=None):
+        """백그라운드 스레드에서 드라이버 예열"""
+        thread = threading.Thread(target=self.warm, args=(count,), daemon=True)
+        thread.start()
+        return thread
+    
+    def acquire(self, timeout=None):
+        """드라이버 임대 (유휴 드라이버가 없고 풀이 가득 차면 반납될 때까지 대기)"""
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            entry = None
+            spawn = False
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("드라이버 풀이 종료되었습니다.")
+                if self._idle:
+                    entry = self._idle.pop()
+                elif self._live_count() < self.size:
+                    self._starting += 1
+                    spawn = True
+                else:
+                    remaining = deadline - time.monotonic() if deadline else None
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutException("드라이버 풀 임대 대기 시간 초과")
+                    self._cond.wait(remaining)
+                    continue
+            
+            if spawn:
+                entry = self._spawn()
+                # 첫 임대 시 나머지 슬롯도 백그라운드에서 예열
+                self.warm_async()
+            elif self._is_expired(entry) or not self._is_healthy(entry):
+                # 오래되었거나 응답 없는 드라이버는 폐기 후 다시 시도
+                self._quit(entry)
+                continue
+            
+            with self._cond:
+                self._leased[id(entry.driver)] = entry
+            return entry.driver
+    
+    def record_page(self, driver):
+        """임대한 드라이버의 페이지 로드 횟수 기록"""
+        with self._cond:
+            entry = self._leased.get(id(driver))
+            if entry:
+                entry.pages += 1
+    
+    def recycle_reason(self, driver):
+        """임대 중인 드라이버의 재활용 사유 (일괄 크롤링처럼 반납하지 않고 계속 쓰는 동안 확인, 해당 없으면 None)"""
+        with self._cond:
+            entry = self._leased.get(id(driver))
+            return self._expiry_reason(entry) if entry else None
+    
+    def release(self, driver, discard=False):
+        """드라이버 반납 (재활용 조건에 해당하면 종료하고 빈 자리를 새 드라이버로 채움)"""
+        with self._cond:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            # 풀에서 임대한 드라이버가 아니면 그냥 종료
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+        
+        if discard or self._closed or self._is_expired(entry):
+            self._quit(entry)
+            with self._cond:
+                self._cond.notify_all()
+            if not self._closed:
+                self.warm_async()
+            return
+        
+        try:
+            # 이전 페이지의 네트워크/스크립트 활동 정지
+            driver.get("about:blank")
+        except Exception:
+            self._quit(entry)
+            with self._cond:
+                self._cond.notify_all()
+            return
+        
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify_all()
+    
+    def shutdown(self):
+        """유휴 드라이버 모두 종료 (임대 중인 드라이버는 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for entry in idle:
+            self._quit(entry)
+    
+    def drivers(self):
+        """현재 살아 있는 드라이버 목록 (유휴 + 임대 중, 메모리 측정용)"""
+        with self._cond:
+            return [entry.driver for entry in self._idle] + [entry.driver for entry in self._leased.values()]
+    
+    def stats(self):
+        """풀 상태 요약"""
+        with self._cond:
+            return {
+                'size': self.size,
+                'idle': len(self._idle),
+                'leased': len(self._leased),
+                'starting': self._starting
+            }
+
+# 전역 드라이버 풀 (환경변수로 크기/재활용 조건 설정)
+driver_pool = DriverPool(
+    size=int(os.getenv("CRAWLER_POOL_SIZE", "2")),
+    max_pages=int(os.getenv("CRAWLER_POOL_MAX_PAGES", "50")),
+    max_age=int(os.getenv("CRAWLER_POOL_MAX_AGE", "1800"))
+)
+atexit.register(driver_pool.shutdown)
+
+class DriverSupervisor:
+    """크롤링마다 Chrome 프로세스 트리(브라우저 + 렌더러) RSS를 확인하여
+    기준을 넘은 드라이버를 재시작하고 재시작 횟수/사유를 집계
+
+    페이지 수/사용 시간 기준 재활용은 드라이버 풀(CRAWLER_POOL_MAX_PAGES/MAX_AGE)이 맡고,
+    그 재시작도 사유('pages', 'age')별로 여기에 함께 집계합니다.
+    """
+    def __init__(self, max_rss_mb=1500):
+        self.max_rss_mb = max_rss_mb  # 0이면 메모리 기준 재시작 안 함
+        self._restarts = {}  # 사유 -> 횟수
+        self._peak_rss = 0
+        self._last_rss = None
+        self._lock = threading.Lock()
+    
+    def check(self, driver):
+        """드라이버 메모리 측정 후 {'rss_mb', 'restart': 'rss' 또는 None} 반환"""
+        rss = driver_rss(driver) if self.max_rss_mb else None
+        rss_mb = round(rss / (1024 * 1024), 1) if rss else None
+        if rss_mb is not None:
+            with self._lock:
+                self._last_rss = rss_mb
+                self._peak_rss = max(self._peak_rss, rss_mb)
+        reason = 'rss' if self.max_rss_mb and rss_mb is not None and rss_mb >= self.max_rss_mb else None
+        return {'rss_mb': rss_mb, 'restart': reason}
+    
+    def record_restart(self, driver, reason):
+        with self._lock:
+            self._restarts[reason] = self._restarts.get(reason, 0) + 1
+        logger.info(f"드라이버 재시작 ({reason})")
+    
+    def restarts_since(self, snapshot):
+        """stats() 스냅샷 이후 사유별 재시작 횟수 (일괄 크롤링 요약용)"""
+        with self._lock:
+            reasons = {reason: count - snapshot.get('reasons', {}).get(reason, 0) for reason, count in self._restarts.items()}
+        return {reason: count for reason, count in reasons.items() if count > 0}
+    
+    def stats(self):
+        """재시작 횟수/사유 및 RSS 요약"""
+        with self._lock:
+            return {
+                'restarts': sum(self._restarts.values()),
+                'reasons': dict(self._restarts),
+                'last_rss_mb': self._last_rss,
+                'peak_rss_mb': self._peak_rss or None
+            }
+
+# 전역 드라이버 감시자 (RSS 기준 재시작)
+driver_supervisor = DriverSupervisor(
+    max_rss_mb=float(os.getenv("CRAWLER_DRIVER_MAX_RSS_MB", "1500"))
+)
+
+class RequestPacer:
+    """요청 간 간격을 관리하는 중앙 페이싱 컴포넌트 (스레드 간 공유, 남은 간격만 대기)"""
+    def __init__(self, min_interval=0.0, max_interval=None):
+        self.min_interval = min_interval
+        self.max_interval = max_interval if max_interval is not None else min_interval
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def delay(self):
+        """다음 요청까지 남은 대기 시간(초)"""
+        with self._lock:
+            return max(0.0, self._next_allowed - time.monotonic())
+    
+    def wait(self):
+        """요청 슬롯을 예약하고 차례가 올 때까지 대기, 실제 대기한 시간 반환"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + random.uniform(self.min_interval, self.max_interval)
+        waited = start - now
+        if waited > 0:
+            time.sleep(waited)
+        return waited
+
+class TokenBucket:
+    """분당 요청 예산을 강제하는 토큰 버킷 (RequestPacer와 같은 wait()/delay() 인터페이스, 스레드 간 공유)"""
+    def __init__(self, requests_per_minute=12, burst=1):
+        self.rate = requests_per_minute / 60.0  # 초당 토큰 보충량
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def delay(self):
+        """토큰 하나를 얻기까지 남은 시간(초)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate) if self.rate > 0 else 0.0
+    
+    def wait(self):
+        """토큰 하나를 예약하고 사용 가능해질 때까지 대기, 실제 대기한 시간 반환"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            waited = max(0.0, (1 - self._tokens) / self.rate)
+            self._tokens -= 1  # 부족분은 음수로 남겨 다음 요청자가 뒤에 줄을 서게 함
+        if waited > 0:
+            time.sleep(waited)
+        return waited
+
+class WaitPolicy:
+    """URL별 대기 예산 안에서 추출에 필요한 준비 신호가 나타나는 즉시 반환하는 대기 정책"""
+    # 크롤링 종류별 준비 신호 (하나라도 나타나면 준비 완료)
+    READY_SIGNALS = {
+        'profile': [
+            (By.CSS_SELECTOR, 'meta[property="og:description"]'),
+            (By.TAG_NAME, "main")
+        ],
+        'post': [
+            (By.CSS_SELECTOR, 'meta[name="description"]'),
+            (By.TAG_NAME, "main")
+        ],
+        'post_counts': [
+            (By.XPATH, "//span[contains(text(), 'likes') or contains(text(), '좋아요')]"),
+            (By.XPATH, "//span[contains(text(), 'comments')]")
+        ]
+    }
+    
+    def __init__(self, budget=25.0, poll_interval=0.25):
+        self.budget = budget
+        self.poll_interval = poll_interval
+    
+    def deadline(self):
+        """URL 하나에 대한 대기 마감 시각"""
+        return time.monotonic() + self.budget
+    
+    def remaining(self, deadline):
+        return max(0.0, deadline - time.monotonic())
+    
+    def wait_for(self, driver, kind, deadline, max_wait=None):
+        """준비 신호가 나타날 때까지 대기 (남은 예산 초과 시 TimeoutException)"""
+        timeout = self.remaining(deadline)
+        if max_wait is not None:
+            timeout = min(timeout, max_wait)
+        if timeout <= 0:
+            raise TimeoutException(f"대기 예산 소진 ({kind})")
+        conditions = [EC.presence_of_element_located(locator) for locator in self.READY_SIGNALS[kind]]
+        return WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(
+            EC.any_of(*conditions)
+        )
+
+# 전역 요청 페이서 / 대기 정책 (환경변수로 설정)
+request_pacer = RequestPacer(
+    min_interval=float(os.getenv("CRAWLER_MIN_INTERVAL", "3")),
+    max_interval=float(os.getenv("CRAWLER_MAX_INTERVAL", "7"))
+)
+wait_policy = WaitPolicy(budget=float(os.getenv("CRAWLER_WAIT_BUDGET", "25")))
+
+# 동시 크롤링(CrawlEngine)에서 공유하는 전역 분당 요청 예산
+global_rate_limiter = TokenBucket(
+    requests_per_minute=float(os.getenv("CRAWLER_REQUESTS_PER_MINUTE", "12")),
+    burst=int(os.getenv("CRAWLER_REQUEST_BURST", "1"))
+)
+
+class ResourcePolicy:
+    """크롤링 종류별로 CDP(Network.setBlockedURLs)로 차단할 서브리소스 정책"""
+    # 리소스 종류별 차단 URL 패턴 (쿼리스트링이 붙는 CDN URL도 매칭되도록 끝에 * 사용)
+    RESOURCE_PATTERNS = {
+        'image': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.heic*', '*.ico*', '*.svg*'],
+        'media': ['*.mp4*', '*.webm*', '*.m4a*', '*.m4v*', '*.mp3*', '*.m3u8*'],
+        'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*']
+    }
+    
+    def __init__(self, blocked_by_kind=None):
+        # 예: {'profile': ['image', 'media', 'font'], 'post': ['media', 'font']}
+        self.blocked_by_kind = {kind: list(types) for kind, types in (blocked_by_kind or {}).items()}
+    
+    @classmethod
+    def from_env(cls):
+        """CRAWLER_BLOCK_PROFILE / CRAWLER_BLOCK_POST 환경변수(쉼표 구분)로 정책 생성"""
+        blocked_by_kind = {}
+        for kind in ('profile', 'post'):
+            value = os.getenv(f"CRAWLER_BLOCK_{kind.upper()}", "")
+            types = [t.strip() for t in value.split(',') if t.strip()]
+            if types:
+                blocked_by_kind[kind] = types
+        return cls(blocked_by_kind)
+    
+    def patterns_for(self, kind):
+        patterns = []
+        for resource_type in self.blocked_by_kind.get(kind, []):
+            patterns.extend(self.RESOURCE_PATTERNS.get(resource_type, []))
+        return patterns
+    
+    def apply(self, driver, kind):
+        """드라이버에 차단 패턴 적용 (풀 드라이버 재사용을 고려해 변경이 있을 때만 CDP 호출)"""
+        patterns = self.patterns_for(kind)
+        if getattr(driver, '_blocked_url_patterns', []) == patterns:
+            return patterns
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        driver._blocked_url_patterns = patterns
+        return patterns
+
+def summarize_network_events(events):
+    """성능 로그의 Network 이벤트에서 요청/전송량/차단 통계 집계"""
+    stats = {
+        'requests': 0,
+        'transferred_bytes': 0,
+        'blocked_requests': 0,
+        'blocked_by_type': {}
+    }
+    request_types = {}
+    for event in events:
+        method = event.get('method')
+        params = event.get('params', {})
+        if method == 'Network.requestWillBeSent':
+            stats['requests'] += 1
+            request_types[params.get('requestId')] = params.get('type', 'Other')
+        elif method == 'Network.loadingFinished':
+            stats['transferred_bytes'] += int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            stats['blocked_requests'] += 1
+            resource_type = params.get('type') or request_types.get(params.get('requestId'), 'Other')
+            stats['blocked_by_type'][resource_type] = stats['blocked_by_type'].get(resource_type, 0) + 1
+    return stats
+
+# 전역 리소스 차단 정책 (기본값: 차단 없음, 환경변수로 opt-in)
+default_resource_policy = ResourcePolicy.from_env()
+
+class HttpProfileFetcher:
+    """연결 풀을 쓰는 requests.Session으로 초기 HTML만 가져오는 빠른 경로 (조건부 요청 지원)"""
+    USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1"
+    
+    def __init__(self, pool_size=10, timeout=10, max_cached=256):
+        self.timeout = timeout
+        self.max_cached = max_cached
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": self.USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Connection": "keep-alive"
+        })
+        self._validators = OrderedDict()  # url -> (ETag, Last-Modified, 본문)
+        self._lock = threading.Lock()
+    
+    def fetch(self, url):
+        """HTML 본문과 최종 URL 반환 (304 응답이면 캐시된 본문 재사용)"""
+        headers = {}
+        with self._lock:
+            cached = self._validators.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            return cached[2], response.url
+        response.raise_for_status()
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._lock:
+                self._validators[url] = (etag, last_modified, response.text)
+                self._validators.move_to_end(url)
+                while len(self._validators) > self.max_cached:
+                    self._validators.popitem(last=False)
+        return response.text, response.url
+
+class CrawlTierStats:
+    """티어(http/selenium)별 처리 건수와 지연 시간 집계"""
     def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+    
+    def record(self, tier, outcome, seconds):
+        # outcome: 'hit'(해당 티어에서 결과 반환) 또는 'miss'(다음 티어로 넘김)
+        with self._lock:
+            entry = self._stats.setdefault(tier, {'hit': 0, 'miss': 0, 'seconds': 0.0})
+            entry[outcome] += 1
+            entry['seconds'] += seconds
+    
+    def summary(self):
+        with self._lock:
+            summary = {}
+            for tier, entry in self._stats.items():
+                attempts = entry['hit'] + entry['miss']
+                summary[tier] = {
+                    'hits': entry['hit'],
+                    'misses': entry['miss'],
+                    'hit_rate': entry['hit'] / attempts if attempts else 0.0,
+                    'avg_seconds': entry['seconds'] / attempts if attempts else 0.0
+                }
+            return summary
+
+# HTTP 빠른 경로에서 반드시 채워져야 하는 프로필 필드 (없으면 Selenium으로 승격)
+HTTP_REQUIRED_PROFILE_FIELDS = ('influencer_name', 'followers_count', 'post_count')
+
+# 전역 HTTP 페처 / 티어 통계
+http_profile_fetcher = HttpProfileFetcher(pool_size=int(os.getenv("CRAWLER_HTTP_POOL_SIZE", "10")))
+crawl_tier_stats = CrawlTierStats()
+
+# OpenMetrics 수집 시점에 계산하는 값 (드라이버 풀, 재시작, 결과 캐시)
+metrics.register_collector("crawler_active_drivers", "드라이버 풀의 Chrome 드라이버 수 (state별)",
+                           lambda: {metrics.labels(state=state): count for state, count in driver_pool.stats().items() if state != 'size'})
+metrics.register_collector("crawler_driver_restarts", "RSS/페이지 수 기준 드라이버 재시작 수 (reason별)",
+                           lambda: {metrics.labels(reason=reason): count for reason, count in driver_supervisor.stats()['reasons'].items()},
+                           counter=True)
+metrics.register_collector("crawler_cache_lookups", "결과 캐시 조회 수 (kind, outcome별)",
+                           lambda: {metrics.labels(kind=kind, outcome=outcome): kind_stats[outcome]
+                                    for kind, kind_stats in crawl_cache.stats().items() if isinstance(kind_stats, dict)
+                                    for outcome in ('hits', 'db_hits', 'misses', 'bypass')},
+                           counter=True)
+metrics.register_collector("crawler_cache_hit_ratio", "결과 캐시 적중률 (kind별)",
+                           lambda: {metrics.labels(kind=kind): kind_stats['hit_rate']
+                                    for kind, kind_stats in crawl_cache.stats().items() if isinstance(kind_stats, dict)})
+metrics.start_exporter_from_env()
+
+class InstagramCrawler:
+    def __init__(self, pool=None, pacer=None, waits=None, resource_policy=None, capture_network=None, http_fetcher=None, cache=None, fixture_recorder=None, base_url=None, page_store=None, supervisor=None):
         self.driver = None
+        self.pool = pool  # DriverPool 사용 시 드라이버를 임대/반납
+        self.pacer = pacer or request_pacer  # 요청 간 간격 관리
+        self.waits = waits or wait_policy  # 페이지 준비 대기 정책
+        self.resource_policy = resource_policy or default_resource_policy  # 서브리소스 차단 정책
+        # 네트워크 응답(JSON) 캡처 모드 및 캡처 대기 한도(초)
+        self.capture_network = capture_network if capture_network is not None else os.getenv("CRAWLER_CAPTURE_NETWORK", "") == "1"
+        self.capture_wait = float(os.getenv("CRAWLER_CAPTURE_WAIT", "5"))
+        # 프로필 크롤링 시 HTTP 빠른 경로 우선 시도 여부
+        self.http_fetcher = http_fetcher if http_fetcher is not None else (
+            http_profile_fetcher if os.getenv("CRAWLER_HTTP_FAST_PATH", "1") == "1" else None
+        )
+        self.cache = cache if cache is not None else crawl_cache  # 최근 결과 캐시 (종류별 TTL)
+        # 실제 크롤링 페이지를 리플레이/벤치마크용 픽스처로 기록 (CRAWLER_FIXTURE_DIR)
+        self.fixture_recorder = fixture_recorder if fixture_recorder is not None else default_fixture_recorder
+        # Instagram 대신 요청할 기준 URL (예: 로컬 픽스처 서버 http://127.0.0.1:8800)
+        self.base_url = (base_url or os.getenv("CRAWLER_BASE_URL", "")).rstrip('/') or None
+        # 결과에는 page_source 원문 대신 압축 블롭 핸들을 담아 일괄 크롤링 메모리를 일정하게 유지
+        self.page_store = page_store if page_store is not None else default_page_store
+        self.supervisor = supervisor if supervisor is not None else driver_supervisor  # 드라이버 메모리/페이지 수 감시
+        self._timer = None  # 진행 중인 크롤링의 단계별 소요 시간 기록
         self._background_tasks = set()  # 백그라운드 태스크 관리
         
     def setup_driver(self):
-        """Chrome 드라이버 설정 (Instagram 자동화 감지 우회)"""
-        chrome_options = Options()
-        
-        # 기본 헤드리스 설정
-        chrome_options.add_argument("--headless")  # 브라우저 창을 숨김
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        # 랜덤 User-Agent (실제 브라우저 시뮬레이션)
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        selected_ua = random.choice(user_agents)
-        chrome_options.add_argument(f"--user-agent={selected_ua}")
-        
-        # 자동화 감지 우회 옵션들 (강화)
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-        
-        # 봇 탐지 회피를 위한 추가 옵션들
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-field-trial-config")
-        chrome_options.add_argument("--disable-back-forward-cache")
-        chrome_options.add_argument("--disable-hang-monitor")
-        chrome_options.add_argument("--disable-prompt-on-repost")
-        chrome_options.add_argument("--disable-sync")
-        chrome_options.add_argument("--disable-translate")
-        chrome_options.add_argument("--disable-background-networking")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        
-        # 추가 봇 탐지 회피 옵션들
-        chrome_options.add_argument("--disable-client-side-phishing-detection")
-        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-domain-reliability")
-        chrome_options.add_argument("--disable-features=TranslateUI")
-        chrome_options.add_argument("--disable-hang-monitor")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-prompt-on-repost")
-        chrome_options.add_argument("--disable-sync")
-        chrome_options.add_argument("--disable-web-resources")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-field-trial-config")
-        chrome_options.add_argument("--disable-back-forward-cache")
-        
-        # GPU 관련 경고 제거 및 로그 레벨 설정
-        chrome_options.add_argument("--enable-unsafe-swiftshader")
-        chrome_options.add_argument("--disable-software-rasterizer")
-        chrome_options.add_argument("--disable-gpu-sandbox")
-        chrome_options.add_argument("--log-level=3")
-        chrome_options.add_argument("--silent")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--disable-gpu-logging")
-        chrome_options.add_argument("--disable-gpu-watchdog")
-        chrome_options.add_argument("--disable-gpu-process-crash-limit")
-        
-        # 추가 보안 및 성능 옵션
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--no-default-browser-check")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # JavaScript로 자동화 속성 숨기기 (강화)
-        stealth_scripts = [
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
-            "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})",
-            "Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})",
-            "Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})})",
-            "Object.defineProperty(navigator, 'platform', {get: () => 'Win32'})",
-            "Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 4})",
-            "Object.defineProperty(navigator, 'deviceMemory', {get: () => 8})",
-            "Object.defineProperty(navigator, 'maxTouchPoints', {get: () => 0})",
-            "Object.defineProperty(navigator, 'vendor', {get: () => 'Google Inc.'})",
-            "Object.defineProperty(navigator, 'vendorSub', {get: () => ''})",
-            "Object.defineProperty(navigator, 'productSub', {get: () => '20030107'})",
-            "Object.defineProperty(navigator, 'appName', {get: () => 'Netscape'})",
-            "Object.defineProperty(navigator, 'appVersion', {get: () => '5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'})",
-            "Object.defineProperty(navigator, 'userAgent', {get: () => arguments[0]})",
-            "delete navigator.__proto__.webdriver"
-        ]
-        
-        for script in stealth_scripts:
-            try:
-                if "userAgent" in script:
-                    self.driver.execute_script(script, selected_ua)
-                else:
-                    self.driver.execute_script(script)
-            except:
-                pass
-        
+        """Chrome 드라이버 설정 (풀이 있으면 예열된 드라이버 임대)"""
+        with self._span('driver_startup'):
+            if self.pool is not None:
+                self.driver = self.pool.acquire()
+            else:
+                self.driver = create_chrome_driver()
         return self.driver
     
+    def _span(self, stage):
+        """진행 중인 크롤링의 단계 소요 시간 기록 (크롤링 밖에서는 아무것도 하지 않음)"""
+        return self._timer.span(stage) if self._timer is not None else nullcontext()
+    
+    def resolve_url(self, url):
+        """base_url 설정 시 instagram.com 주소를 해당 서버 주소로 변환 (결과의 url은 원래 주소 유지)"""
+        if not self.base_url:
+            return url
+        return re.sub(r'^https?://(www\.)?instagram\.com', self.base_url, url)
+    
+    def _keep_page_source(self, page_source):
+        """결과에 담을 page_source (페이지 저장소가 있으면 핸들)"""
+        return self.page_store.put(page_source) if self.page_store is not None else page_source
+    
+    def _navigate(self, url, kind=None):
+        """페이지 이동 (요청 간격 준수, 풀 드라이버의 페이지 수 기록) 후 URL별 대기 마감 시각 반환"""
+        if kind:
+            self.resource_policy.apply(self.driver, kind)
+        # 이전 페이지의 네트워크 이벤트는 버림
+        self.collect_network_events()
+        with self._span('pacing'):
+            self.pacer.wait()
+        deadline = self.waits.deadline()
+        with self._span('navigate'):
+            self.driver.get(self.resolve_url(url))
+        if self.pool is not None:
+            self.pool.record_page(self.driver)
+        return deadline
+    
+    def collect_network_events(self):
+        """성능 로그에서 Network 이벤트를 꺼내 반환 (로그 버퍼는 비워짐)"""
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            return []
+        events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            if message.get('method', '').startswith('Network.'):
+                events.append(message)
+        return events
+    
     def simulate_human_behavior(self):
-        """자연스러운 사용자 행동 시뮬레이션"""
+        """자연스러운 사용자 행동 시뮬레이션 (대기 없이 마우스 이동/스크롤만 수행)"""
         try:
             # 랜덤 마우스 움직임
             from selenium.webdriver.common.action_chains import ActionChains
@@ -167,17 +1012,9 @@ class InstagramCrawler:
             y_offset = random.randint(-100, 100)
             actions.move_by_offset(x_offset, y_offset).perform()
             
-            # 랜덤 대기 시간
-            time.sleep(random.uniform(0.5, 2.0))
-            
-            # 랜덤 스크롤
+            # 랜덤 스크롤 후 다시 위로 스크롤
             scroll_amount = random.randint(100, 500)
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(0.5, 1.5))
-            
-            # 다시 위로 스크롤
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(random.uniform(0.5, 1.0))
+            self.driver.execute_script(f"window.scrollBy(0, {scroll_amount}); window.scrollTo(0, 0);")
             
         except Exception as e:
             # 에러가 발생해도 크롤링을 계속 진행
@@ -195,43 +1032,361 @@ class InstagramCrawler:
             
         # 공백 제거
         text = text.replace(' ', '').replace(',', '')
-        print(f"DEBUG extract_numbers - input: '{text}'")
+        logger.debug(f"extract_numbers - input: '{text}'")
         
         # K, M, B 단위 처리
         if 'B' in text.upper():
             number = float(re.findall(r'[\d.]+', text)[0])
             result = int(number * 1e9)
-            print(f"DEBUG extract_numbers - B unit: {number} * 1e9 = {result}")
+            logger.debug(f"extract_numbers - B unit: {number} * 1e9 = {result}")
             return result
         elif 'M' in text.upper():
             number = float(re.findall(r'[\d.]+', text)[0])
             result = int(number * 1e6)
-            print(f"DEBUG extract_numbers - M unit: {number} * 1e6 = {result}")
+            logger.debug(f"extract_numbers - M unit: {number} * 1e6 = {result}")
             return result
         elif 'K' in text.upper():
             number = float(re.findall(r'[\d.]+', text)[0])
             result = int(number * 1e3)
-            print(f"DEBUG extract_numbers - K unit: {number} * 1e3 = {result}")
+            logger.debug(f"extract_numbers - K unit: {number} * 1e3 = {result}")
             return result
         # 한글 단위 처리
         elif '만' in text:
             number = float(re.findall(r'[\d.]+', text)[0])
             result = int(number * 10000)
-            print(f"DEBUG extract_numbers - 만 unit: {number} * 10000 = {result}")
+            logger.debug(f"extract_numbers - 만 unit: {number} * 10000 = {result}")
             return result
         elif '천' in text:
             number = float(re.findall(r'[\d.]+', text)[0])
             result = int(number * 1000)
-            print(f"DEBUG extract_numbers - 천 unit: {number} * 1000 = {result}")
+            logger.debug(f"extract_numbers - 천 unit: {number} * 1000 = {result}")
             return result
         else:
             numbers = re.findall(r'\d+', text)
             result = int(numbers[0]) if numbers else 0
-            print(f"DEBUG extract_numbers - no unit: {result}")
+            logger.debug(f"extract_numbers - no unit: {result}")
             return result
     
-    def crawl_instagram_profile(self, url, debug_mode=False):
-        """Instagram 프로필 크롤링"""
+    def parse_page_head(self, page_source):
+        """page_source에서 추출에 필요한 태그(meta/title/link/ld+json)만 로컬 파싱"""
+        strainer = SoupStrainer(['meta', 'title', 'link', 'script'])
+        soup = BeautifulSoup(page_source or '', 'html.parser', parse_only=strainer)
+        
+        meta = {}
+        for tag in soup.find_all('meta'):
+            key = tag.get('property') or tag.get('name')
+            if key and key not in meta:
+                meta[key] = tag.get('content', '')
+        
+        title_tag = soup.find('title')
+        canonical_tag = soup.find('link', rel='canonical')
+        
+        ld_json = []
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                ld_json.append(json.loads(script.string or ''))
+            except ValueError:
+                continue
+        
+        return {
+            'meta': meta,
+            'title': title_tag.get_text().strip() if title_tag else '',
+            'canonical': canonical_tag.get('href', '') if canonical_tag else '',
+            'ld_json': ld_json
+        }
+    
+    def extract_profile_data(self, page_source, debug_mode=False, head=None):
+        """page_source 한 번으로 프로필 필드 전체 추출 (WebDriver 왕복 없이 로컬 파싱)"""
+        profile_data = {
+            'profile_image_url': '',
+            'influencer_name': '',
+            'post_count': 0,
+            'followers_count': 0,
+            'profile_text': ''
+        }
+        
+        head = head or self.parse_page_head(page_source)
+        meta = head['meta']
+        title_text = head['title']
+        og_content = meta.get('og:description', '')
+        
+        # 1. 프로필 이미지 URL 추출 (og:image)
+        profile_data['profile_image_url'] = meta.get('og:image', '')
+        if debug_mode:
+            if profile_data['profile_image_url']:
+                st.write(f"**프로필 이미지 URL:** {profile_data['profile_image_url']}")
+            else:
+                st.warning("og:image 추출 실패: 메타 태그 없음")
+        
+        # 2. 사용자 이름 추출 (1순위: title, 2순위: og:description)
+        if debug_mode:
+            st.write(f"**Title:** {title_text}")
+        
+        if title_text:
+            # "Kim Hana (@she_tasteslikehappiness) • Instagram photos and videos" 패턴
+            name_match = re.search(r'^([^(]+)\s*\(@[^)]+\)', title_text)
+            if name_match:
+                profile_data['influencer_name'] = name_match.group(1).strip()
+                if debug_mode:
+                    st.write(f"**Title에서 추출된 이름:** {profile_data['influencer_name']}")
+        
+        if not profile_data['influencer_name'] and og_content:
+            if debug_mode:
+                st.write(f"**OG Description:** {og_content}")
+            
+            # 패턴 1: "게시물 885개 - 이름(@username)님의 Instagram" 형식
+            # 패턴 2: "from 이름 (@username)" 형식 (기존)
+            # 패턴 3: "이름(@username)님의 Instagram" 형식
+            name_patterns = [
+                (r'게시물\s+\d+개\s*-\s*([^(]+)\s*\(@[^)]+\)', 0),
+                (r'from\s+([^(]+)\s*\(@[^)]+\)', re.IGNORECASE),
+                (r'([^(]+)\s*\(@[^)]+\)님의\s+Instagram', 0)
+            ]
+            for index, (pattern, flags) in enumerate(name_patterns, start=1):
+                name_match = re.search(pattern, og_content, flags)
+                if name_match:
+                    profile_data['influencer_name'] = name_match.group(1).strip()
+                    if debug_mode:
+                        st.write(f"**OG Description에서 추출된 이름 (패턴{index}):** {profile_data['influencer_name']}")
+                    break
+        
+        if og_content:
+            # 3. 게시물 수 추출 - 영문 패턴: "885 Posts", 한글 패턴: "게시물 885"
+            posts_match = re.search(r'([0-9.,KMB]+)\s+Posts?', og_content, re.IGNORECASE)
+            if not posts_match:
+                posts_match = re.search(r'게시물\s*([0-9.,천만]+)', og_content)
+            if posts_match:
+                profile_data['post_count'] = self.extract_numbers(posts_match.group(1))
+            
+            # 4. 팔로워 수 추출 - 영문 패턴: "48K Followers", 한글 패턴: "팔로워 48K"
+            logger.debug(f"followers - og_content: {og_content}")
+            followers_match = re.search(r'([0-9.,KMB]+)\s+Followers?', og_content, re.IGNORECASE)
+            if not followers_match:
+                followers_match = re.search(r'팔로워\s*([0-9.,천만KMB]+)', og_content)
+            if followers_match:
+                logger.debug(f"followers - 패턴 매칭: '{followers_match.group(1)}'")
+                profile_data['followers_count'] = self.extract_numbers(followers_match.group(1))
+            else:
+                logger.debug("followers - 패턴 매칭 실패")
+            
+            if debug_mode:
+                st.write(f"**추출된 게시물 수:** {profile_data['post_count']}")
+                st.write(f"**추출된 팔로워 수:** {profile_data['followers_count']}")
+        
+        # 5. 프로필 텍스트(bio) 추출 (1순위: JSON-LD, 2순위: meta description)
+        for json_data in head['ld_json']:
+            if isinstance(json_data, dict) and isinstance(json_data.get('description'), str):
+                profile_data['profile_text'] = json_data['description'].strip()
+                if debug_mode:
+                    st.write(f"**JSON-LD에서 추출된 bio:** {profile_data['profile_text']}")
+                break
+        
+        if not profile_data['profile_text']:
+            content = meta.get('description', '')
+            if debug_mode:
+                st.write(f"**Meta Description:** {content}")
+            
+            if content:
+                # HTML 엔티티로 인코딩된 따옴표 → 일반 따옴표 → 전체 내용 순으로 사용
+                bio_match = re.search(r'&quot;([^&]+)&quot;', content) or re.search(r':\s*"([^"]+)"', content)
+                if bio_match:
+                    profile_data['profile_text'] = bio_match.group(1).strip()
+                else:
+                    profile_data['profile_text'] = content.strip()
+                if debug_mode:
+                    st.write(f"**Meta Description에서 추출된 bio:** {profile_data['profile_text']}")
+        
+        # 6. Username 추출 (보조 정보: canonical → al:ios:url → title 순)
+        if debug_mode:
+            username = None
+            if head['canonical']:
+                username = head['canonical'].rstrip('/').split('/')[-1]
+            elif meta.get('al:ios:url'):
+                username_match = re.search(r'username=([^&]+)', meta['al:ios:url'])
+                username = username_match.group(1) if username_match else None
+            elif title_text:
+                username_match = re.search(r'\(@([^)]+)\)', title_text)
+                username = username_match.group(1) if username_match else None
+            st.write(f"**추출된 username:** {username}")
+            
+            st.write("**추출된 프로필 데이터:**")
+            for key, value in profile_data.items():
+                st.write(f"- {key}: {value}")
+        
+        return profile_data
+    
+    def cached_result(self, kind, url, max_age=None, force_refresh=False):
+        """캐시 결과 조회 (force_refresh 시 건너뜀), 없으면 None"""
+        if self.cache is None:
+            return None
+        if force_refresh:
+            self.cache.record_bypass(kind)
+            return None
+        return self.cache.get(kind, url, max_age)
+    
+    def crawl_fresh(self, kind, url, debug_mode=False):
+        """캐시를 거치지 않고 크롤링한 뒤 결과를 캐시에 저장 (kind: 'profile' | 'post')
+        
+        단계별 소요 시간(드라이버 시작, 요청 간격 대기, 페이지 이동, 대기, 추출 등)은 debug_info['timings']에 기록됩니다.
+        """
+        metrics.record_crawl_started(kind)
+        self._timer = StageTimer()
+        try:
+            if kind == 'profile':
+                result = self._crawl_profile_tiers(url, debug_mode)
+            else:
+                result = self._crawl_post_browser(url, debug_mode)
+            self.classify_outcome(kind, result)
+            with self._span('driver_check'):
+                self.supervise_driver(result)
+        finally:
+            timer, self._timer = self._timer, None
+        if not isinstance(result.get('debug_info'), dict):
+            result['debug_info'] = {}
+        result['debug_info']['timings'] = timer.as_dict()
+        metrics.record_crawl_finished(kind, result)
+        if self.fixture_recorder is not None and result.get('status') == 'success':
+            page_source = load_page_source(result.get('page_source') if kind == 'profile' else result.pop('page_source', None))
+            self.fixture_recorder.record(kind, url, page_source, result,
+                                         head=self.parse_page_head(page_source) if page_source else None,
+                                         source=result.get('tier', 'selenium'))
+        if self.cache is not None:
+            self.cache.put(kind, url, result)
+        return result
+    
+    def classify_outcome(self, kind, result):
+        """결과에 오류 분류(error_class) 기록 (실패했거나 값이 비었을 때만 브라우저의 현재 페이지 확인)
+        
+        로그인/차단/없는 페이지로 판별되면 성공으로 끝난 크롤링도 오류로 바꿔 빈 값이 저장되지 않게 합니다.
+        """
+        if result.get('status') == 'success' and not looks_empty(kind, result):
+            return None
+        page = ('', '', '')
+        if self.driver is not None and result.get('tier') != 'http':
+            try:
+                page = (self.driver.current_url, self.driver.title, self.driver.page_source)
+            except Exception as e:
+                logger.info(f"오류 분류용 페이지 확인 실패: {str(e)}")
+        error_class = classify_result(kind, result, *page)
+        if error_class:
+            result['error_class'] = error_class
+            if error_class in PAGE_ERROR_CLASSES and result.get('status') == 'success':
+                result['status'] = 'error'
+                result['error'] = ERROR_CLASS_LABELS[error_class]
+        return error_class
+    
+    def supervise_driver(self, result=None):
+        """크롤링 후 드라이버 상태를 확인하고 기준을 넘으면 재시작 (다음 크롤링에서 새 드라이버 사용)
+
+        메모리는 감시자가, 페이지 수/사용 시간은 풀이 판단합니다 (반납하지 않고 계속 쓰는 일괄 크롤링에도 적용).
+        """
+        if self.supervisor is None or self.driver is None:
+            return None
+        health = self.supervisor.check(self.driver)
+        if not health['restart'] and self.pool is not None:
+            health['restart'] = self.pool.recycle_reason(self.driver)
+        if health['restart']:
+            self.restart_driver(health['restart'])
+        if result is not None and isinstance(result.get('debug_info'), dict):
+            result['debug_info']['driver'] = health
+        return health
+    
+    def restart_driver(self, reason):
+        """현재 드라이버 폐기 (풀 드라이버는 폐기 후 풀이 빈 자리를 새 드라이버로 예열)"""
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        if self.supervisor is not None:
+            self.supervisor.record_restart(driver, reason)
+        try:
+            if self.pool is not None:
+                self.pool.release(driver, discard=True)
+            else:
+                driver.quit()
+        except Exception as e:
+            logger.warning(f"드라이버 재시작 중 오류: {str(e)}")
+    
+    def crawl_instagram_profile(self, url, debug_mode=False, max_age=None, force_refresh=False):
+        """Instagram 프로필 크롤링
+        
+        max_age(초, 기본: 캐시 TTL) 이내의 결과가 캐시에 있으면 브라우저 없이 반환하며,
+        force_refresh 또는 디버그 모드에서는 캐시를 건너뛰고 새로 크롤링합니다.
+        """
+        cached = self.cached_result('profile', url, max_age, force_refresh or debug_mode)
+        if cached is not None:
+            return cached
+        return self.crawl_fresh('profile', url, debug_mode)
+    
+    def _crawl_profile_tiers(self, url, debug_mode=False):
+        """HTTP 빠른 경로 → 필수 필드가 없으면 Selenium으로 승격"""
+        if self.http_fetcher is not None:
+            started = time.monotonic()
+            result = self._crawl_profile_http(url, debug_mode)
+            elapsed = time.monotonic() - started
+            if result is not None:
+                crawl_tier_stats.record('http', 'hit', elapsed)
+                result['debug_info']['tier_seconds'] = elapsed
+                return result
+            crawl_tier_stats.record('http', 'miss', elapsed)
+        
+        started = time.monotonic()
+        result = self._crawl_profile_selenium(url, debug_mode)
+        elapsed = time.monotonic() - started
+        crawl_tier_stats.record('selenium', 'hit' if result['status'] == 'success' else 'miss', elapsed)
+        result['tier'] = 'selenium'
+        if 'debug_info' in result:
+            result['debug_info']['tier'] = 'selenium'
+            result['debug_info']['tier_seconds'] = elapsed
+        return result
+    
+    def _crawl_profile_http(self, url, debug_mode=False):
+        """초기 HTML 응답의 og 메타 태그로 프로필 추출 (필수 필드 누락/실패 시 None)"""
+        try:
+            with self._span('pacing'):
+                self.pacer.wait()
+            with self._span('http_fetch'):
+                page_source, final_url = self.http_fetcher.fetch(self.resolve_url(url))
+            with self._span('extraction'):
+                head = self.parse_page_head(page_source)
+                profile_data = self.extract_profile_data(page_source, head=head)
+        except Exception as e:
+            logger.info(f"HTTP 빠른 경로 실패, Selenium으로 전환: {str(e)}")
+            return None
+        
+        missing = [field for field in HTTP_REQUIRED_PROFILE_FIELDS if not profile_data.get(field)]
+        if missing:
+            if debug_mode:
+                st.info(f"ℹ️ HTTP 응답에 필수 필드 없음 ({', '.join(missing)}) - 브라우저 크롤링으로 전환합니다")
+            return None
+        
+        if debug_mode:
+            st.write("⚡ **HTTP 빠른 경로로 프로필을 가져왔습니다.**")
+            st.write("**추출된 프로필 데이터:**")
+            for key, value in profile_data.items():
+                st.write(f"- {key}: {value}")
+        
+        return {
+            'url': url,
+            'profile_image_url': profile_data['profile_image_url'],
+            'influencer_name': profile_data['influencer_name'],
+            'post_count': profile_data['post_count'],
+            'followers_count': profile_data['followers_count'],
+            'profile_text': profile_data['profile_text'],
+            'status': 'success',
+            'tier': 'http',
+            'page_source': self._keep_page_source(page_source),
+            'debug_info': {
+                'current_url': final_url,
+                'page_title': head['title'],
+                'page_source_length': len(page_source),
+                'tier': 'http',
+                'crawled_at': datetime.now().isoformat()
+            },
+            'raw_profile_data': profile_data
+        }
+    
+    def _crawl_profile_selenium(self, url, debug_mode=False):
+        """Selenium으로 Instagram 프로필 크롤링"""
         try:
             if not self.driver:
                 self.setup_driver()
@@ -241,329 +1396,84 @@ class InstagramCrawler:
                 "userAgent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1"
             })
             
-            self.driver.get(url)
-            
-            # 랜덤 대기 시간 (3-7초)
-            wait_time = random.uniform(3, 7)
-            time.sleep(wait_time)
-            
-            # 자연스러운 사용자 행동 시뮬레이션
-            self.simulate_human_behavior()
-            
-            # 추가 랜덤 지연
-            self.random_delay(1, 3)
+            deadline = self._navigate(url, kind='profile')
             
             # 디버그 모드일 때 페이지 정보 출력
             if debug_mode:
                 st.write("🔍 **디버그 정보:**")
                 st.write(f"현재 URL: {self.driver.current_url}")
                 st.write(f"페이지 제목: {self.driver.title}")
-                st.write(f"페이지 소스 길이: {len(self.driver.page_source)}")
             
-            # 페이지 로딩 대기 (여러 방법으로 시도)
-            try:
-                # 1순위: main 태그 대기 (Instagram 최신 버전에서는 없을 수 있음)
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "main"))
-                )
-                if debug_mode:
-                    st.write("✅ main 태그 발견")
-            except TimeoutException:
+            # 네트워크 응답 캡처 모드: 페이지가 받은 JSON에서 정확한 카운트 수집
+            capture = None
+            captured_counts = {}
+            if self.capture_network:
+                capture = NetworkCapture(self.driver, self.collect_network_events)
+                with self._span('network_capture'):
+                    captured_counts = capture.wait_for_counts(
+                        PROFILE_COUNT_PATHS, deadline, max_wait=self.capture_wait,
+                        match_keys=PROFILE_MATCH_KEYS, match_value=username_from_url(url)
+                    )
                 if debug_mode:
-                    st.info("ℹ️ main 태그 없음 (Instagram 최신 UI 구조)")
-                
+                    st.write(f"**네트워크 응답에서 추출된 카운트:** {captured_counts}")
+            
+            # 캡처로 카운트를 모두 얻었으면 DOM 대기 생략 (메타 태그는 초기 HTML에 포함)
+            if len(captured_counts) < len(PROFILE_COUNT_PATHS):
+                # 페이지 준비 대기 (og:description 메타 태그 또는 main 태그가 나타나면 즉시 진행)
                 try:
-                    # 2순위: body 태그 대기
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
+                    with self._span('wait'):
+                        self.waits.wait_for(self.driver, 'profile', deadline)
                     if debug_mode:
-                        st.write("✅ body 태그 발견")
+                        st.write("✅ 프로필 준비 신호 발견 (og:description / main)")
                 except TimeoutException:
-                    if debug_mode:
-                        st.warning("⚠️ body 태그도 찾을 수 없음")
-                    # 3순위: html 태그라도 확인
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.TAG_NAME, "html"))
-                        )
-                        if debug_mode:
-                            st.write("✅ html 태그 발견")
-                    except TimeoutException:
+                    # 준비 신호가 없어도 문서가 로드되었으면 있는 정보로 추출 시도
+                    if not self.driver.find_elements(By.TAG_NAME, "body"):
                         if debug_mode:
-                            st.error("❌ html 태그도 찾을 수 없음 - 페이지 로딩 실패")
+                            st.error("❌ body 태그도 찾을 수 없음 - 페이지 로딩 실패")
                         raise TimeoutException("페이지 로딩 시간 초과")
+                    if debug_mode:
+                        st.info("ℹ️ 준비 신호 없음 - 현재 페이지 내용으로 추출합니다")
+                
+                # 메타 정보 추출 전 사용자 행동 시뮬레이션
+                with self._span('human_simulation'):
+                    self.simulate_human_behavior()
             
-            # 추가 대기 시간 (Instagram의 동적 로딩을 위해)
-            time.sleep(random.uniform(2, 4))
-            
-            # 메타 정보 추출 전 추가 사용자 행동 시뮬레이션
-            self.simulate_human_behavior()
+            # 페이지 소스를 한 번만 가져와서 모든 필드를 로컬에서 파싱
+            with self._span('extraction'):
+                page_source = self.driver.page_source
             
             # 디버그 모드일 때 페이지 상태 확인
             if debug_mode:
                 st.write("🔍 **페이지 상태 확인:**")
                 st.write(f"현재 URL: {self.driver.current_url}")
-                st.write(f"페이지 제목: {self.driver.title}")
-                
-                # 메타 태그 존재 여부 확인
-                try:
-                    og_image = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-                    st.write("✅ og:image 메타 태그 존재")
-                except:
-                    st.warning("⚠️ og:image 메타 태그 없음")
-                
-                try:
-                    og_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:description"]')
-                    st.write("✅ og:description 메타 태그 존재")
-                except:
-                    st.warning("⚠️ og:description 메타 태그 없음")
-                
-                try:
-                    title = self.driver.find_element(By.TAG_NAME, 'title')
-                    st.write(f"✅ title 태그: {title.text}")
-                except:
-                    st.warning("⚠️ title 태그 없음")
-            
-            # 프로필 정보 추출
-            profile_data = {
-                'profile_image_url': '',
-                'influencer_name': '',
-                'post_count': 0,
-                'followers_count': 0,
-                'profile_text': ''
-            }
+                st.write(f"페이지 소스 길이: {len(page_source)}")
             
             try:
-                # 1. 프로필 이미지 URL 추출 (1순위: og:image)
-                try:
-                    og_image = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-                    profile_data['profile_image_url'] = og_image.get_attribute('content')
-                    if debug_mode:
-                        st.write(f"**프로필 이미지 URL:** {profile_data['profile_image_url']}")
-                except Exception as e:
-                    if debug_mode:
-                        st.warning(f"og:image 추출 실패: {str(e)}")
-                
-                # 2. 사용자 이름 추출 (1순위: title, 2순위: og:description)
-                try:
-                    # 1순위: title에서 "이름 (@username)" 패턴 추출
-                    title_element = self.driver.find_element(By.TAG_NAME, 'title')
-                    title_text = title_element.text
-                    
-                    if debug_mode:
-                        st.write(f"**Title:** {title_text}")
-                    
-                    if title_text:
-                        import re
-                        # "Kim Hana (@she_tasteslikehappiness) • Instagram photos and videos" 패턴
-                        name_match = re.search(r'^([^(]+)\s*\(@[^)]+\)', title_text)
-                        if name_match:
-                            profile_data['influencer_name'] = name_match.group(1).strip()
-                            if debug_mode:
-                                st.write(f"**Title에서 추출된 이름:** {profile_data['influencer_name']}")
-                except Exception as e:
-                    if debug_mode:
-                        st.warning(f"Title에서 이름 추출 실패: {str(e)}")
-                
-                # 2순위: og:description에서 이름 추출 (여러 패턴 시도)
-                if not profile_data['influencer_name']:
-                    try:
-                        og_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:description"]')
-                        og_content = og_description.get_attribute('content')
-                        
-                        if debug_mode:
-                            st.write(f"**OG Description:** {og_content}")
-                        
-                        if og_content:
-                            import re
-                            
-                            # 패턴 1: "게시물 885개 - 이름(@username)님의 Instagram" 형식
-                            name_match = re.search(r'게시물\s+\d+개\s*-\s*([^(]+)\s*\(@[^)]+\)', og_content)
-                            if name_match:
-                                profile_data['influencer_name'] = name_match.group(1).strip()
-                                if debug_mode:
-                                    st.write(f"**OG Description에서 추출된 이름 (패턴1):** {profile_data['influencer_name']}")
-                            
-                            # 패턴 2: "from 이름 (@username)" 형식 (기존)
-                            if not profile_data['influencer_name']:
-                                name_match = re.search(r'from\s+([^(]+)\s*\(@[^)]+\)', og_content, re.IGNORECASE)
-                                if name_match:
-                                    profile_data['influencer_name'] = name_match.group(1).strip()
-                                    if debug_mode:
-                                        st.write(f"**OG Description에서 추출된 이름 (패턴2):** {profile_data['influencer_name']}")
-                            
-                            # 패턴 3: "이름(@username)님의 Instagram" 형식
-                            if not profile_data['influencer_name']:
-                                name_match = re.search(r'([^(]+)\s*\(@[^)]+\)님의\s+Instagram', og_content)
-                                if name_match:
-                                    profile_data['influencer_name'] = name_match.group(1).strip()
-                                    if debug_mode:
-                                        st.write(f"**OG Description에서 추출된 이름 (패턴3):** {profile_data['influencer_name']}")
-                                        
-                    except Exception as e:
-                        if debug_mode:
-                            st.warning(f"OG Description에서 이름 추출 실패: {str(e)}")
-                
-                # 3. 게시물 수 추출 (og:description에서)
-                try:
-                    og_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:description"]')
-                    og_content = og_description.get_attribute('content')
-                    
-                    if og_content:
-                        import re
-                        # 영문 패턴: "885 Posts"
-                        posts_match = re.search(r'([0-9.,KMB]+)\s+Posts?', og_content, re.IGNORECASE)
-                        if posts_match:
-                            profile_data['post_count'] = self.extract_numbers(posts_match.group(1))
-                        else:
-                            # 한글 패턴: "게시물 885"
-                            posts_match = re.search(r'게시물\s*([0-9.,천만]+)', og_content)
-                            if posts_match:
-                                profile_data['post_count'] = self.extract_numbers(posts_match.group(1))
-                        
-                        if debug_mode:
-                            st.write(f"**추출된 게시물 수:** {profile_data['post_count']}")
-                except Exception as e:
-                    if debug_mode:
-                        st.warning(f"게시물 수 추출 실패: {str(e)}")
-                
-                # 4. 팔로워 수 추출 (og:description에서)
-                try:
-                    og_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:description"]')
-                    og_content = og_description.get_attribute('content')
-                    
-                    if og_content:
-                        import re
-                        print(f"DEBUG followers - og_content: {og_content}")
-                        
-                        # 영문 패턴: "48K Followers"
-                        followers_match = re.search(r'([0-9.,KMB]+)\s+Followers?', og_content, re.IGNORECASE)
-                        if followers_match:
-                            raw_followers = followers_match.group(1)
-                            print(f"DEBUG followers - 영문 패턴 매칭: '{raw_followers}'")
-                            profile_data['followers_count'] = self.extract_numbers(raw_followers)
-                        else:
-                            # 한글 패턴: "팔로워 48K"
-                            followers_match = re.search(r'팔로워\s*([0-9.,천만KMB]+)', og_content)
-                            if followers_match:
-                                raw_followers = followers_match.group(1)
-                                print(f"DEBUG followers - 한글 패턴 매칭: '{raw_followers}'")
-                                profile_data['followers_count'] = self.extract_numbers(raw_followers)
-                            else:
-                                print("DEBUG followers - 패턴 매칭 실패")
-                        
-                        if debug_mode:
-                            st.write(f"**추출된 팔로워 수:** {profile_data['followers_count']}")
-                except Exception as e:
-                    if debug_mode:
-                        st.warning(f"팔로워 수 추출 실패: {str(e)}")
-                
-                # 5. 프로필 텍스트(bio) 추출 (1순위: JSON-LD, 2순위: meta description)
-                try:
-                    # 1순위: JSON-LD 스크립트에서 description 추출
-                    json_scripts = self.driver.find_elements(By.CSS_SELECTOR, 'script[type="application/ld+json"]')
-                    for script in json_scripts:
-                        try:
-                            import json
-                            json_data = json.loads(script.get_attribute('innerHTML'))
-                            if isinstance(json_data, dict) and 'description' in json_data:
-                                profile_data['profile_text'] = json_data['description'].strip()
-                                if debug_mode:
-                                    st.write(f"**JSON-LD에서 추출된 bio:** {profile_data['profile_text']}")
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    if debug_mode:
-                        st.warning(f"JSON-LD bio 추출 실패: {str(e)}")
-                
-                # 2순위: meta description에서 bio 추출 (전체 내용 사용)
-                if not profile_data['profile_text']:
-                    try:
-                        meta_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[name="description"]')
-                        content = meta_description.get_attribute('content')
-                        
-                        if debug_mode:
-                            st.write(f"**Meta Description:** {content}")
-                        
-                        if content:
-                            import re
-                            # HTML 엔티티로 인코딩된 따옴표 안의 내용 추출 시도
-                            bio_match = re.search(r'&quot;([^&]+)&quot;', content)
-                            if bio_match:
-                                profile_data['profile_text'] = bio_match.group(1).strip()
-                                if debug_mode:
-                                    st.write(f"**Meta Description에서 추출된 bio (따옴표):** {profile_data['profile_text']}")
-                            else:
-                                # 일반 따옴표 안의 내용 추출 시도
-                                bio_match = re.search(r':\s*"([^"]+)"', content)
-                                if bio_match:
-                                    profile_data['profile_text'] = bio_match.group(1).strip()
-                                    if debug_mode:
-                                        st.write(f"**Meta Description에서 추출된 bio (일반 따옴표):** {profile_data['profile_text']}")
-                                else:
-                                    # 따옴표 패턴이 없으면 전체 Meta Description을 profile_text로 사용
-                                    profile_data['profile_text'] = content.strip()
-                                    if debug_mode:
-                                        st.write(f"**Meta Description 전체를 profile_text로 사용:** {profile_data['profile_text']}")
-                            
-                    except Exception as e:
-                        if debug_mode:
-                            st.warning(f"Meta Description bio 추출 실패: {str(e)}")
-                
-                # 6. Username 추출 (보조 정보)
-                username = None
-                try:
-                    # 1순위: canonical link에서 추출
-                    canonical_link = self.driver.find_element(By.CSS_SELECTOR, 'link[rel="canonical"]')
-                    canonical_url = canonical_link.get_attribute('href')
-                    if canonical_url:
-                        username = canonical_url.rstrip('/').split('/')[-1]
-                        if debug_mode:
-                            st.write(f"**Canonical에서 추출된 username:** {username}")
-                except:
-                    try:
-                        # 2순위: al:ios:url에서 추출
-                        ios_url = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="al:ios:url"]')
-                        ios_content = ios_url.get_attribute('content')
-                        if ios_content:
-                            import re
-                            username_match = re.search(r'username=([^&]+)', ios_content)
-                            if username_match:
-                                username = username_match.group(1)
-                                if debug_mode:
-                                    st.write(f"**iOS URL에서 추출된 username:** {username}")
-                    except:
-                        try:
-                            # 3순위: title의 (@username) 괄호 안에서 추출
-                            title_element = self.driver.find_element(By.TAG_NAME, 'title')
-                            title_text = title_element.text
-                            if title_text:
-                                import re
-                                username_match = re.search(r'\(@([^)]+)\)', title_text)
-                                if username_match:
-                                    username = username_match.group(1)
-                                    if debug_mode:
-                                        st.write(f"**Title에서 추출된 username:** {username}")
-                        except:
-                            pass
-                
-                if debug_mode:
-                    st.write("**추출된 프로필 데이터:**")
-                    for key, value in profile_data.items():
-                        st.write(f"- {key}: {value}")
-                        
+                with self._span('extraction'):
+                    profile_data = self.extract_profile_data(page_source, debug_mode)
             except Exception as e:
                 if debug_mode:
                     st.warning(f"프로필 데이터 추출 중 오류: {str(e)}")
+                profile_data = {
+                    'profile_image_url': '',
+                    'influencer_name': '',
+                    'post_count': 0,
+                    'followers_count': 0,
+                    'profile_text': ''
+                }
+            
+            # 네트워크 응답의 정확한 정수 카운트가 있으면 og:description의 반올림 값 대체
+            if capture is not None:
+                captured_counts = capture.counts(PROFILE_COUNT_PATHS, PROFILE_MATCH_KEYS, username_from_url(url))
+                profile_data.update(captured_counts)
             
-            # 페이지 소스와 디버그 정보 수집
-            page_source = self.driver.page_source
+            # 디버그 정보 수집
             debug_info = {
                 'current_url': self.driver.current_url,
                 'page_title': self.driver.title,
                 'page_source_length': len(page_source),
+                'network': summarize_network_events(capture.events if capture else self.collect_network_events()),
+                'captured_counts': captured_counts,
                 'crawled_at': datetime.now().isoformat()
             }
             
@@ -575,7 +1485,7 @@ class InstagramCrawler:
                 'followers_count': profile_data['followers_count'],
                 'profile_text': profile_data['profile_text'],
                 'status': 'success',
-                'page_source': page_source,
+                'page_source': self._keep_page_source(page_source),
                 'debug_info': debug_info,
                 'raw_profile_data': profile_data
             }
@@ -588,10 +1498,10 @@ class InstagramCrawler:
                 try:
                     st.write(f"현재 URL: {self.driver.current_url}")
                     st.write(f"페이지 제목: {self.driver.title}")
-                    st.write(f"페이지 소스 길이: {len(self.driver.page_source)}")
-                    
-                    # 페이지 소스 일부 확인
+                    # 페이지 소스는 한 번만 가져와 확인
                     page_source = self.driver.page_source
+                    st.write(f"페이지 소스 길이: {len(page_source)}")
+                    
                     if "instagram" in page_source.lower():
                         st.write("✅ Instagram 관련 내용 발견")
                     else:
@@ -640,7 +1550,80 @@ class InstagramCrawler:
                 'error': error_msg
             }
     
-    def crawl_instagram_post(self, url, debug_mode=False):
+    def collect_xpath_texts(self, patterns_by_key):
+        """여러 XPath 패턴을 브라우저 안에서 한 번에 평가하여 키별 후보 텍스트 목록 반환"""
+        if not any(patterns_by_key.values()):
+            return {}
+        try:
+            payload = self.driver.execute_script(XPATH_TEXTS_SCRIPT, json.dumps(patterns_by_key))
+            return json.loads(payload) if payload else {}
+        except Exception as e:
+            logger.warning(f"XPath 일괄 평가 실패: {str(e)}")
+            return {}
+    
+    def crawl_instagram_post(self, url, debug_mode=False, max_age=None, force_refresh=False):
+        """Instagram 포스트 크롤링 (캐시 적용 방식은 crawl_instagram_profile과 동일)"""
+        cached = self.cached_result('post', url, max_age, force_refresh or debug_mode)
+        if cached is not None:
+            return cached
+        return self.crawl_fresh('post', url, debug_mode)
+    
+    def parse_post_description(self, content):
+        """meta description("84 likes, 30 comments ...")에서 좋아요/댓글 수 추출"""
+        counts = {}
+        if not content:
+            return counts
+        like_match = re.search(r'(\d+)\s*likes?', content, re.IGNORECASE)
+        if like_match:
+            counts['likes'] = int(like_match.group(1))
+        comment_match = re.search(r'(\d+)\s*comments?', content, re.IGNORECASE)
+        if comment_match:
+            counts['comments'] = int(comment_match.group(1))
+        return counts
+    
+    def parse_post_count_texts(self, candidates):
+        """좋아요/댓글 후보 텍스트({'likes': [...], 'comments': [...]})에서 0보다 큰 첫 값 추출"""
+        counts = {}
+        for text in candidates.get('likes', []):
+            if 'likes' in text.lower() or '좋아요' in text:
+                like_match = re.search(r'([\d,]+)\s*likes?', text, re.IGNORECASE)
+                if like_match:
+                    likes = self.extract_numbers(like_match.group(1))
+                    if likes > 0:
+                        counts['likes'] = likes
+                        break
+        
+        for text in candidates.get('comments', []):
+            if 'comments' in text.lower() or '댓글' in text:
+                if 'view all' in text.lower():
+                    numbers = re.findall(r'View all (\d+)', text, re.IGNORECASE)
+                else:
+                    numbers = re.findall(r'(\d+)\s*comments?', text, re.IGNORECASE)
+                if numbers:
+                    comments = int(numbers[0])
+                    if comments > 0:
+                        counts['comments'] = comments
+                        break
+        return counts
+    
+    def extract_post_counts(self, page_source, head=None):
+        """저장된 page_source에서 포스트 좋아요/댓글 수 추출 (브라우저 없이, 리플레이용)
+        
+        라이브 크롤링과 같은 순서로 meta description을 먼저 보고, 없는 값은 span 텍스트 후보로 보완합니다.
+        """
+        head = head or self.parse_page_head(page_source)
+        counts = self.parse_post_description(head['meta'].get('description', ''))
+        if counts.get('likes', 0) == 0 or counts.get('comments', 0) == 0:
+            soup = BeautifulSoup(page_source, 'html.parser', parse_only=SoupStrainer('span'))
+            texts = [span.get_text(' ', strip=True) for span in soup.find_all('span')]
+            parsed = self.parse_post_count_texts({
+                'likes': texts if counts.get('likes', 0) == 0 else [],
+                'comments': texts if counts.get('comments', 0) == 0 else []
+            })
+            counts.update(parsed)
+        return {'likes': counts.get('likes', 0), 'comments': counts.get('comments', 0)}
+    
+    def _crawl_post_browser(self, url, debug_mode=False):
         """Instagram 포스트 크롤링 (모바일 버전 최적화)"""
         try:
             if not self.driver:
@@ -651,139 +1634,88 @@ class InstagramCrawler:
                 "userAgent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1"
             })
             
-            self.driver.get(url)
+            deadline = self._navigate(url, kind='post')
             
-            # 랜덤 대기 시간 (3-7초)
-            wait_time = random.uniform(3, 7)
-            time.sleep(wait_time)
-            
-            # 자연스러운 브라우저 동작 시뮬레이션
-            try:
-                # 페이지 스크롤 (자연스러운 사용자 행동)
-                self.driver.execute_script("window.scrollTo(0, 100);")
-                time.sleep(random.uniform(1, 2))
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(random.uniform(1, 2))
-            except:
-                pass
-            
-            # 페이지 로딩 대기 (타임아웃 증가)
-            WebDriverWait(self.driver, 25).until(
-                EC.presence_of_element_located((By.TAG_NAME, "main"))
-            )
-            
-            # 추가 대기 시간 (Instagram의 동적 로딩을 위해)
-            time.sleep(random.uniform(2, 4))
+            # 네트워크 응답 캡처 모드: 페이지가 받은 JSON에서 정확한 카운트 수집
+            capture = None
+            captured_counts = {}
+            if self.capture_network:
+                capture = NetworkCapture(self.driver, self.collect_network_events)
+                with self._span('network_capture'):
+                    captured_counts = capture.wait_for_counts(
+                        POST_COUNT_PATHS, deadline, max_wait=self.capture_wait,
+                        match_keys=POST_MATCH_KEYS, match_value=shortcode_from_url(url)
+                    )
             
-            # Meta 태그에서 데이터 추출 (가장 안정적인 방법)
-            likes = 0
-            comments = 0
+            likes = captured_counts.get('likes', 0)
+            comments = captured_counts.get('comments', 0)
             
-            try:
-                # meta description 태그 찾기
-                meta_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[name="description"]')
-                content = meta_description.get_attribute('content')
+            # 캡처로 카운트를 모두 얻지 못한 경우에만 DOM 대기 및 추출
+            if len(captured_counts) < len(POST_COUNT_PATHS):
+                # 페이지 준비 대기 (meta description 또는 main 태그가 나타나면 즉시 진행)
+                with self._span('wait'):
+                    self.waits.wait_for(self.driver, 'post', deadline)
                 
-                if content:
-                    import re
-                    # "84 likes, 30 comments" 패턴에서 추출
-                    # 좋아요 수 추출
-                    like_match = re.search(r'(\d+)\s*likes?', content, re.IGNORECASE)
-                    if like_match:
-                        likes = int(like_match.group(1))
-                    
-                    # 댓글 수 추출
-                    comment_match = re.search(r'(\d+)\s*comments?', content, re.IGNORECASE)
-                    if comment_match:
-                        comments = int(comment_match.group(1))
-                        
-            except Exception as e:
-                pass
-            
-            # Meta 태그에서 추출이 실패한 경우 기존 방식으로 시도
-            if likes == 0 or comments == 0:
-                # 자연스러운 사용자 행동 시뮬레이션
+                # 자연스러운 브라우저 동작 시뮬레이션
+                with self._span('human_simulation'):
+                    self.simulate_human_behavior()
+                
+                # Meta 태그에서 데이터 추출 (가장 안정적인 방법)
                 try:
-                    # 마우스 움직임 시뮬레이션
-                    from selenium.webdriver.common.action_chains import ActionChains
-                    actions = ActionChains(self.driver)
-                    actions.move_by_offset(100, 100).perform()
-                    time.sleep(random.uniform(0.5, 1.5))
-                    
-                    # 페이지 새로고침 (자연스러운 행동)
-                    self.driver.refresh()
-                    time.sleep(random.uniform(3, 5))
-                except:
+                    # meta description 태그 찾기
+                    with self._span('extraction'):
+                        meta_description = self.driver.find_element(By.CSS_SELECTOR, 'meta[name="description"]')
+                        described = self.parse_post_description(meta_description.get_attribute('content'))
+                    if 'likes' in described and 'likes' not in captured_counts:
+                        likes = described['likes']
+                    if 'comments' in described and 'comments' not in captured_counts:
+                        comments = described['comments']
+                        
+                except Exception as e:
                     pass
-                
-                # 좋아요 수 추출 - 기존 방식
-                if likes == 0:
+            
+                # Meta 태그에서 추출이 실패한 경우 기존 방식으로 시도
+                if likes == 0 or comments == 0:
+                    # 새로고침 대신 좋아요/댓글 요소가 렌더링될 때까지 남은 예산 안에서 대기
                     try:
-                        like_patterns = [
-                            "//span[contains(text(), 'likes')]",
-                            "//span[contains(text(), '좋아요')]",
-                            "//article//span[contains(text(), 'likes')]",
-                            "//main//span[contains(text(), 'likes')]",
-                        ]
-                        
-                        for pattern in like_patterns:
-                            try:
-                                elements = self.driver.find_elements(By.XPATH, pattern)
-                                for element in elements:
-                                    text = element.text.strip()
-                                    if 'likes' in text.lower() or '좋아요' in text:
-                                        import re
-                                        like_match = re.search(r'([\d,]+)\s*likes?', text, re.IGNORECASE)
-                                        if like_match:
-                                            likes = self.extract_numbers(like_match.group(1))
-                                            break
-                                if likes > 0:
-                                    break
-                            except:
-                                continue
-                    except Exception as e:
+                        with self._span('wait'):
+                            self.waits.wait_for(self.driver, 'post_counts', deadline, max_wait=5)
+                    except TimeoutException:
                         pass
                 
-                # 댓글 수 추출 - 기존 방식
-                if comments == 0:
-                    try:
-                        comment_patterns = [
-                            "//span[contains(text(), 'View all') and contains(text(), 'comments')]",
-                            "//span[contains(text(), 'comments')]",
-                            "//article//span[contains(text(), 'comments')]",
-                            "//main//span[contains(text(), 'comments')]",
-                        ]
+                    # 좋아요/댓글 후보 텍스트를 execute_script 한 번으로 수집 (요소별 왕복 제거)
+                    with self._span('extraction'):
+                        candidates = self.collect_xpath_texts({
+                            'likes': LIKE_XPATH_PATTERNS if likes == 0 else [],
+                            'comments': COMMENT_XPATH_PATTERNS if comments == 0 else []
+                        })
                         
-                        for pattern in comment_patterns:
-                            try:
-                                elements = self.driver.find_elements(By.XPATH, pattern)
-                                for element in elements:
-                                    text = element.text.strip()
-                                    if 'comments' in text.lower() or '댓글' in text:
-                                        import re
-                                        if 'view all' in text.lower():
-                                            numbers = re.findall(r'View all (\d+)', text, re.IGNORECASE)
-                                            if numbers:
-                                                comments = int(numbers[0])
-                                                break
-                                        else:
-                                            numbers = re.findall(r'(\d+)\s*comments?', text, re.IGNORECASE)
-                                            if numbers:
-                                                comments = int(numbers[0])
-                                                break
-                                if comments > 0:
-                                    break
-                            except:
-                                continue
-                    except Exception as e:
-                        pass
+                        # 좋아요/댓글 수 추출 - 로컬 정규식 파싱
+                        parsed = self.parse_post_count_texts(candidates)
+                    likes = parsed.get('likes', likes)
+                    comments = parsed.get('comments', comments)
             
-            return {
+            # 늦게 도착한 응답까지 반영 (캡처 값이 DOM 값보다 정확)
+            if capture is not None:
+                captured_counts = capture.counts(POST_COUNT_PATHS, POST_MATCH_KEYS, shortcode_from_url(url))
+                likes = captured_counts.get('likes', likes)
+                comments = captured_counts.get('comments', comments)
+            
+            result = {
                 'url': url,
                 'likes': likes,
                 'comments': comments,
-                'status': 'success'
+                'status': 'success',
+                'debug_info': {
+                    'current_url': self.driver.current_url,
+                    'network': summarize_network_events(capture.events if capture else self.collect_network_events()),
+                    'captured_counts': captured_counts,
+                    'crawled_at': datetime.now().isoformat()
+                }
             }
+            if self.fixture_recorder is not None:
+                result['page_source'] = self.driver.page_source  # 픽스처 기록 후 crawl_fresh에서 제거
+            return result
             
         except TimeoutException:
             error_msg = '페이지 로딩 시간 초과'
@@ -803,11 +1735,33 @@ class InstagramCrawler:
                 'error': str(e)
             }
     
-    def batch_crawl_instagram_posts(self, excel_data, progress_callback=None, progress_bar=None, progress_text=None, status_text=None):
-        """엑셀 데이터로부터 여러 Instagram 포스트 일괄 크롤링"""
+    def batch_crawl_instagram_posts(self, excel_data, progress_callback=None, progress_bar=None, progress_text=None, status_text=None, engine=None, on_result=None, force_refresh=False, stage_stats=None, progress=None):
+        """엑셀 데이터로부터 여러 Instagram 포스트 일괄 크롤링 (engine이 주어지면 CrawlEngine으로 동시 실행)
+        
+        on_result(position, result)는 각 행이 끝날 때마다 호출됩니다 (position: excel_data 내 행 순번).
+        stage_stats(StageStats)가 주어지면 크롤링별 단계 소요 시간을 집계합니다.
+        progress(StreamlitProgress)가 주어지면 progress_bar/progress_text/status_text 대신 묶어서 갱신합니다.
+        """
+        if engine is not None:
+            return self._batch_crawl_posts_with_engine(excel_data, engine, progress_bar, progress_text, status_text, on_result, force_refresh, stage_stats, progress)
+        
         results = []
         total_posts = len(excel_data)
         
+        def add_result(row_result):
+            results.append(row_result)
+            if progress is not None:
+                progress.advance(row_result['name'], row_result['status'], row_result.get('error', ''))
+            if on_result:
+                try:
+                    on_result(len(results) - 1, row_result)
+                except Exception as e:
+                    logger.warning(f"결과 콜백 실패: {str(e)}")
+        
+        # 포스트 간 쿨다운 (요청 시작 간격 30-60초 랜덤 - Instagram 감지 우회)
+        cooldown_pacer = RequestPacer(30, 60)
+        cooldown_pacer.wait()
+        
         for index, row in excel_data.iterrows():
             # 빈 셀 처리 (NaN 값 처리)
             name = row.get('name', f'Post_{index+1}')
@@ -820,7 +1774,7 @@ class InstagramCrawler:
             
             # URL 유효성 검사
             if not url or not isinstance(url, str) or 'instagram.com' not in url:
-                results.append({
+                add_result({
                     'name': name,
                     'url': url if isinstance(url, str) else '',
                     'likes': 0,
@@ -832,10 +1786,12 @@ class InstagramCrawler:
             
             try:
                 # 안전한 진행률 업데이트 (크롤링 시작 전)
-                if progress_callback and progress_bar and progress_text and status_text:
+                if progress is not None:
+                    progress.status(f"크롤링 중: {name}")
+                elif progress_callback and progress_bar and progress_text and status_text:
                     try:
-                        progress = min(max((index + 1) / total_posts, 0.0), 1.0)
-                        safe_streamlit_update(progress_bar, progress_text, status_text, progress, index + 1, total_posts, f"크롤링 중: {name}")
+                        ratio = min(max((index + 1) / total_posts, 0.0), 1.0)
+                        safe_streamlit_update(progress_bar, progress_text, status_text, ratio, index + 1, total_posts, f"크롤링 중: {name}")
                     except Exception as e:
                         logger.warning(f"진행률 업데이트 실패: {str(e)}")
                 elif progress_callback:
@@ -845,36 +1801,54 @@ class InstagramCrawler:
                     except Exception as e:
                         logger.warning(f"기존 진행률 콜백 실패: {str(e)}")
                 
-                # 크롤링 실행
-                result = self.crawl_instagram_post(url, debug_mode=False)
+                # 크롤링 실행 (차단기가 열려 있으면 탐침 차례까지 대기하거나 보류)
+                result = self.cached_result('post', url, force_refresh=force_refresh)
+                if result is None:
+                    if crawl_breaker.acquire():
+                        try:
+                            result = self.crawl_fresh('post', url)
+                        except Exception as e:
+                            result = {'url': url, 'status': 'error', 'error': str(e)}
+                        crawl_breaker.record(result)
+                    else:
+                        result = crawl_breaker.deferred_result(url)
+                if stage_stats is not None:
+                    stage_stats.add_result(result)
                 
-                results.append({
+                add_result({
                     'name': name,
                     'url': url,
-                    'likes': result['likes'],
-                    'comments': result['comments'],
+                    'likes': result.get('likes', 0),
+                    'comments': result.get('comments', 0),
                     'status': result['status'],
-                    'error': result.get('error', '')
+                    'error': result.get('error', ''),
+                    'error_class': result.get('error_class', '')
                 })
                 
-                # 쿨다운 시간 (30-60초 랜덤 - Instagram 감지 우회를 위해 증가)
+                # 쿨다운 (이번 요청 시작 시점부터 남은 간격만 대기, 보류/캐시 항목은 요청하지 않았으므로 생략)
+                requested = result['status'] != 'deferred' and not result.get('cache')
                 if index < total_posts - 1:  # 마지막 포스트가 아닌 경우에만
-                    cooldown_time = random.randint(30, 60)
-                    if progress_callback and progress_bar and progress_text and status_text:
-                        try:
-                            progress = min(max((index + 1) / total_posts, 0.0), 1.0)
-                            safe_streamlit_update(progress_bar, progress_text, status_text, progress, index + 1, total_posts, f"쿨다운 중... {cooldown_time}초 대기")
-                        except Exception as e:
-                            logger.warning(f"쿨다운 진행률 업데이트 실패: {str(e)}")
-                    elif progress_callback:
-                        try:
-                            progress_callback(index + 1, total_posts, f"쿨다운 중... {cooldown_time}초 대기")
-                        except Exception as e:
-                            logger.warning(f"쿨다운 진행률 콜백 실패: {str(e)}")
-                    time.sleep(cooldown_time)
+                    if requested:
+                        cooldown_time = int(cooldown_pacer.delay())
+                        if progress is not None:
+                            progress.status(f"쿨다운 중... {cooldown_time}초 대기")
+                        elif progress_callback and progress_bar and progress_text and status_text:
+                            try:
+                                ratio = min(max((index + 1) / total_posts, 0.0), 1.0)
+                                safe_streamlit_update(progress_bar, progress_text, status_text, ratio, index + 1, total_posts, f"쿨다운 중... {cooldown_time}초 대기")
+                            except Exception as e:
+                                logger.warning(f"쿨다운 진행률 업데이트 실패: {str(e)}")
+                        elif progress_callback:
+                            try:
+                                progress_callback(index + 1, total_posts, f"쿨다운 중... {cooldown_time}초 대기")
+                            except Exception as e:
+                                logger.warning(f"쿨다운 진행률 콜백 실패: {str(e)}")
+                        cooldown_pacer.wait()
                 else:
                     # 마지막 포스트 완료
-                    if progress_callback and progress_bar and progress_text and status_text:
+                    if progress is not None:
+                        progress.finish("크롤링 완료!")
+                    elif progress_callback and progress_bar and progress_text and status_text:
                         try:
                             safe_streamlit_update(progress_bar, progress_text, status_text, 1.0, total_posts, total_posts, "크롤링 완료!")
                         except Exception as e:
@@ -886,7 +1860,7 @@ class InstagramCrawler:
                             logger.warning(f"완료 진행률 콜백 실패: {str(e)}")
                     
             except Exception as e:
-                results.append({
+                add_result({
                     'name': name,
                     'url': url,
                     'likes': 0,
@@ -898,6 +1872,71 @@ class InstagramCrawler:
         
         return results
     
+    def _batch_crawl_posts_with_engine(self, excel_data, engine, progress_bar=None, progress_text=None, status_text=None, on_result=None, force_refresh=False, stage_stats=None, progress=None):
+        """CrawlEngine으로 포스트를 동시 크롤링하고 엑셀 행 순서대로 결과 반환"""
+        total_posts = len(excel_data)
+        results_by_position = {}
+        jobs = []
+        
+        for position, (index, row) in enumerate(excel_data.iterrows()):
+            name = row.get('name', f'Post_{index+1}')
+            if pd.isna(name):
+                name = f'Post_{index+1}'
+            url = row.get('instagram_link', '')
+            if pd.isna(url):
+                url = ''
+            
+            if not url or not isinstance(url, str) or 'instagram.com' not in url:
+                results_by_position[position] = {
+                    'name': name,
+                    'url': url if isinstance(url, str) else '',
+                    'likes': 0,
+                    'comments': 0,
+                    'status': 'error',
+                    'error': 'Invalid URL or Empty Cell'
+                }
+                if on_result:
+                    try:
+                        on_result(position, results_by_position[position])
+                    except Exception as e:
+                        logger.warning(f"결과 콜백 실패: {str(e)}")
+                if progress is not None:
+                    progress.advance(name, 'error', 'Invalid URL or Empty Cell')
+                continue
+            jobs.append({'kind': 'post', 'url': url, 'name': name, 'position': position, 'force_refresh': force_refresh})
+        
+        # 완료되는 순서대로 결과 수집 및 진행률 갱신
+        for item in engine.stream(jobs):
+            job, result = item['job'], item['result']
+            if stage_stats is not None:
+                stage_stats.add_result(result)
+            results_by_position[job['position']] = {
+                'name': job['name'],
+                'url': job['url'],
+                'likes': result.get('likes', 0),
+                'comments': result.get('comments', 0),
+                'status': result.get('status', 'error'),
+                'error': result.get('error', ''),
+                'error_class': result.get('error_class', '')
+            }
+            if on_result:
+                try:
+                    on_result(job['position'], results_by_position[job['position']])
+                except Exception as e:
+                    logger.warning(f"결과 콜백 실패: {str(e)}")
+            if progress is not None:
+                progress.advance(job['name'], results_by_position[job['position']]['status'], results_by_position[job['position']]['error'])
+            elif progress_bar and progress_text and status_text:
+                try:
+                    done = len(results_by_position)
+                    safe_streamlit_update(progress_bar, progress_text, status_text, min(done / total_posts, 1.0), done, total_posts, f"완료: {job['name']}")
+                except Exception as e:
+                    logger.warning(f"진행률 업데이트 실패: {str(e)}")
+        
+        if progress is not None:
+            progress.finish()
+        return [results_by_position[position] for position in sorted(results_by_position)]
+    
     def close_driver(self):
         """드라이버 종료 및 백그라운드 태스크 정리"""
         # 백그라운드 태스크 정리
@@ -908,10 +1947,13 @@ class InstagramCrawler:
                 logger.warning(f"백그라운드 태스크 취소 실패: {str(e)}")
         self._background_tasks.clear()
         
-        # 드라이버 종료
+        # 드라이버 종료 (풀 드라이버는 반납)
         if self.driver:
             try:
-                self.driver.quit()
+                if self.pool is not None:
+                    self.pool.release(self.driver)
+                else:
+                    self.driver.quit()
             except Exception as e:
                 logger.warning(f"드라이버 종료 중 오류: {str(e)}")
             finally:
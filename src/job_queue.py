@@ -0,0 +1,245 @@
+import os
+import json
+import uuid
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import psycopg2  # 선택 의존성 (Postgres 작업 큐를 쓸 때만 필요)
+except ImportError:
+    psycopg2 = None
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태: queued → running → done/failed, queued 상태에서만 cancelled
+ACTIVE_STATUSES = ["queued", "running"]
+FINISHED_STATUSES = ["done", "failed", "cancelled"]
+
+JOB_COLUMNS = ("id, kind, params, status, submitted_by, worker_id, total, done, failed, message, summary, "
+               "created_at, started_at, heartbeat_at, finished_at")
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'queued',
+    submitted_by TEXT,
+    worker_id TEXT,
+    total INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    summary TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    heartbeat_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs (status, created_at);
+"""
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+class JobQueue:
+    """프로세스 밖 크롤링 작업 큐 공통 구현
+
+    UI는 작업(크롤링 세션 ID + 옵션)을 넣고 진행 레코드만 조회하며,
+    실제 크롤링은 워커 프로세스(python -m src.crawl_worker)가 작업을 하나씩 가져가 실행합니다.
+    백엔드별로 연결(_connect)과 작업 할당(claim)만 다릅니다.
+    """
+    placeholder = "?"
+
+    def _connect(self):
+        raise NotImplementedError
+
+    def _sql(self, sql: str) -> str:
+        return sql.replace("?", self.placeholder)
+
+    def _execute(self, sql: str, params: tuple = (), fetch: bool = False) -> List[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(self._sql(sql), params)
+            rows = self._fetch_rows(cursor) if fetch else []
+            if not fetch:
+                rows = [{'rowcount': cursor.rowcount}]
+            conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _fetch_rows(cursor) -> List[Dict[str, Any]]:
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _decode(row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        for field in ('params', 'summary'):
+            if isinstance(job.get(field), str):
+                job[field] = json.loads(job[field])
+        for field in ('created_at', 'started_at', 'heartbeat_at', 'finished_at'):
+            if isinstance(job.get(field), datetime):
+                job[field] = job[field].isoformat()
+        return job
+
+    def enqueue(self, kind: str, params: Dict[str, Any], total: int = 0, submitted_by: Optional[str] = None) -> str:
+        """작업 등록 후 작업 ID 반환 (kind: 'profile' 또는 'post')"""
+        job_id = uuid.uuid4().hex
+        self._execute(
+            "INSERT INTO crawl_jobs (id, kind, params, status, submitted_by, total, created_at) VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+            (job_id, kind, json.dumps(params, ensure_ascii=False), submitted_by, total, _now())
+        )
+        return job_id
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """가장 오래 기다린 queued 작업 하나를 running으로 바꾸고 반환 (없으면 None)"""
+        raise NotImplementedError
+
+    def heartbeat(self, job_id: str):
+        self._execute("UPDATE crawl_jobs SET heartbeat_at = ? WHERE id = ?", (_now(), job_id))
+
+    def update_progress(self, job_id: str, done: int, failed: int, total: Optional[int] = None, message: str = ''):
+        """진행 레코드 갱신 (하트비트 포함)"""
+        if total is None:
+            self._execute("UPDATE crawl_jobs SET done = ?, failed = ?, message = ?, heartbeat_at = ? WHERE id = ?",
+                          (done, failed, message, _now(), job_id))
+        else:
+            self._execute("UPDATE crawl_jobs SET done = ?, failed = ?, total = ?, message = ?, heartbeat_at = ? WHERE id = ?",
+                          (done, failed, total, message, _now(), job_id))
+
+    def finish(self, job_id: str, status: str, message: str = '', summary: Optional[Dict[str, Any]] = None):
+        self._execute(
+            "UPDATE crawl_jobs SET status = ?, message = ?, summary = ?, finished_at = ?, heartbeat_at = ? WHERE id = ?",
+            (status, message, json.dumps(summary, ensure_ascii=False, default=str) if summary is not None else None, _now(), _now(), job_id)
+        )
+
+    def requeue(self, job_id: str, message: str = ''):
+        """실행 중이던 작업을 다시 대기열로 (워커 종료 시, 세션 원장 덕분에 완료 항목은 다시 크롤링하지 않음)"""
+        self._execute("UPDATE crawl_jobs SET status = 'queued', worker_id = NULL, message = ? WHERE id = ? AND status = 'running'",
+                      (message, job_id))
+
+    def requeue_stale(self, stale_seconds: float) -> int:
+        """하트비트가 끊긴 running 작업을 queued로 되돌리고 개수 반환"""
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=stale_seconds)).isoformat()
+        rows = self._execute(
+            "UPDATE crawl_jobs SET status = 'queued', worker_id = NULL, message = ? WHERE status = 'running' AND heartbeat_at < ?",
+            ("워커 응답 없음 - 다시 대기", cutoff)
+        )
+        return rows[0]['rowcount'] if rows else 0
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 작업 취소 (이미 실행 중이면 False)"""
+        rows = self._execute("UPDATE crawl_jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'queued'",
+                             (_now(), job_id))
+        return bool(rows and rows[0]['rowcount'])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute(f"SELECT {JOB_COLUMNS} FROM crawl_jobs WHERE id = ?", (job_id,), fetch=True)
+        return self._decode(rows[0]) if rows else None
+
+    def list_jobs(self, limit: int = 20, submitted_by: Optional[str] = None, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (최신순)"""
+        conditions, params = [], []
+        if submitted_by:
+            conditions.append("submitted_by = ?")
+            params.append(submitted_by)
+        if kind:
+            conditions.append("kind = ?")
+            params.append(kind)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._execute(f"SELECT {JOB_COLUMNS} FROM crawl_jobs {where} ORDER BY created_at DESC LIMIT ?",
+                             tuple(params) + (limit,), fetch=True)
+        return [self._decode(row) for row in rows]
+
+    def active_session_ids(self, kind: Optional[str] = None) -> Set[str]:
+        """대기/실행 중인 작업이 맡은 크롤링 세션 ID (같은 세션을 앱에서 다시 재개하지 않도록)"""
+        sql = f"SELECT params FROM crawl_jobs WHERE status IN ({', '.join('?' for _ in ACTIVE_STATUSES)})"
+        params = tuple(ACTIVE_STATUSES)
+        if kind:
+            sql += " AND kind = ?"
+            params += (kind,)
+        rows = self._execute(sql, params, fetch=True)
+        return {job['params'].get('session_id') for job in map(self._decode, rows) if job['params'].get('session_id')}
+
+class SQLiteJobQueue(JobQueue):
+    """SQLite 파일 기반 작업 큐 (기본값, 같은 머신의 UI와 워커가 공유)"""
+    def __init__(self, path: str):
+        self.path = path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.execute("PRAGMA journal_mode=WAL")  # 워커가 쓰는 동안에도 UI 조회가 막히지 않도록
+                    conn.executescript(SQLITE_SCHEMA)
+                    self._schema_ready = True
+        return conn
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            conn.isolation_level = None
+            conn.execute("BEGIN IMMEDIATE")  # 쓰기 잠금을 먼저 잡아 두 워커가 같은 작업을 가져가지 않도록
+            try:
+                cursor = conn.execute(f"SELECT {JOB_COLUMNS} FROM crawl_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1")
+                rows = self._fetch_rows(cursor)
+                if not rows:
+                    conn.execute("COMMIT")
+                    return None
+                now = _now()
+                conn.execute("UPDATE crawl_jobs SET status = 'running', worker_id = ?, started_at = COALESCE(started_at, ?), heartbeat_at = ? WHERE id = ?",
+                             (worker_id, now, now, rows[0]['id']))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return self._decode(dict(rows[0], status='running', worker_id=worker_id))
+        finally:
+            conn.close()
+
+class PostgresJobQueue(JobQueue):
+    """Postgres crawl_jobs 테이블 기반 작업 큐 (여러 머신의 워커가 공유, crawl_jobs_schema.sql 필요)"""
+    placeholder = "%s"
+
+    def __init__(self, dsn: str):
+        if psycopg2 is None:
+            raise ImportError("Postgres 작업 큐에는 psycopg2가 필요합니다. (pip install psycopg2-binary)")
+        self.dsn = dsn
+
+    def _connect(self):
+        return psycopg2.connect(self.dsn)
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute(
+            f"""UPDATE crawl_jobs SET status = 'running', worker_id = ?, started_at = COALESCE(started_at, now()), heartbeat_at = now()
+                WHERE id = (SELECT id FROM crawl_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1 FOR UPDATE SKIP LOCKED)
+                RETURNING {JOB_COLUMNS}""",
+            (worker_id,), fetch=True
+        )
+        return self._decode(rows[0]) if rows else None
+
+def open_job_queue(url: str = None) -> JobQueue:
+    """CRAWLER_JOB_QUEUE URL로 작업 큐 생성 (sqlite:///경로 또는 postgresql://...)"""
+    url = url or os.getenv("CRAWLER_JOB_QUEUE", "sqlite:///crawl_jobs.sqlite3")
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresJobQueue(url)
+    return SQLiteJobQueue(url[len("sqlite:///"):] if url.startswith("sqlite:///") else url)
+
+# 전역 작업 큐 (UI와 워커가 같은 CRAWLER_JOB_QUEUE를 바라봐야 함, 생성 실패 시 백그라운드 실행 비활성)
+try:
+    job_queue: Optional[JobQueue] = open_job_queue()
+except ImportError as e:
+    logger.warning(str(e))
+    job_queue = None
@@ -0,0 +1,335 @@
+import os
+import time
+import bisect
+import logging
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# 크롤링 단계/DB 요청 지연 히스토그램 버킷(초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Optional[Dict[str, Any]]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in (labels or {}).items()))
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(key: LabelKey, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = "unknown"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {self.help_text}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        super().__init__(name, help_text)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return self.header() + [f"{self.name}_total{_format_labels(key)} {_format_value(value)}"
+                                for key, value in sorted(values.items())]
+
+class Gauge(_Metric):
+    """값을 직접 설정하거나, 수집 시점에 callback()으로 {labels 튜플: 값}을 계산하는 게이지"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, callback: Callable[[], Dict[LabelKey, float]] = None):
+        super().__init__(name, help_text)
+        self._values: Dict[LabelKey, float] = {}
+        self.callback = callback
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def remove(self, **labels):
+        with self._lock:
+            self._values.pop(_label_key(labels), None)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        if self.callback is not None:
+            try:
+                values.update(self.callback())
+            except Exception as e:
+                logger.debug(f"메트릭 수집 실패 ({self.name}): {str(e)}")
+        return self.header() + [f"{self.name}{_format_labels(key)} {_format_value(value)}"
+                                for key, value in sorted(values.items())]
+
+class CallbackCounter(Gauge):
+    """다른 컴포넌트가 이미 집계하는 누적값을 수집 시점에 읽어 카운터로 노출"""
+    kind = "counter"
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        return lines[:2] + [line.replace(self.name, f"{self.name}_total", 1) for line in lines[2:]]
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = sorted(buckets)
+        self._series: Dict[LabelKey, List[float]] = {}  # 버킷별 개수 + [합계, 개수]
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series_items = [(key, list(series)) for key, series in sorted(self._series.items())]
+        lines = self.header()
+        for key, series in series_items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', _format_value(bound))])} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', '+Inf')])} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(series[-2])}")
+        return lines
+
+class MetricsRegistry:
+    """메트릭 등록 및 OpenMetrics 텍스트 렌더링"""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self.register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str, callback=None) -> Gauge:
+        return self.register(Gauge(name, help_text, callback))
+
+    def histogram(self, name: str, help_text: str, buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help_text, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+# 크롤링
+crawls_started = registry.counter("crawler_crawls_started", "캐시를 거치지 않고 시작한 크롤링 수")
+crawls_finished = registry.counter("crawler_crawls_finished", "종료된 크롤링 수 (outcome, error_class별)")
+stage_seconds = registry.histogram("crawler_stage_seconds", "크롤링/저장 단계별 소요 시간(초)")
+queue_depth = registry.gauge("crawler_queue_depth", "작업/단계 대기열 길이")
+
+# Supabase
+supabase_requests = registry.counter("supabase_requests", "Supabase 요청 수 (table, outcome별)")
+supabase_request_seconds = registry.histogram("supabase_request_seconds", "Supabase 요청 지연(초)")
+
+def error_class(result: Dict[str, Any]) -> str:
+    """결과의 오류 분류 (분류기가 정한 error_class가 없으면 status 사용)"""
+    return result.get('error_class') or result.get('status') or 'error'
+
+def record_crawl_started(kind: str):
+    crawls_started.inc(kind=kind)
+
+def record_crawl_finished(kind: str, result: Dict[str, Any]):
+    if result.get('status') == 'success':
+        crawls_finished.inc(kind=kind, outcome='success', error_class='none')
+    else:
+        crawls_finished.inc(kind=kind, outcome='failed', error_class=error_class(result))
+    timings = (result.get('debug_info') or {}).get('timings') if isinstance(result.get('debug_info'), dict) else None
+    for stage, seconds in (timings or {}).items():
+        stage_seconds.observe(seconds, kind=kind, stage=stage)
+
+def record_stage(kind: str, stage: str, seconds: float):
+    stage_seconds.observe(seconds, kind=kind, stage=stage)
+
+def register_collector(name: str, help_text: str, callback: Callable[[], Dict[Tuple[Tuple[str, str], ...], float]], counter: bool = False):
+    """수집 시점에 값을 계산하는 메트릭 등록 (callback: {labels 튜플: 값})"""
+    metric = CallbackCounter(name, help_text, callback) if counter else Gauge(name, help_text, callback)
+    return registry.register(metric)
+
+def labels(**values) -> LabelKey:
+    return _label_key(values)
+
+class _TimedQuery:
+    """postgrest 요청 빌더 프록시: 체인 호출은 그대로 전달하고 execute()만 테이블별로 계측"""
+    def __init__(self, builder, table: str):
+        self._builder = builder
+        self._table = table
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+        if name == 'execute':
+            return self._execute
+        def chained(*args, **kwargs):
+            value = attr(*args, **kwargs)
+            return _TimedQuery(value, self._table) if hasattr(value, 'execute') else value
+        return chained
+
+    def _execute(self, *args, **kwargs):
+        started = time.perf_counter()
+        outcome = 'success'
+        try:
+            return self._builder.execute(*args, **kwargs)
+        except Exception:
+            outcome = 'error'
+            raise
+        finally:
+            supabase_requests.inc(table=self._table, outcome=outcome)
+            supabase_request_seconds.observe(time.perf_counter() - started, table=self._table)
+
+class InstrumentedClient:
+    """Supabase 클라이언트 프록시 (table()/from_()/rpc() 요청만 계측, 나머지 속성은 그대로 전달)"""
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, table_name: str):
+        return _TimedQuery(self._client.table(table_name), table_name)
+
+    def from_(self, table_name: str):
+        return _TimedQuery(self._client.from_(table_name), table_name)
+
+    def rpc(self, fn: str, params: Dict[str, Any] = None):
+        return _TimedQuery(self._client.rpc(fn, params or {}), f"rpc:{fn}")
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+class MetricsExporter:
+    """OpenMetrics 텍스트를 로컬 HTTP 엔드포인트(/metrics) 또는 주기적으로 쓰는 텍스트 파일로 노출"""
+    def __init__(self, metrics_registry: MetricsRegistry = None):
+        self.registry = metrics_registry or registry
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._writer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def serve(self, port: int, host: str = '127.0.0.1'):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = exporter.registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f"메트릭 엔드포인트: http://{host}:{self._server.server_address[1]}/metrics")
+        return self._server.server_address[1]
+
+    def write_textfile(self, path: str):
+        """임시 파일에 쓴 뒤 교체하여 수집기가 쓰다 만 파일을 읽지 않도록 함"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.registry.render())
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def start_textfile_writer(self, path: str, interval: float = 15.0):
+        def run():
+            while not self._stop.is_set():
+                try:
+                    self.write_textfile(path)
+                except Exception as e:
+                    logger.warning(f"메트릭 파일 쓰기 실패 ({path}): {str(e)}")
+                self._stop.wait(interval)
+
+        self._writer = threading.Thread(target=run, name="metrics-textfile", daemon=True)
+        self._writer.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+_exporter: Optional[MetricsExporter] = None
+_exporter_lock = threading.Lock()
+
+def start_exporter_from_env() -> Optional[MetricsExporter]:
+    """CRAWLER_METRICS_PORT / CRAWLER_METRICS_TEXTFILE 설정 시 프로세스당 한 번 내보내기 시작"""
+    global _exporter
+    port = os.getenv("CRAWLER_METRICS_PORT")
+    path = os.getenv("CRAWLER_METRICS_TEXTFILE")
+    if not port and not path:
+        return None
+    with _exporter_lock:
+        if _exporter is not None:
+            return _exporter
+        exporter = MetricsExporter()
+        if port:
+            try:
+                exporter.serve(int(port), os.getenv("CRAWLER_METRICS_HOST", "127.0.0.1"))
+            except OSError as e:
+                # 같은 호스트의 다른 프로세스가 이미 포트를 사용 중
+                logger.warning(f"메트릭 엔드포인트 시작 실패 (포트 {port}): {str(e)}")
+        if path:
+            exporter.start_textfile_writer(path, float(os.getenv("CRAWLER_METRICS_INTERVAL", "15")))
+        _exporter = exporter
+        return exporter
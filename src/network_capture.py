@@ -0,0 +1,147 @@
+import base64
+import json
+import re
+import time
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 페이지가 가져오는 데이터 API 응답 URL 힌트
+JSON_URL_HINTS = ('/api/v1/', '/graphql', 'web_profile_info', '/info/')
+
+# 결과 필드별 JSON 경로 후보 (앞에 있을수록 우선)
+PROFILE_COUNT_PATHS = {
+    'followers_count': [('edge_followed_by', 'count'), ('follower_count',)],
+    'post_count': [('edge_owner_to_timeline_media', 'count'), ('media_count',)]
+}
+
+# 대상 객체 식별 키 (프로필: username, 포스트: shortcode/code)
+PROFILE_MATCH_KEYS = ('username',)
+POST_MATCH_KEYS = ('shortcode', 'code')
+
+POST_COUNT_PATHS = {
+    'likes': [('edge_media_preview_like', 'count'), ('edge_liked_by', 'count'), ('like_count',)],
+    'comments': [('edge_media_to_parent_comment', 'count'), ('edge_media_to_comment', 'count'), ('comment_count',)]
+}
+
+def username_from_url(url: str) -> Optional[str]:
+    """프로필 URL에서 username 추출"""
+    match = re.search(r'instagram\.com/([^/?#]+)', url or '')
+    return match.group(1) if match else None
+
+def shortcode_from_url(url: str) -> Optional[str]:
+    """포스트/릴스 URL에서 shortcode 추출"""
+    match = re.search(r'/(?:p|reel|tv)/([^/?#]+)', url or '')
+    return match.group(1) if match else None
+
+def _read_path(node: Dict[str, Any], path) -> Optional[int]:
+    value: Any = node
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return int(value)
+
+def _iter_dicts(payload: Any) -> Iterable[Dict[str, Any]]:
+    """JSON 트리의 모든 dict 노드 순회 (깊이 우선)"""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+def _matches(node: Dict[str, Any], match_keys, match_value: Optional[str]) -> bool:
+    if not match_keys or not match_value:
+        return True
+    return any(str(node.get(key, '')).lower() == match_value.lower() for key in match_keys)
+
+def extract_counts(payloads: List[Any], count_paths: Dict[str, list], match_keys=None, match_value: str = None) -> Dict[str, int]:
+    """JSON 응답 목록에서 카운트 필드 추출 (match_keys 중 하나가 match_value인 객체로 한정)"""
+    counts: Dict[str, int] = {}
+    for payload in payloads:
+        for node in _iter_dicts(payload):
+            if not _matches(node, match_keys, match_value):
+                continue
+            for field, paths in count_paths.items():
+                if field in counts:
+                    continue
+                for path in paths:
+                    value = _read_path(node, path)
+                    if value is not None:
+                        counts[field] = value
+                        break
+            if len(counts) == len(count_paths):
+                return counts
+    return counts
+
+class NetworkCapture:
+    """CDP 성능 로그로 페이지가 받은 JSON 응답을 수집하여 구조화된 카운트 추출"""
+    def __init__(self, driver, event_source: Callable[[], List[Dict[str, Any]]]):
+        self.driver = driver
+        self.event_source = event_source  # 성능 로그 Network 이벤트 공급 함수
+        self.events: List[Dict[str, Any]] = []
+        self.payloads: List[Any] = []
+        self._json_requests: Dict[str, str] = {}  # requestId -> url
+        self._fetched = set()
+
+    def _is_json_response(self, response: Dict[str, Any]) -> bool:
+        url = response.get('url', '')
+        mime_type = response.get('mimeType', '')
+        return ('json' in mime_type or 'javascript' in mime_type) and any(hint in url for hint in JSON_URL_HINTS)
+
+    def poll(self) -> int:
+        """새 이벤트를 읽고 완료된 JSON 응답 본문을 가져옴, 새로 얻은 페이로드 수 반환"""
+        new_payloads = 0
+        for event in self.event_source():
+            self.events.append(event)
+            method = event.get('method')
+            params = event.get('params', {})
+            if method == 'Network.responseReceived' and self._is_json_response(params.get('response', {})):
+                self._json_requests[params.get('requestId')] = params['response'].get('url', '')
+            elif method == 'Network.loadingFinished':
+                request_id = params.get('requestId')
+                if request_id in self._json_requests and request_id not in self._fetched:
+                    self._fetched.add(request_id)
+                    payload = self._fetch_body(request_id)
+                    if payload is not None:
+                        self.payloads.append(payload)
+                        new_payloads += 1
+        return new_payloads
+
+    def _fetch_body(self, request_id: str) -> Any:
+        try:
+            body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            text = body.get('body', '')
+            if body.get('base64Encoded'):
+                text = base64.b64decode(text).decode('utf-8', errors='replace')
+            # 일부 응답은 XSSI 방지 접두어("for (;;);")가 붙어 있음
+            text = re.sub(r'^\s*for\s*\(;;\);', '', text)
+            return json.loads(text)
+        except Exception as e:
+            logger.debug(f"응답 본문 읽기 실패 ({request_id}): {str(e)}")
+            return None
+
+    def wait_for_counts(self, count_paths: Dict[str, list], deadline: float, max_wait: float = None,
+                        match_keys=None, match_value: str = None, poll_interval: float = 0.25) -> Dict[str, int]:
+        """필요한 카운트가 모두 잡히거나 대기 한도에 도달할 때까지 응답 수집"""
+        limit = deadline if max_wait is None else min(deadline, time.monotonic() + max_wait)
+        counts: Dict[str, int] = {}
+        while True:
+            if self.poll():
+                counts = extract_counts(self.payloads, count_paths, match_keys, match_value)
+                if len(counts) == len(count_paths):
+                    return counts
+            if time.monotonic() >= limit:
+                return counts
+            time.sleep(poll_interval)
+
+    def counts(self, count_paths: Dict[str, list], match_keys=None, match_value: str = None) -> Dict[str, int]:
+        """지금까지 수집된 응답 기준 카운트 (늦게 도착한 응답 반영용)"""
+        self.poll()
+        return extract_counts(self.payloads, count_paths, match_keys, match_value)
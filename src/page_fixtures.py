@@ -0,0 +1,172 @@
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+import contextlib
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 픽스처 파일 형식 버전 (필드 구조가 바뀌면 올림)
+FIXTURE_FORMAT = 1
+
+# 종류별 정확도 비교 필드
+FIXTURE_FIELDS = {
+    'profile': ('influencer_name', 'followers_count', 'post_count', 'profile_text', 'profile_image_url'),
+    'post': ('likes', 'comments')
+}
+
+def _fixture_name(kind: str, url: str) -> str:
+    slug = re.sub(r'[^a-z0-9]+', '_', re.sub(r'^https?://(www\.)?instagram\.com/', '', url.lower())).strip('_')[:60]
+    digest = hashlib.sha1(f"{url}{time.time()}".encode('utf-8')).hexdigest()[:8]
+    return f"{kind}_{slug or 'page'}_{digest}.json.gz"
+
+class FixtureRecorder:
+    """실제 크롤링에서 page_source와 meta 요소를 픽스처 파일로 기록
+
+    파일 하나에 페이지 하나(gzip JSON)를 저장하며, 크롤링 당시 추출된 값을 기대값(expected)으로 함께 남깁니다.
+    expected는 같은 추출기의 당시 결과라 회귀(자기 일관성)만 확인하므로, 사람이 확인한 값은
+    픽스처의 verified 필드에 따로 적으면 해당 필드의 기대값으로 우선 사용됩니다.
+    """
+    def __init__(self, directory: str, max_fixtures: int = None):
+        self.directory = directory
+        self.max_fixtures = max_fixtures  # 기록 상한 (None이면 무제한)
+        self._recorded = 0
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, url: str, page_source: str, expected: Dict[str, Any],
+               head: Dict[str, Any] = None, source: str = 'selenium') -> Optional[str]:
+        """픽스처 저장 후 경로 반환 (상한 초과/실패 시 None)"""
+        if not page_source:
+            return None
+        with self._lock:
+            if self.max_fixtures is not None and self._recorded >= self.max_fixtures:
+                return None
+            self._recorded += 1
+        fixture = {
+            'format': FIXTURE_FORMAT,
+            'kind': kind,
+            'url': url,
+            'captured_at': datetime.now().isoformat(),
+            'source': source,
+            'meta': head or {},
+            'expected': {field: expected.get(field) for field in FIXTURE_FIELDS.get(kind, ())},
+            'page_source': page_source
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, _fixture_name(kind, url))
+            with gzip.open(path, 'wt', encoding='utf-8') as f:
+                json.dump(fixture, f, ensure_ascii=False)
+            return path
+        except Exception as e:
+            logger.warning(f"픽스처 기록 실패 ({url}): {str(e)}")
+            return None
+
+def load_fixture(path: str) -> Dict[str, Any]:
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        fixture = json.load(f)
+    if fixture.get('format') != FIXTURE_FORMAT:
+        raise ValueError(f"지원하지 않는 픽스처 형식: {fixture.get('format')} ({path})")
+    fixture['path'] = path
+    return fixture
+
+def iter_fixtures(directory: str, kind: str = None) -> Iterator[Dict[str, Any]]:
+    """디렉터리(하위 포함)의 픽스처(.json / .json.gz)를 파일명 순으로 읽기 (읽을 수 없는 파일은 건너뜀)"""
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths += [os.path.join(root, name) for name in files if name.endswith(('.json', '.json.gz'))]
+    for path in sorted(paths):
+        try:
+            fixture = load_fixture(path)
+        except Exception as e:
+            logger.warning(f"픽스처 읽기 실패 ({path}): {str(e)}")
+            continue
+        if kind is None or fixture.get('kind') == kind:
+            yield fixture
+
+def replay_fixture(fixture: Dict[str, Any], crawler) -> Dict[str, Any]:
+    """브라우저 없이 픽스처의 page_source로 추출 로직만 실행"""
+    page_source = fixture['page_source']
+    head = crawler.parse_page_head(page_source)
+    if fixture['kind'] == 'profile':
+        return crawler.extract_profile_data(page_source, head=head)
+    return crawler.extract_post_counts(page_source, head=head)
+
+def expected_values(fixture: Dict[str, Any]) -> Dict[str, Any]:
+    """비교 기준값 (사람이 확인한 verified 값이 녹화 당시 추출값 expected보다 우선)"""
+    return dict(fixture.get('expected') or {}, **(fixture.get('verified') or {}))
+
+def compare_fields(kind: str, expected: Dict[str, Any], actual: Dict[str, Any]) -> Dict[str, bool]:
+    """필드별 일치 여부 (기대값이 없는 필드는 제외)"""
+    matches = {}
+    for field in FIXTURE_FIELDS.get(kind, ()):
+        if expected.get(field) is None:
+            continue
+        expected_value, actual_value = expected[field], actual.get(field)
+        if isinstance(expected_value, str):
+            expected_value, actual_value = expected_value.strip(), str(actual_value or '').strip()
+        matches[field] = expected_value == actual_value
+    return matches
+
+def run_benchmark(fixtures: List[Dict[str, Any]], crawler=None, repeat: int = 1) -> Dict[str, Any]:
+    """픽스처 코퍼스에 대해 종류별 처리량(pages/sec)과 필드별 정확도 측정"""
+    if crawler is None:
+        from .instagram_crawler import InstagramCrawler  # 순환 import 방지
+        crawler = InstagramCrawler()
+
+    report: Dict[str, Any] = {}
+    for kind in sorted({fixture['kind'] for fixture in fixtures}):
+        corpus = [fixture for fixture in fixtures if fixture['kind'] == kind]
+        field_totals: Dict[str, List[int]] = {}
+        mismatches = []
+        errors = 0
+        started = time.perf_counter()
+        for round_index in range(max(1, repeat)):
+            for fixture in corpus:
+                try:
+                    # 추출 코드의 콘솔 출력이 JSON 결과에 섞이거나 처리량 측정에 들어가지 않도록 stdout은 버림
+                    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                        actual = replay_fixture(fixture, crawler)
+                except Exception as e:
+                    errors += 1
+                    actual = {}
+                    if round_index == 0:
+                        mismatches.append({'path': fixture.get('path'), 'field': None, 'error': str(e)})
+                if round_index:
+                    continue  # 정확도는 첫 회차만 집계
+                expected = expected_values(fixture)
+                for field, matched in compare_fields(kind, expected, actual).items():
+                    totals = field_totals.setdefault(field, [0, 0])
+                    totals[0] += int(matched)
+                    totals[1] += 1
+                    if not matched:
+                        mismatches.append({
+                            'path': fixture.get('path'), 'field': field,
+                            'expected': expected.get(field), 'actual': actual.get(field)
+                        })
+        elapsed = time.perf_counter() - started
+        pages = len(corpus) * max(1, repeat)
+        report[kind] = {
+            'fixtures': len(corpus),
+            'verified_fixtures': sum(1 for fixture in corpus if fixture.get('verified')),
+            'pages': pages,
+            'seconds': round(elapsed, 4),
+            'pages_per_sec': round(pages / elapsed, 2) if elapsed > 0 else 0.0,
+            'errors': errors,
+            'field_accuracy': {field: round(hit / total, 4) for field, (hit, total) in field_totals.items()},
+            'mismatches': mismatches
+        }
+    return report
+
+# 실제 크롤링 중 픽스처 기록 (CRAWLER_FIXTURE_DIR 설정 시)
+fixture_recorder = FixtureRecorder(
+    os.getenv("CRAWLER_FIXTURE_DIR"),
+    max_fixtures=int(os.getenv("CRAWLER_FIXTURE_MAX", "0")) or None
+) if os.getenv("CRAWLER_FIXTURE_DIR") else None
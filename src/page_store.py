@@ -0,0 +1,121 @@
+import os
+import zlib
+import shutil
+import atexit
+import hashlib
+import logging
+import tempfile
+import threading
+import weakref
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+class PageHandle:
+    """압축된 page_source 블롭을 가리키는 가벼운 핸들
+
+    결과 dict/세션 상태에는 이 핸들만 남고 원문은 필요할 때 load()로 읽습니다.
+    release()를 호출하거나 핸들이 더 이상 참조되지 않으면 블롭 참조가 해제됩니다.
+    """
+    __slots__ = ('digest', 'length', '_store', '_finalizer', '__weakref__')
+
+    def __init__(self, store: "PageStore", digest: str, length: int):
+        self.digest = digest
+        self.length = length  # 원문 문자 수
+        self._store = store
+        self._finalizer = weakref.finalize(self, store._decref, digest)
+
+    def load(self) -> str:
+        """원문 반환 (이미 해제된 경우 빈 문자열)"""
+        if not self._finalizer.alive:
+            return ''
+        return self._store.read(self.digest)
+
+    def release(self):
+        self._finalizer()
+
+    @property
+    def released(self) -> bool:
+        return not self._finalizer.alive
+
+    def __len__(self):
+        return self.length
+
+    def __deepcopy__(self, memo):
+        return self  # 불변 핸들 공유 (복사본이 블롭 참조를 따로 해제하지 않도록)
+
+    def __repr__(self):
+        return f"PageHandle({self.digest[:12]}, {self.length} chars)"
+
+class PageStore:
+    """page_source를 내용 주소(sha1) 기반 압축 블롭으로 임시 디렉터리에 보관
+
+    같은 내용은 한 번만 저장하고 참조 수가 0이 되면 파일을 지우므로,
+    대량 일괄 크롤링에서도 프로세스 메모리에는 핸들만 남습니다.
+    """
+    def __init__(self, directory: str = None, compress_level: int = 1):
+        self._owns_directory = directory is None  # 직접 만든 임시 디렉터리만 종료 시 삭제
+        self.directory = directory or tempfile.mkdtemp(prefix="insta-crawler-pages-")
+        self.compress_level = compress_level
+        self._refs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.z")
+
+    def put(self, page_source: str) -> PageHandle:
+        data = (page_source or '').encode('utf-8')
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            exists = self._refs.get(digest, 0) > 0
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+            if not exists:
+                with open(self._path(digest), 'wb') as f:
+                    f.write(zlib.compress(data, self.compress_level))
+        return PageHandle(self, digest, len(page_source or ''))
+
+    def read(self, digest: str) -> str:
+        try:
+            with open(self._path(digest), 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        except OSError as e:
+            logger.warning(f"페이지 블롭 읽기 실패 ({digest}): {str(e)}")
+            return ''
+
+    def _decref(self, digest: str):
+        with self._lock:
+            count = self._refs.get(digest, 0) - 1
+            if count > 0:
+                self._refs[digest] = count
+                return
+            self._refs.pop(digest, None)
+            try:
+                os.remove(self._path(digest))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'blobs': len(self._refs), 'handles': sum(self._refs.values())}
+
+    def close(self):
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+def load_page_source(value: Union[str, PageHandle, None]) -> str:
+    """문자열 또는 PageHandle에서 page_source 원문 얻기"""
+    if isinstance(value, PageHandle):
+        return value.load()
+    return value or ''
+
+def release_page_source(result: Optional[Dict[str, Any]]):
+    """결과의 page_source 핸들 해제 (문자열이면 아무것도 하지 않음)"""
+    value = (result or {}).get('page_source')
+    if isinstance(value, PageHandle):
+        value.release()
+
+# 전역 페이지 저장소 (CRAWLER_PAGE_STORE=0이면 결과에 원문 문자열을 그대로 담음)
+page_store = PageStore(os.getenv("CRAWLER_PAGE_STORE_DIR") or None) if os.getenv("CRAWLER_PAGE_STORE", "1") == "1" else None
+if page_store is not None:
+    atexit.register(page_store.close)
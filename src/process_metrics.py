@@ -0,0 +1,75 @@
+import os
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil  # 선택 의존성 (없으면 /proc 직접 조회)
+except ImportError:
+    psutil = None
+
+def _proc_children() -> Dict[int, List[int]]:
+    """/proc에서 부모 PID별 자식 PID 목록 구성 (Linux)"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+            # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 파싱
+            ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+def _proc_rss(pid: int) -> int:
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+def process_tree_rss(root_pid: int) -> Optional[int]:
+    """프로세스와 모든 하위 프로세스의 RSS 합계(바이트), 측정할 수 없으면 None"""
+    if not root_pid:
+        return None
+    if psutil is not None:
+        try:
+            root = psutil.Process(root_pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    if not os.path.isdir('/proc'):
+        return None
+    children = _proc_children()
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += _proc_rss(pid)
+        stack.extend(children.get(pid, []))
+    return total
+
+def driver_rss(driver) -> Optional[int]:
+    """chromedriver 프로세스 트리(Chrome 브라우저/렌더러 포함)의 RSS 합계(바이트)"""
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    try:
+        return process_tree_rss(pid)
+    except Exception as e:
+        logger.debug(f"드라이버 RSS 측정 실패: {str(e)}")
+        return None
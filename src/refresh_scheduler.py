@@ -0,0 +1,130 @@
+import os
+import math
+import heapq
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# 팔로워 규모별 가중치 (하한 팔로워 수, 점수)
+FOLLOWER_TIERS = [
+    (1_000_000, 1.0),   # 메가
+    (100_000, 0.8),     # 매크로
+    (10_000, 0.55),     # 마이크로
+    (1_000, 0.3),       # 나노
+    (0, 0.1)
+]
+
+DEFAULT_WEIGHTS = {
+    'staleness': 0.5,
+    'tier': 0.25,
+    'campaign': 0.25,
+    'failure': 0.6  # 실패율에 따른 감점 비율
+}
+
+def follower_tier_score(followers_count: Optional[int]) -> float:
+    followers = followers_count or 0
+    for threshold, score in FOLLOWER_TIERS:
+        if followers >= threshold:
+            return score
+    return 0.0
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+class RefreshScheduler:
+    """갱신 우선순위 스케줄러
+
+    connecta_influencers 행마다 오래된 정도(updated_at), 팔로워 규모, 캠페인 참여 여부,
+    최근 크롤링 실패율로 점수를 매겨 우선순위 큐에 넣고, 시간 예산 안에서 가치가 높은 순으로 대상을 꺼냅니다.
+    """
+    def __init__(self, weights: Dict[str, float] = None, stale_after_hours: float = None,
+                 seconds_per_crawl: float = None, concurrency: int = None, requests_per_minute: float = None):
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        # 이 시간이 지나면 오래된 정도 점수가 최대(1.0)
+        self.stale_after_hours = stale_after_hours or float(os.getenv("CRAWLER_STALE_AFTER_HOURS", "168"))
+        self.seconds_per_crawl = seconds_per_crawl or float(os.getenv("CRAWLER_EST_SECONDS_PER_CRAWL", "20"))
+        self.concurrency = concurrency or int(os.getenv("CRAWLER_CONCURRENCY", "2"))
+        self.requests_per_minute = requests_per_minute or float(os.getenv("CRAWLER_REQUESTS_PER_MINUTE", "12"))
+        self._heap: List[tuple] = []
+        self._order = itertools.count()  # 동점일 때 입력 순서 유지
+
+    def staleness_score(self, influencer: Dict[str, Any], now: datetime) -> float:
+        # 한 번도 크롤링하지 않은 계정은 가장 오래된 것으로 취급
+        if influencer.get('first_crawled') is False:
+            return 1.0
+        updated_at = _parse_timestamp(influencer.get('updated_at'))
+        if updated_at is None:
+            return 1.0
+        age_hours = max(0.0, (now - updated_at).total_seconds() / 3600)
+        return min(1.0, age_hours / self.stale_after_hours)
+
+    def failure_rate(self, outcome: Optional[Dict[str, int]]) -> float:
+        """최근 실패율 (기록이 적을 때 과도하게 흔들리지 않도록 라플라스 보정)"""
+        outcome = outcome or {}
+        failed = outcome.get('failed', 0)
+        total = failed + outcome.get('done', 0)
+        return (failed + 0.5) / (total + 2) if total else 0.0
+
+    def estimated_seconds(self) -> float:
+        """대상 1건당 예상 소요 시간 (동시 실행 수와 분당 요청 예산 중 느린 쪽 기준)"""
+        per_slot = self.seconds_per_crawl / max(1, self.concurrency)
+        per_budget = 60.0 / self.requests_per_minute if self.requests_per_minute > 0 else 0.0
+        return max(per_slot, per_budget)
+
+    def score(self, influencer: Dict[str, Any], campaign_count: int = 0,
+              outcome: Optional[Dict[str, int]] = None, now: datetime = None) -> Dict[str, float]:
+        now = now or datetime.now(timezone.utc)
+        components = {
+            'staleness': self.staleness_score(influencer, now),
+            'tier': follower_tier_score(influencer.get('followers_count')),
+            'campaign': 1.0 if campaign_count else 0.0,
+            'failure_rate': self.failure_rate(outcome)
+        }
+        value = (self.weights['staleness'] * components['staleness']
+                 + self.weights['tier'] * components['tier']
+                 + self.weights['campaign'] * components['campaign'])
+        components['score'] = round(value * (1 - self.weights['failure'] * components['failure_rate']), 4)
+        return components
+
+    def load(self, influencers: List[Dict[str, Any]], campaign_counts: Dict[str, int] = None,
+             outcomes: Dict[str, Dict[str, int]] = None, platform: Optional[str] = 'instagram'):
+        """점수를 계산해 우선순위 큐 구성 (기존 큐는 비움)"""
+        campaign_counts = campaign_counts or {}
+        outcomes = outcomes or {}
+        now = datetime.now(timezone.utc)
+        self._heap = []
+        for influencer in influencers:
+            if platform and influencer.get('platform') != platform:
+                continue
+            components = self.score(influencer, campaign_counts.get(influencer['id'], 0),
+                                    outcomes.get(str(influencer['id'])), now)
+            self.push(influencer, components)
+
+    def push(self, influencer: Dict[str, Any], components: Dict[str, float]):
+        heapq.heappush(self._heap, (-components['score'], next(self._order), influencer, components))
+
+    def __len__(self):
+        return len(self._heap)
+
+    def next_targets(self, limit: Optional[int] = None, time_budget_seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+        """점수가 높은 순으로 limit개 / 시간 예산 안에 들어가는 대상을 큐에서 꺼냄"""
+        per_item = self.estimated_seconds()
+        if time_budget_seconds is not None:
+            budget_limit = int(math.floor(time_budget_seconds / per_item)) if per_item > 0 else len(self._heap)
+            limit = budget_limit if limit is None else min(limit, budget_limit)
+
+        targets = []
+        while self._heap and (limit is None or len(targets) < limit):
+            _, _, influencer, components = heapq.heappop(self._heap)
+            targets.append({
+                'influencer': influencer,
+                'components': components,
+                'estimated_seconds': per_item
+            })
+        return targets
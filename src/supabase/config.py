@@ -19,6 +19,8 @@ class SupabaseConfig:
             self.url: str = os.getenv("SUPABASE_URL", "")
             self.key: str = os.getenv("SUPABASE_ANON_KEY", "")
         
+        # 헤드리스 실행(CLI/워커) 전용 서비스 역할 키 (RLS 우회, Streamlit 앱에서는 사용하지 않음)
+        self.service_key: str = os.getenv("SUPABASE_SERVICE_KEY", "")
         self.client: Optional[Client] = None
         
     def get_client(self) -> Client:
@@ -29,6 +31,14 @@ class SupabaseConfig:
             self.client = create_client(self.url, self.key)
         return self.client
     
+    def use_service_role(self) -> bool:
+        """이후 클라이언트를 서비스 역할 키로 생성 (로그인 사용자가 없는 CLI/워커용), 키가 없으면 False"""
+        if not self.service_key:
+            return False
+        self.key = self.service_key
+        self.client = None
+        return True
+    
     def is_configured(self) -> bool:
         """Supabase 설정이 완료되었는지 확인"""
         return bool(self.url and self.key)
@@ -1,10 +1,23 @@
+import os
+import time
+import logging
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, List
-from ..instagram_crawler import InstagramCrawler
+from typing import Dict, Any, List, Optional
+from ..instagram_crawler import InstagramCrawler, RequestPacer, StreamlitProgress, driver_pool, driver_supervisor
+from ..crawl_engine import CrawlEngine
+from ..crawl_session import CrawlSessionLedger, post_ledger_items
+from ..crawl_timing import StageStats
+from ..job_queue import job_queue, ACTIVE_STATUSES
 from ..db.database import db_manager
 from ..db.models import InstagramCrawlResult
 
+logger = logging.getLogger(__name__)
+
+# 백그라운드 작업 진행 현황 자동 새로고침 간격(초)
+JOB_POLL_SECONDS = float(os.getenv("CRAWLER_JOB_POLL_SECONDS", "3"))
+JOB_STATUS_LABELS = {'queued': '⏳ 대기', 'running': '🏃 실행 중', 'done': '✅ 완료', 'failed': '❌ 실패', 'cancelled': '🚫 취소'}
+
 def render_single_crawl_form() -> Dict[str, Any]:
     """단일 포스트 크롤링 폼 렌더링"""
     st.subheader("📱 단일 포스트 크롤링")
@@ -12,6 +25,7 @@ def render_single_crawl_form() -> Dict[str, Any]:
     
     # 디버그 모드 토글
     debug_mode = st.checkbox("🔍 디버그 모드", help="페이지의 HTML 요소들을 확인할 수 있습니다", key="single_post_debug_mode")
+    force_refresh = st.checkbox("🔄 강제 새로고침", help="최근 크롤링 결과(캐시)를 사용하지 않고 새로 크롤링합니다", key="single_post_force_refresh")
     
     col1, col2 = st.columns([2, 1])
     
@@ -32,8 +46,8 @@ def render_single_crawl_form() -> Dict[str, Any]:
                 return {"action": "error", "message": "올바른 Instagram URL을 입력해주세요!"}
             else:
                 with st.spinner(""):
-                    crawler = InstagramCrawler()
-                    result = crawler.crawl_instagram_post(url, debug_mode)
+                    crawler = InstagramCrawler(pool=driver_pool)
+                    result = crawler.crawl_instagram_post(url, debug_mode, force_refresh=force_refresh)
                     crawler.close_driver()
                 
                 # 결과 표시
@@ -117,11 +131,314 @@ def render_single_crawl_form() -> Dict[str, Any]:
     
     return {"action": "none"}
 
+def render_resume_session_picker(item_kind: str, key: str) -> Optional[str]:
+    """미완료 항목이 남은 세션 선택 UI, 재개 버튼을 누르면 세션 ID 반환 (백그라운드 작업이 맡은 세션 제외)"""
+    active_session_ids = set()
+    if job_queue is not None:
+        try:
+            active_session_ids = job_queue.active_session_ids(item_kind)
+        except Exception as e:
+            logger.warning(f"작업 큐 조회 실패: {str(e)}")
+    sessions = db_manager.get_resumable_crawl_sessions(item_kind, exclude_session_ids=active_session_ids)
+    if not sessions:
+        return None
+    
+    with st.expander(f"⏯️ 중단된 세션 재개 ({len(sessions)}개)"):
+        session_options = {
+            f"{session['session_name']} - 미완료 {session['unfinished_items']}건 ({session['created_at'][:16]})": session['id']
+            for session in sessions
+        }
+        selected = st.selectbox("재개할 세션", list(session_options.keys()), key=f"{key}_select")
+        if st.button("▶️ 세션 재개", key=f"{key}_button", help="완료되지 않은 항목만 다시 크롤링합니다"):
+            return session_options[selected]
+    return None
+
+def render_background_option(key: str) -> bool:
+    """백그라운드 작업 실행 여부 체크박스"""
+    return st.checkbox(
+        "🧵 백그라운드 작업으로 실행",
+        value=job_queue is not None and os.getenv("CRAWLER_BACKGROUND_JOBS", "0") == "1",
+        disabled=job_queue is None,
+        help="작업 큐에 등록하고 워커 프로세스(python -m src.crawl_worker)가 실행합니다. 페이지를 떠나거나 새로고침해도 계속 진행됩니다.",
+        key=key
+    )
+
+def submit_crawl_job(kind: str, ledger: Optional[CrawlSessionLedger], force_refresh: bool = False) -> Optional[str]:
+    """크롤링 세션을 작업 큐에 등록하고 작업 ID 반환 (세션이 없으면 None)"""
+    if job_queue is None or not ledger or not ledger.items:
+        return None
+    return job_queue.enqueue(
+        kind,
+        {'session_id': ledger.session_id, 'force_refresh': force_refresh},
+        total=len(ledger.items),
+        submitted_by=db_manager.get_current_user_id()
+    )
+
+def render_crawl_jobs(kind: str, key: str):
+    """백그라운드 작업 진행 현황 (작업 큐의 진행 레코드만 조회)"""
+    if job_queue is None:
+        return
+    try:
+        jobs = job_queue.list_jobs(limit=10, submitted_by=db_manager.get_current_user_id(), kind=kind)
+    except Exception as e:
+        st.warning(f"작업 큐를 조회할 수 없습니다: {str(e)}")
+        return
+    if not jobs:
+        return
+    
+    active = [job for job in jobs if job['status'] in ACTIVE_STATUSES]
+    with st.expander(f"🧵 백그라운드 작업 (진행 중 {len(active)}개)", expanded=bool(active)):
+        for job in jobs:
+            total = job['total'] or 0
+            done = min(job['done'] or 0, total) if total else job['done'] or 0
+            col1, col2 = st.columns([5, 1])
+            with col1:
+                text = f"{JOB_STATUS_LABELS.get(job['status'], job['status'])} · {done}/{total} (실패 {job['failed'] or 0}) · {job['created_at'][:16]}"
+                if job.get('message'):
+                    text += f" · {job['message']}"
+                st.progress(min(max(done / total, 0.0), 1.0) if total else 0.0, text=text)
+            with col2:
+                if job['status'] == 'queued' and st.button("취소", key=f"{key}_cancel_{job['id']}"):
+                    job_queue.cancel(job['id'])
+                    st.rerun()
+        
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            st.button("🔄 새로고침", key=f"{key}_refresh")
+        with col2:
+            auto_refresh = st.checkbox("자동 새로고침", value=True, key=f"{key}_auto_refresh")
+    
+    if active and auto_refresh:
+        st.session_state.crawl_jobs_poll = True
+
+def poll_crawl_jobs():
+    """진행 중인 백그라운드 작업이 있으면 잠시 뒤 페이지 다시 실행 (앱 스크립트 맨 끝에서 호출)"""
+    if st.session_state.pop('crawl_jobs_poll', False):
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+
+def render_driver_restarts(snapshot: Dict[str, Any]):
+    """일괄 크롤링 중 드라이버 재시작 횟수/사유와 Chrome 메모리 표시"""
+    reasons = driver_supervisor.restarts_since(snapshot)
+    stats = driver_supervisor.stats()
+    labels = {'rss': '메모리 초과', 'pages': '페이지 수 초과', 'age': '사용 시간 초과'}
+    restart_text = ", ".join(f"{labels.get(reason, reason)} {count}회" for reason, count in reasons.items()) or "없음"
+    rss_text = f" · Chrome 최대 RSS {stats['peak_rss_mb']:.0f}MB" if stats['peak_rss_mb'] else ""
+    st.caption(f"🔄 드라이버 재시작: {restart_text}{rss_text}")
+
+def render_stage_timings(stage_stats: StageStats):
+    """일괄 크롤링 단계별 소요 시간 p50/p95 표시"""
+    summary = stage_stats.summary()
+    if not summary:
+        return
+    with st.expander("⏱️ 단계별 소요 시간", expanded=False):
+        timing_df = pd.DataFrame(summary)[['stage', 'count', 'p50', 'p95', 'total']]
+        timing_df.columns = ['단계', '건수', 'p50(초)', 'p95(초)', '합계(초)']
+        st.dataframe(timing_df, use_container_width=True, hide_index=True)
+
+class StreamingResultsView:
+    """일괄 크롤링 결과를 끝나는 대로 보여주는 결과 표 + 요약 지표
+
+    행은 chunk_size개 또는 min_interval초마다 묶어 표에 이어 붙이고(add_rows), 지표는 행이 들어올 때마다
+    누적 카운터만 갱신하므로 전체 결과를 다시 집계하지 않습니다. 프로필/포스트 일괄 크롤링이 함께 사용합니다.
+    columns: {결과 키: 표시 이름}, sum_field/sum_label: 성공 행에서 합산할 값(팔로워, 좋아요 등)
+    """
+    def __init__(self, columns: Dict[str, str], total_label: str, sum_field: str, sum_label: str,
+                 chunk_size: Optional[int] = None, min_interval: Optional[float] = None):
+        self.columns = columns
+        self.sum_field = sum_field
+        self.chunk_size = chunk_size or int(os.getenv("CRAWLER_RESULTS_CHUNK", "10"))
+        self.min_interval = float(os.getenv("CRAWLER_PROGRESS_INTERVAL", "1.0")) if min_interval is None else min_interval
+        self.labels = [total_label, "성공", "실패", sum_label]
+        self.rows: List[Dict[str, Any]] = []
+        self.succeeded = 0
+        self.failed = 0
+        self.deferred = 0
+        self.total_sum = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._shown = 0
+        self._last_flush = time.monotonic()
+        self._table = None
+        self._numeric = None
+        
+        self._metrics = [column.empty() for column in st.columns(4)]
+        st.subheader("📊 크롤링 결과")
+        self._table_slot = st.empty()
+        self._render_metrics()
+    
+    def add(self, row: Dict[str, Any]):
+        """결과 1건 추가 (지표는 누적 카운터로 갱신)"""
+        self.rows.append(row)
+        self._pending.append(row)
+        if row.get('status') == 'success':
+            self.succeeded += 1
+            self.total_sum += int(row.get(self.sum_field) or 0)
+        elif row.get('status') == 'deferred':
+            self.deferred += 1
+        else:
+            self.failed += 1
+        if len(self._pending) >= self.chunk_size or time.monotonic() - self._last_flush >= self.min_interval:
+            self.flush()
+    
+    def _chunk_frame(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        chunk = pd.DataFrame(rows).reindex(columns=list(self.columns))
+        # add_rows는 첫 묶음과 같은 컬럼 타입을 요구하므로 첫 묶음 기준으로 숫자는 정수, 나머지는 문자열로 고정
+        if self._numeric is None:
+            self._numeric = {key for key in chunk.columns if key == self.sum_field or pd.api.types.is_numeric_dtype(chunk[key])}
+        for key in chunk.columns:
+            if key in self._numeric:
+                chunk[key] = pd.to_numeric(chunk[key], errors='coerce').fillna(0).astype('int64')
+            else:
+                chunk[key] = chunk[key].fillna('').astype(str)
+        chunk.columns = list(self.columns.values())
+        chunk.index = range(self._shown, self._shown + len(chunk))
+        return chunk
+    
+    def _render_metrics(self):
+        values = [f"{len(self.rows):,}", f"{self.succeeded:,}", f"{self.failed:,}", f"{self.total_sum:,}"]
+        deltas = [None, None, f"보류 {self.deferred:,}" if self.deferred else None, None]
+        for slot, label, value, delta in zip(self._metrics, self.labels, values, deltas):
+            slot.metric(label, value, delta=delta, delta_color="off")
+    
+    def flush(self):
+        """쌓인 행을 표에 이어 붙이고 지표 갱신 (WebSocket 오류는 로그만 남기고 무시)"""
+        self._last_flush = time.monotonic()
+        try:
+            if self._pending:
+                chunk = self._chunk_frame(self._pending)
+                if self._table is None:
+                    self._table = self._table_slot.dataframe(chunk, use_container_width=True)
+                else:
+                    self._table.add_rows(chunk)
+                self._shown += len(chunk)
+                self._pending = []
+            self._render_metrics()
+        except Exception as e:
+            logger.warning(f"결과 표 갱신 실패 (정상적인 상황일 수 있음): {str(e)}")
+    
+    def close(self) -> pd.DataFrame:
+        """남은 행을 표시하고 전체 결과 반환 (CSV/오류 상세용)"""
+        self.flush()
+        return pd.DataFrame(self.rows)
+
+def render_deferred_notice(results_view: StreamingResultsView, ledger: Optional[CrawlSessionLedger]):
+    """차단기로 보류한 항목 안내 (원장에 대기 상태로 남아 세션 재개 시 이어서 크롤링)"""
+    if not results_view.deferred:
+        return
+    resume_hint = f" 차단이 풀린 뒤 '중단된 세션 재개'에서 이어서 크롤링하세요. (세션 ID: {ledger.session_id})" if ledger else ""
+    st.warning(f"⏸️ 로그인/차단 화면이 반복되어 {results_view.deferred}건을 보류했습니다.{resume_hint}")
+
+def run_post_batch_crawl(ledger: Optional[CrawlSessionLedger], ledger_items: List[Dict[str, Any]], force_refresh: bool = False) -> Dict[str, Any]:
+    """원장 항목 기준 포스트 일괄 크롤링 실행 (항목이 끝날 때마다 결과와 원장 상태 저장)"""
+    session_id = ledger.session_id if ledger else None
+    supervisor_snapshot = driver_supervisor.stats()
+    stage_stats = StageStats()  # 이번 일괄 크롤링의 단계별 소요 시간
+    batch_df = pd.DataFrame([item['payload'] for item in ledger_items], columns=['name', 'instagram_link'])
+    
+    # 진행률 표시 (한 줄 요약 + 실패 표를 일정 간격으로 묶어서 갱신)
+    progress_container = st.container()
+    results_container = st.container()
+    
+    with progress_container:
+        progress = StreamlitProgress(len(ledger_items), item_label="포스트")
+    
+    # 끝난 결과부터 표에 이어 붙임
+    with results_container:
+        results_view = StreamingResultsView(
+            {'name': 'name', 'url': 'url', 'likes': 'likes', 'comments': 'comments', 'status': 'status', 'error': 'error'},
+            "총 포스트", 'likes', "총 좋아요"
+        )
+    
+    if ledger:
+        ledger.claim()
+    
+    def save_result(position, result):
+        """포스트 1건 결과를 즉시 저장하고 원장 항목 상태 갱신"""
+        results_view.add(result)
+        if result['status'] == 'deferred':
+            # 요청하지 않은 항목이므로 결과를 저장하지 않고 원장에서 대기 상태로 되돌림
+            if ledger:
+                ledger.defer(ledger_items[position], result.get('error', ''))
+            return
+        crawl_result = InstagramCrawlResult(
+            session_id=session_id,
+            post_name=result['name'],
+            post_url=result['url'],
+            likes=result['likes'],
+            comments=result['comments'],
+            status=result['status'],
+            error_message=result.get('error', '')
+        )
+        with stage_stats.timer('save_crawl_result'):
+            save = db_manager.save_instagram_crawl_result(crawl_result)
+        result_ref = save["data"][0].get("id") if save["success"] and save["data"] else None
+        if ledger:
+            if result['status'] == 'success':
+                ledger.complete(ledger_items[position], result_ref)
+            else:
+                ledger.fail(ledger_items[position], result.get('error', ''), result_ref)
+    
+    # 크롤링 실행 (안전한 WebSocket 업데이트 사용)
+    with st.spinner(""):
+        crawler = InstagramCrawler(pool=driver_pool)
+        results = crawler.batch_crawl_instagram_posts(
+            batch_df, 
+            progress=progress,
+            # 포스트 시작 간격 30-60초는 유지하고 동시 실행은 엔진이 담당
+            engine=CrawlEngine(job_pacer=RequestPacer(30, 60)),
+            on_result=save_result,
+            force_refresh=force_refresh,
+            stage_stats=stage_stats
+        )
+        crawler.close_driver()
+    results_df = results_view.close()
+    
+    # 세션 업데이트 (원장 기준 집계)
+    if ledger:
+        ledger.finish()
+    
+    # 결과 표시
+    st.success("일괄 크롤링이 완료되었습니다!")
+    render_deferred_notice(results_view, ledger)
+    
+    if not results:
+        return {"action": "success", "data": results}
+    
+    render_driver_restarts(supervisor_snapshot)
+    render_stage_timings(stage_stats)
+    
+    # CSV 다운로드
+    csv = results_df.to_csv(index=False, encoding='utf-8-sig')
+    st.download_button(
+        label="📥 결과 CSV 다운로드",
+        data=csv,
+        file_name="instagram_batch_crawl_results.csv",
+        mime="text/csv"
+    )
+    
+    # 에러가 있는 경우 상세 표시
+    error_results = results_df[results_df['status'] == 'error']
+    if len(error_results) > 0:
+        st.subheader("⚠️ 에러 상세 정보")
+        st.dataframe(error_results[['name', 'url', 'error']], use_container_width=True)
+    
+    return {"action": "success", "data": results}
+
 def render_batch_crawl_form() -> Dict[str, Any]:
     """일괄 크롤링 폼 렌더링"""
     st.subheader("📊 일괄 크롤링")
     st.markdown("엑셀 파일을 업로드하여 여러 Instagram 포스트를 일괄 크롤링합니다.")
     
+    # 백그라운드 작업 진행 현황
+    render_crawl_jobs('post', key="post_jobs")
+    
+    # 중단된 세션 재개
+    resume_session_id = render_resume_session_picker('post', key="resume_post_session")
+    if resume_session_id:
+        ledger = CrawlSessionLedger.resume(resume_session_id)
+        st.info(f"세션을 재개합니다. 미완료 항목 {len(ledger.items)}건 (ID: {resume_session_id})")
+        return run_post_batch_crawl(ledger, ledger.items, st.session_state.get("excel_batch_force_refresh", False))
+    
     # 엑셀 파일 업로드
     uploaded_file = st.file_uploader(
         "엑셀 파일을 업로드하세요",
@@ -160,6 +477,8 @@ def render_batch_crawl_form() -> Dict[str, Any]:
             
             # 크롤링 세션 생성
             session_name = st.text_input("세션 이름", value=f"Batch Crawl - {len(valid_df)} posts", key="excel_batch_session_name")
+            force_refresh = st.checkbox("🔄 강제 새로고침", help="최근 크롤링 결과(캐시)를 사용하지 않고 모두 새로 크롤링합니다", key="excel_batch_force_refresh")
+            run_in_background = render_background_option(key="excel_batch_background")
             
             # 크롤링 시작 버튼
             if st.button("🚀 일괄 크롤링 시작", type="primary", key="batch_crawl_start_excel"):
@@ -167,105 +486,24 @@ def render_batch_crawl_form() -> Dict[str, Any]:
                     st.error("크롤링할 유효한 데이터가 없습니다.")
                     return {"action": "error", "message": "크롤링할 유효한 데이터가 없습니다."}
                 
-                # 크롤링 세션 생성
-                session_result = db_manager.create_instagram_crawl_session(session_name, len(valid_df))
-                session_id = None
-                if session_result["success"]:
-                    session_id = session_result["data"][0]["id"]
-                    st.info(f"Instagram 크롤링 세션이 생성되었습니다. (ID: {session_id})")
-                
-                # 진행률 표시를 위한 컨테이너
-                progress_container = st.container()
-                status_container = st.container()
-                results_container = st.container()
-                
-                with progress_container:
-                    progress_bar = st.progress(0)
-                    progress_text = st.empty()
-                
-                with status_container:
-                    status_text = st.empty()
-                
-                # 크롤링 실행 (안전한 WebSocket 업데이트 사용)
-                with results_container:
-                    with st.spinner(""):
-                        crawler = InstagramCrawler()
-                        # 새로운 안전한 progress callback 사용
-                        results = crawler.batch_crawl_instagram_posts(
-                            valid_df, 
-                            progress_callback=None,  # 기존 콜백 대신 안전한 방식 사용
-                            progress_bar=progress_bar,
-                            progress_text=progress_text,
-                            status_text=status_text
-                        )
-                        crawler.close_driver()
-                
-                # 결과를 데이터베이스에 저장
-                successful_posts = 0
-                failed_posts = 0
-                
-                for result in results:
-                    crawl_result = InstagramCrawlResult(
-                        session_id=session_id,
-                        post_name=result['name'],
-                        post_url=result['url'],
-                        likes=result['likes'],
-                        comments=result['comments'],
-                        status=result['status'],
-                        error_message=result.get('error', '')
-                    )
-                    
-                    save_result = db_manager.save_instagram_crawl_result(crawl_result)
-                    if save_result["success"]:
-                        if result['status'] == 'success':
-                            successful_posts += 1
-                        else:
-                            failed_posts += 1
-                
-                # 세션 업데이트
-                if session_id:
-                    db_manager.update_instagram_crawl_session(session_id, successful_posts, failed_posts, "completed")
-                
-                # 결과 표시
-                st.success("일괄 크롤링이 완료되었습니다!")
-                
-                # 결과 데이터프레임 생성
-                results_df = pd.DataFrame(results)
-                
-                # 통계 표시
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("총 포스트", len(results_df))
-                with col2:
-                    success_count = len(results_df[results_df['status'] == 'success'])
-                    st.metric("성공", success_count)
-                with col3:
-                    error_count = len(results_df[results_df['status'] == 'error'])
-                    st.metric("실패", error_count)
-                with col4:
-                    total_likes = results_df[results_df['status'] == 'success']['likes'].sum()
-                    st.metric("총 좋아요", f"{total_likes:,}")
-                
-                # 결과 테이블 표시
-                st.subheader("📊 크롤링 결과")
-                st.dataframe(results_df, use_container_width=True)
+                # 세션 작업 원장 항목 (재개 시 엑셀 없이 작업을 다시 만들 수 있도록 행 정보 포함)
+                ledger_items = post_ledger_items(valid_df)
                 
-                # CSV 다운로드
-                csv = results_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📥 결과 CSV 다운로드",
-                    data=csv,
-                    file_name="instagram_batch_crawl_results.csv",
-                    mime="text/csv"
-                )
+                # 크롤링 세션 및 작업 원장 생성
+                ledger = CrawlSessionLedger.create(session_name, 'post', ledger_items)
+                if ledger:
+                    st.info(f"Instagram 크롤링 세션이 생성되었습니다. (ID: {ledger.session_id})")
+                    ledger_items = ledger.items or ledger_items
                 
-                # 에러가 있는 경우 상세 표시
-                error_results = results_df[results_df['status'] == 'error']
-                if len(error_results) > 0:
-                    st.subheader("⚠️ 에러 상세 정보")
-                    st.dataframe(error_results[['name', 'url', 'error']], use_container_width=True)
+                if run_in_background:
+                    job_id = submit_crawl_job('post', ledger, force_refresh)
+                    if not job_id:
+                        st.error("백그라운드 작업을 등록하지 못했습니다. (크롤링 세션 생성 실패)")
+                        return {"action": "error", "message": "백그라운드 작업 등록 실패"}
+                    st.success(f"백그라운드 작업이 등록되었습니다. (ID: {job_id[:8]}) 워커가 순서대로 실행합니다.")
+                    return {"action": "queued", "job_id": job_id}
                 
-                return {"action": "success", "data": results}
+                return run_post_batch_crawl(ledger, ledger_items, force_refresh)
         
         except Exception as e:
             st.error(f"엑셀 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
@@ -291,6 +529,7 @@ def render_batch_crawl_form() -> Dict[str, Any]:
     - **유효성 검사**: Instagram URL이 아닌 경우 자동으로 제외됩니다
     - **에러 처리**: 개별 포스트에서 에러가 발생해도 전체 작업이 중단되지 않습니다
     - **데이터베이스 저장**: 모든 결과가 자동으로 데이터베이스에 저장됩니다
+    - **세션 재개**: 결과는 포스트마다 바로 저장되며, 중단된 세션은 상단의 "중단된 세션 재개"에서 남은 포스트만 이어서 크롤링할 수 있습니다
     
     ### 주의사항
     - 각 포스트 크롤링 후 30-60초의 랜덤 쿨다운 시간이 있습니다
@@ -1,8 +1,19 @@
 import streamlit as st
 import pandas as pd
+import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from ..instagram_crawler import InstagramCrawler
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from ..instagram_crawler import InstagramCrawler, driver_pool, driver_supervisor, StreamlitProgress
+from ..crawl_engine import CrawlEngine
+from ..crawl_pipeline import CrawlPipeline, parse_profile_result, persist_profile_batch
+from ..crawl_session import CrawlSessionLedger, profile_ledger_item
+from ..refresh_scheduler import RefreshScheduler
+from ..page_store import release_page_source
+from ..crawl_timing import StageTimer, StageStats
+from .crawler_components import (render_resume_session_picker, render_driver_restarts, render_stage_timings,
+                                 StreamingResultsView, render_deferred_notice,
+                                 render_background_option, submit_crawl_job, render_crawl_jobs)
 from ..db.database import db_manager
 from ..db.models import Campaign, Influencer, CampaignInfluencer, CampaignInfluencerParticipation, PerformanceMetric, InstagramCrawlResult
 from ..supabase.auth import supabase_auth
@@ -38,10 +49,10 @@ def check_database_for_influencer(platform: str, sns_id: str) -> Dict[str, Any]:
             "message": f"❌ DB 확인 중 오류가 발생했습니다: {str(e)}"
         }
 
-def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, save_to_db: bool) -> Dict[str, Any]:
+def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, save_to_db: bool, force_refresh: bool = False) -> Dict[str, Any]:
     """실제 크롤링 수행"""
     try:
-        crawler = InstagramCrawler()
+        crawler = InstagramCrawler(pool=driver_pool)
         
         # URL이 없으면 SNS ID로 URL 생성
         if not url and sns_id:
@@ -72,9 +83,10 @@ def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, sav
             clean_sns_id = sns_id.replace('@', '') if sns_id else url.split('/')[-2] if url else ''
             
             # Instagram 프로필 크롤링
-            result = crawler.crawl_instagram_profile(url, debug_mode)
+            result = crawler.crawl_instagram_profile(url, debug_mode, force_refresh=force_refresh)
             
             if result['status'] == 'success':
+                db_timer = StageTimer()  # DB 쓰기 단계 소요 시간
                 # 데이터베이스에 저장 또는 업데이트
                 if save_to_db:
                     # 기존 인플루언서 확인
@@ -83,12 +95,16 @@ def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, sav
                     # 로그인 상태 확인
                     is_logged_in = supabase_auth.is_authenticated()
                     
-                    if existing_influencer:
+                    if existing_influencer and result.get('cache'):
+                        # 캐시된 결과는 이미 저장된 값이므로 updated_at을 갱신하지 않음 (persist_profile_batch와 동일)
+                        db_message = "💾 최근 크롤링 결과(캐시)라 저장을 생략했습니다."
+                    elif existing_influencer:
                         # 기존 인플루언서 업데이트
-                        update_result = db_manager.update_influencer_data(
-                            existing_influencer['id'], 
-                            result
-                        )
+                        with db_timer.span('update_influencer_data'):
+                            update_result = db_manager.update_influencer_data(
+                                existing_influencer['id'], 
+                                result
+                            )
                         if update_result["success"]:
                             db_message = "✅ 인플루언서 데이터가 업데이트되었습니다."
                         else:
@@ -96,14 +112,15 @@ def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, sav
                         
                         # 원시 데이터 저장 (기존 인플루언서)
                         if result.get('page_source') and result.get('debug_info'):
-                            raw_save_result = db_manager.save_crawl_raw_data(
-                                existing_influencer['id'],
-                                platform,
-                                clean_sns_id,
-                                result['page_source'],
-                                result.get('raw_profile_data', result),
-                                result.get('debug_info', {})
-                            )
+                            with db_timer.span('save_crawl_raw_data'):
+                                raw_save_result = db_manager.save_crawl_raw_data(
+                                    existing_influencer['id'],
+                                    platform,
+                                    clean_sns_id,
+                                    result['page_source'],
+                                    result.get('raw_profile_data', result),
+                                    result.get('debug_info', {})
+                                )
                             if raw_save_result["success"]:
                                 db_message += " 📄 원시 데이터 저장 완료"
                             else:
@@ -122,14 +139,15 @@ def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, sav
                             if result.get('page_source') and result.get('debug_info') and create_result.get('data'):
                                 new_influencer_id = create_result['data'][0]['id'] if create_result['data'] else None
                                 if new_influencer_id:
-                                    raw_save_result = db_manager.save_crawl_raw_data(
-                                        new_influencer_id,
-                                        platform,
-                                        clean_sns_id,
-                                        result['page_source'],
-                                        result.get('raw_profile_data', result),
-                                        result.get('debug_info', {})
-                                    )
+                                    with db_timer.span('save_crawl_raw_data'):
+                                        raw_save_result = db_manager.save_crawl_raw_data(
+                                            new_influencer_id,
+                                            platform,
+                                            clean_sns_id,
+                                            result['page_source'],
+                                            result.get('raw_profile_data', result),
+                                            result.get('debug_info', {})
+                                        )
                                     if raw_save_result["success"]:
                                         db_message += " 📄 원시 데이터 저장 완료"
                                     else:
@@ -139,6 +157,13 @@ def perform_crawling(platform: str, url: str, sns_id: str, debug_mode: bool, sav
                 else:
                     db_message = "💾 데이터베이스 저장을 건너뛰었습니다."
                 
+                # DB 쓰기 소요 시간도 크롤링 단계 시간과 함께 기록
+                if db_timer.spans and isinstance(result.get('debug_info'), dict):
+                    timings = result['debug_info'].setdefault('timings', {})
+                    timings.update({stage: round(seconds, 4) for stage, seconds in db_timer.spans.items()})
+                
+                # 원시 데이터 저장이 끝났으므로 page_source 블롭 해제
+                release_page_source(result)
                 crawler.close_driver()
                 
                 return {
@@ -215,11 +240,13 @@ def render_single_url_crawl():
         sns_id = None
     
     # 크롤링 옵션
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     with col1:
         debug_mode = st.checkbox("🔍 디버그 모드", help="페이지의 HTML 요소들을 확인할 수 있습니다", key="single_crawl_debug_mode")
     with col2:
         save_to_db = st.checkbox("💾 데이터베이스 저장", value=True, help="크롤링 결과를 데이터베이스에 저장합니다", key="single_crawl_save_to_db")
+    with col3:
+        force_refresh = st.checkbox("🔄 강제 새로고침", help="최근 크롤링 결과(캐시)를 사용하지 않고 새로 크롤링합니다", key="single_crawl_force_refresh")
     
     # DB 확인 상태 초기화
     if 'db_checked' not in st.session_state:
@@ -310,7 +337,7 @@ def render_single_url_crawl():
                     return
                 
                 with st.spinner(""):
-                    crawl_result = perform_crawling(platform, url, sns_id, debug_mode, save_to_db)
+                    crawl_result = perform_crawling(platform, url, sns_id, debug_mode, save_to_db, force_refresh)
                     
                     if crawl_result["success"]:
                         st.success(crawl_result["message"])
@@ -319,6 +346,9 @@ def render_single_url_crawl():
                         clean_sns_id = crawl_result["data"]["clean_sns_id"]
                         db_message = crawl_result["data"]["db_message"]
                         
+                        if result.get('cache'):
+                            st.caption(f"♻️ {int(result['cache']['age_seconds'] // 60)}분 전 크롤링 결과를 사용했습니다. 최신 데이터가 필요하면 '강제 새로고침'을 선택하세요.")
+                        
                         # 프로필 이미지 표시
                         if result.get('profile_image_url'):
                             st.image(result['profile_image_url'], width=150, caption="프로필 이미지")
@@ -400,6 +430,15 @@ def render_batch_url_crawl():
     st.subheader("📊 복수 URL 크롤링")
     st.markdown("데이터베이스에서 업데이트할 목록을 선택하여 일괄 크롤링을 수행합니다.")
     
+    # 백그라운드 작업 진행 현황
+    render_crawl_jobs('profile', key="profile_jobs")
+    
+    # 중단된 세션 재개 (크롤링 옵션은 아래 일괄 크롤링 폼의 디버그 모드/강제 새로고침 선택값을 그대로 사용)
+    render_resume_profile_sessions(
+        debug_mode=st.session_state.get("batch_crawl_debug_mode", False),
+        force_refresh=st.session_state.get("batch_crawl_force_refresh", False)
+    )
+    
     # 데이터베이스에서 크롤링할 목록 조회 (캐싱 적용)
     st.subheader("📋 크롤링 대상 선택")
     
@@ -497,6 +536,41 @@ def render_batch_url_crawl():
     else:
         st.info(f"📊 {len(filtered_influencers)}개 인플루언서가 표시됩니다")
     
+    # 우선순위 자동 선택 (오래된 정도, 팔로워 규모, 캠페인 참여, 최근 실패율 기준)
+    with st.expander("🎯 우선순위 자동 선택"):
+        col1, col2 = st.columns(2)
+        with col1:
+            priority_limit = st.number_input("최대 대상 수", min_value=1, value=50, step=10, key="priority_limit")
+        with col2:
+            priority_budget_minutes = st.number_input("시간 예산(분)", min_value=1, value=60, step=10, key="priority_budget_minutes")
+        
+        if st.button("🎯 우선순위 대상 선택", key="select_priority_influencers", help="현재 필터 조건 안에서 갱신 가치가 높은 Instagram 계정부터 선택합니다"):
+            with st.spinner("우선순위를 계산하는 중..."):
+                scheduler = RefreshScheduler()
+                scheduler.load(
+                    filtered_influencers,
+                    db_manager.get_influencer_campaign_counts(["planned", "active"]),
+                    db_manager.get_influencer_crawl_outcomes()
+                )
+                targets = scheduler.next_targets(limit=int(priority_limit), time_budget_seconds=priority_budget_minutes * 60)
+            st.session_state.priority_selected_ids = [target['influencer']['id'] for target in targets]
+            st.session_state.priority_plan = [{
+                '인플루언서명': target['influencer'].get('influencer_name') or target['influencer']['sns_id'],
+                '점수': target['components']['score'],
+                '오래됨': round(target['components']['staleness'], 2),
+                '팔로워 등급': target['components']['tier'],
+                '캠페인': '참여' if target['components']['campaign'] else '-',
+                '실패율': round(target['components']['failure_rate'], 2)
+            } for target in targets]
+            st.session_state.selected_filtered_influencers = False
+            st.session_state.selected_all_influencers = False
+            st.rerun()
+        
+        if st.session_state.get('priority_plan'):
+            estimated_minutes = len(st.session_state.priority_plan) * RefreshScheduler().estimated_seconds() / 60
+            st.caption(f"선택된 {len(st.session_state.priority_plan)}명, 예상 소요 약 {estimated_minutes:.0f}분")
+            st.dataframe(pd.DataFrame(st.session_state.priority_plan), use_container_width=True)
+    
     # 모두선택 옵션 추가
     col1, col2, col3 = st.columns([2, 1, 1])
     with col1:
@@ -509,21 +583,30 @@ def render_batch_url_crawl():
     with col2:
         if st.button("✅ 모두선택", help="표시된 모든 인플루언서를 선택합니다", key="select_filtered_influencers"):
             st.session_state.selected_filtered_influencers = True
+            st.session_state.priority_selected_ids = None
             st.rerun()
         
         if st.button("❌ 모두해제", help="모든 선택을 해제합니다", key="clear_all_selections"):
             st.session_state.selected_filtered_influencers = False
             st.session_state.selected_all_influencers = False
+            st.session_state.priority_selected_ids = None
+            st.session_state.priority_plan = None
             st.rerun()
     
     with col3:
         if st.button("🌐 전체선택", help="전체 인플루언서를 선택합니다 (필터 무시)", key="select_all_influencers"):
             st.session_state.selected_all_influencers = True
             st.session_state.selected_filtered_influencers = False
+            st.session_state.priority_selected_ids = None
             st.rerun()
     
     # 선택 상태 처리
-    if hasattr(st.session_state, 'selected_filtered_influencers') and st.session_state.selected_filtered_influencers:
+    if st.session_state.get('priority_selected_ids'):
+        # 우선순위 순서 유지 (필터 조건이 바뀌어 목록에서 빠진 대상은 제외)
+        labels_by_id = {influencer_id: label for label, influencer_id in filtered_influencer_options.items()}
+        selected_influencers = [labels_by_id[influencer_id] for influencer_id in st.session_state.priority_selected_ids if influencer_id in labels_by_id]
+        st.info(f"🎯 우선순위 자동 선택: {len(selected_influencers)}명")
+    elif hasattr(st.session_state, 'selected_filtered_influencers') and st.session_state.selected_filtered_influencers:
         selected_influencers = list(filtered_influencer_options.keys())
     elif hasattr(st.session_state, 'selected_all_influencers') and st.session_state.selected_all_influencers:
         # 전체 인플루언서 선택 시 전체 목록을 다시 조회
@@ -536,217 +619,220 @@ def render_batch_url_crawl():
         return
     
     # 크롤링 옵션
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns([1, 1, 2])
     with col1:
         debug_mode = st.checkbox("🔍 디버그 모드", help="페이지의 HTML 요소들을 확인할 수 있습니다", key="batch_crawl_debug_mode")
     with col2:
+        force_refresh = st.checkbox("🔄 강제 새로고침", help="최근 크롤링 결과(캐시)를 사용하지 않고 모두 새로 크롤링합니다", key="batch_crawl_force_refresh")
+    with col3:
         session_name = st.text_input("세션 이름", value=f"Batch Crawl - {len(selected_influencers)} influencers", key="batch_crawl_session_name")
+    run_in_background = render_background_option(key="batch_crawl_background")
     
     if st.button("🚀 일괄 크롤링 시작", type="primary", key="batch_crawl_start_influencers"):
         if not selected_influencers:
             st.error("크롤링할 인플루언서를 선택해주세요.")
             return
         
-        # 크롤링 세션 생성
-        session_result = db_manager.create_instagram_crawl_session(session_name, len(selected_influencers))
-        session_id = None
-        if session_result["success"]:
-            session_id = session_result["data"][0]["id"]
-            st.info(f"크롤링 세션이 생성되었습니다. (ID: {session_id})")
-        
-        # 진행률 표시를 위한 컨테이너
-        progress_container = st.container()
-        status_container = st.container()
-        results_container = st.container()
+        # 사용할 인플루언서 데이터 결정
+        if hasattr(st.session_state, 'selected_all_influencers') and st.session_state.selected_all_influencers:
+            # 전체 인플루언서 선택된 경우
+            influencers_to_use = all_influencers_total
+            influencer_options_to_use = all_influencer_options
+        else:
+            # 필터링된 인플루언서 선택된 경우
+            influencers_to_use = filtered_influencers
+            influencer_options_to_use = filtered_influencer_options
         
-        with progress_container:
-            progress_bar = st.progress(0)
-            progress_text = st.empty()
+        # 세션 작업 원장 항목 (재개 시 작업을 다시 만들 수 있도록 인플루언서 정보 포함)
+        ledger_items = []
+        for influencer_name in selected_influencers:
+            influencer_id = influencer_options_to_use[influencer_name]
+            influencer = next(inf for inf in influencers_to_use if inf['id'] == influencer_id)
+            ledger_items.append(profile_ledger_item(influencer))
         
-        with status_container:
-            status_text = st.empty()
+        # 크롤링 세션 및 작업 원장 생성
+        ledger = CrawlSessionLedger.create(session_name, 'profile', ledger_items)
+        if ledger:
+            st.info(f"크롤링 세션이 생성되었습니다. (ID: {ledger.session_id})")
+            ledger_items = ledger.items or ledger_items
         
-        # 크롤링 실행 (안전한 WebSocket 업데이트 사용)
-        with results_container:
-            with st.spinner(""):
-                crawler = InstagramCrawler()
-                results = []
-                
-                # 사용할 인플루언서 데이터 결정
-                if hasattr(st.session_state, 'selected_all_influencers') and st.session_state.selected_all_influencers:
-                    # 전체 인플루언서 선택된 경우
-                    influencers_to_use = all_influencers_total
-                    influencer_options_to_use = all_influencer_options
-                else:
-                    # 필터링된 인플루언서 선택된 경우
-                    influencers_to_use = filtered_influencers
-                    influencer_options_to_use = filtered_influencer_options
-                
-                for i, influencer_name in enumerate(selected_influencers):
-                    influencer_id = influencer_options_to_use[influencer_name]
-                    influencer = next(inf for inf in influencers_to_use if inf['id'] == influencer_id)
-                    
-                    # 안전한 진행률 업데이트
-                    try:
-                        from src.instagram_crawler import safe_streamlit_update
-                        progress = min(max(i / len(selected_influencers), 0.0), 1.0)
-                        safe_streamlit_update(
-                            progress_bar, 
-                            progress_text, 
-                            status_text, 
-                            progress, 
-                            i, 
-                            len(selected_influencers), 
-                            f"크롤링 중: {influencer.get('influencer_name') or influencer['sns_id']}"
-                        )
-                    except Exception as e:
-                        # 진행률 업데이트 실패 시 조용히 무시
-                        pass
-                    
-                    try:
-                        # 단일 URL 크롤링 자동화 - 인플루언서 프로필 크롤링
-                        if influencer['platform'] == 'instagram':
-                            # Instagram 프로필 URL 생성
-                            sns_id_clean = influencer['sns_id'].replace('@', '')
-                            url = f"https://www.instagram.com/{sns_id_clean}/"
-                            
-                            # 인플루언서 프로필 크롤링 (단일 URL 크롤링 자동화)
-                            result = crawler.crawl_instagram_profile(url, debug_mode)
-                            
-                            # 크롤링 결과를 데이터베이스에 저장
-                            if result['status'] == 'success':
-                                # 인플루언서 데이터 업데이트
-                                update_result = db_manager.update_influencer_data(influencer_id, result)
-                                if update_result["success"]:
-                                    st.success(f"✅ {influencer.get('influencer_name') or influencer['sns_id']} 데이터 업데이트 완료")
-                                
-                                # 크롤링 원시 데이터 저장
-                                raw_data_result = db_manager.save_crawl_raw_data(
-                                    influencer_id, 
-                                    influencer['platform'], 
-                                    influencer['sns_id'],
-                                    result.get('page_source', ''),
-                                    result,
-                                    result.get('debug_info', {})
-                                )
-                            
-                        else:
-                            result = {
-                                'status': 'error',
-                                'error': f"{influencer['platform']} 크롤링은 아직 지원되지 않습니다."
-                            }
-                        
-                        results.append({
-                            'name': influencer.get('influencer_name') or influencer['sns_id'],
-                            'platform': influencer['platform'],
-                            'sns_id': influencer['sns_id'],
-                            'url': url if influencer['platform'] == 'instagram' else 'N/A',
-                            'followers': result.get('followers_count', 0),
-                            'posts': result.get('post_count', 0),
-                            'status': result['status'],
-                            'error': result.get('error', ''),
-                            'updated_at': result.get('updated_at', '')
-                        })
-                        
-                    except Exception as e:
-                        results.append({
-                            'name': influencer.get('influencer_name') or influencer['sns_id'],
-                            'platform': influencer['platform'],
-                            'sns_id': influencer['sns_id'],
-                            'url': 'N/A',
-                            'followers': 0,
-                            'posts': 0,
-                            'status': 'error',
-                            'error': str(e),
-                            'updated_at': ''
-                        })
-                
-                crawler.close_driver()
-                
-                # 안전한 완료 진행률 업데이트
-                try:
-                    from src.instagram_crawler import safe_streamlit_update
-                    safe_streamlit_update(
-                        progress_bar, 
-                        progress_text, 
-                        status_text, 
-                        1.0, 
-                        len(selected_influencers), 
-                        len(selected_influencers), 
-                        "크롤링 완료"
-                    )
-                except Exception as e:
-                    # 진행률 업데이트 실패 시 조용히 무시
-                    pass
-        
-        # 결과를 데이터베이스에 저장 (인플루언서 프로필 크롤링 결과)
-        successful_crawls = 0
-        failed_crawls = 0
-        
-        for result in results:
-            if result['status'] == 'success':
-                # 인플루언서 프로필 크롤링 결과를 세션에 기록
-                crawl_result = InstagramCrawlResult(
-                    session_id=session_id,
-                    post_name=f"Profile - {result['name']}",
-                    post_url=result['url'],
-                    likes=0,  # 프로필 크롤링에서는 좋아요 수가 없음
-                    comments=0,  # 프로필 크롤링에서는 댓글 수가 없음
-                    status=result['status']
-                )
-                
-                save_result = db_manager.save_instagram_crawl_result(crawl_result)
-                if save_result["success"]:
-                    successful_crawls += 1
+        if run_in_background:
+            job_id = submit_crawl_job('profile', ledger, force_refresh)
+            if job_id:
+                st.success(f"백그라운드 작업이 등록되었습니다. (ID: {job_id[:8]}) 워커가 순서대로 실행합니다.")
             else:
-                failed_crawls += 1
-        
-        # 세션 업데이트
-        if session_id:
-            db_manager.update_instagram_crawl_session(session_id, successful_crawls, failed_crawls, "completed")
-        
-        # 결과 표시
-        st.success("일괄 크롤링이 완료되었습니다!")
+                st.error("백그라운드 작업을 등록하지 못했습니다. (크롤링 세션 생성 실패)")
+            return
         
-        # 결과 데이터프레임 생성
-        results_df = pd.DataFrame(results)
+        run_profile_batch_crawl(ledger, ledger_items, debug_mode, force_refresh)
+
+def render_resume_profile_sessions(debug_mode: bool = False, force_refresh: bool = False):
+    """중단된 프로필 일괄 크롤링 세션 재개"""
+    session_id = render_resume_session_picker('profile', key="resume_profile_session")
+    if session_id:
+        ledger = CrawlSessionLedger.resume(session_id)
+        st.info(f"세션을 재개합니다. 미완료 항목 {len(ledger.items)}건 (ID: {session_id})")
+        run_profile_batch_crawl(ledger, ledger.items, debug_mode, force_refresh)
+
+def run_profile_batch_crawl(ledger: Optional[CrawlSessionLedger], ledger_items: List[Dict[str, Any]], debug_mode: bool = False, force_refresh: bool = False):
+    """원장 항목 기준 프로필 일괄 크롤링 실행 (항목이 끝날 때마다 결과와 원장 상태 저장)"""
+    session_id = ledger.session_id if ledger else None
+    total = len(ledger_items)
+    supervisor_snapshot = driver_supervisor.stats()
+    stage_stats = StageStats()  # 이번 일괄 크롤링의 단계별 소요 시간
+    
+    # 진행률 표시 (한 줄 요약 + 실패 표를 일정 간격으로 묶어서 갱신)
+    progress_container = st.container()
+    results_container = st.container()
+    
+    with progress_container:
+        progress = StreamlitProgress(total, item_label="인플루언서")
+    
+    # 끝난 결과부터 표에 이어 붙임
+    with results_container:
+        results_view = StreamingResultsView(
+            {'name': '인플루언서명', 'platform': '플랫폼', 'sns_id': 'SNS ID', 'followers': '팔로워 수', 'posts': '게시물 수', 'status': '상태', 'error': '오류'},
+            "총 인플루언서", 'followers', "총 팔로워"
+        )
+    
+    if ledger:
+        ledger.claim()
+    
+    # 크롤링 실행 (안전한 WebSocket 업데이트 사용)
+    with st.spinner(""):
+        # 크롤링 작업 목록 생성 (Instagram 외 플랫폼은 즉시 오류 처리)
+        jobs = []
+        for item in ledger_items:
+            influencer = item['payload']
+            if influencer['platform'] == 'instagram':
+                jobs.append({'kind': 'profile', 'url': item['item_url'], 'debug_mode': debug_mode, 'force_refresh': force_refresh,
+                             'influencer': influencer, 'ledger_item': item})
+            else:
+                error = f"{influencer['platform']} 크롤링은 아직 지원되지 않습니다."
+                if ledger:
+                    ledger.fail(item, error)
+                progress.advance(influencer.get('influencer_name') or influencer['sns_id'], 'error', error)
+                results_view.add({
+                    'name': influencer.get('influencer_name') or influencer['sns_id'],
+                    'platform': influencer['platform'],
+                    'sns_id': influencer['sns_id'],
+                    'url': 'N/A',
+                    'followers': 0,
+                    'posts': 0,
+                    'status': 'error',
+                    'error': error,
+                    'updated_at': ''
+                })
         
-        # 통계 표시
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("총 인플루언서", len(results_df))
-        with col2:
-            success_count = len(results_df[results_df['status'] == 'success'])
-            st.metric("성공", success_count)
-        with col3:
-            error_count = len(results_df[results_df['status'] == 'error'])
-            st.metric("실패", error_count)
-        with col4:
-            total_followers = results_df[results_df['status'] == 'success']['followers'].sum()
-            st.metric("총 팔로워", f"{total_followers:,}")
+        # 디버그 모드는 화면 출력 순서를 위해 1개씩 실행하고 작업 스레드에 스크립트 컨텍스트 연결
+        engine_kwargs = {}
+        if debug_mode:
+            script_ctx = get_script_run_ctx()
+            engine_kwargs = {
+                'concurrency': 1,
+                'thread_initializer': lambda: add_script_run_ctx(threading.current_thread(), script_ctx)
+            }
         
-        # 결과 테이블 표시 (필요한 컬럼만)
-        st.subheader("📊 크롤링 결과")
-        display_df = results_df[['name', 'platform', 'sns_id', 'followers', 'posts', 'status', 'error']].copy()
-        display_df.columns = ['인플루언서명', '플랫폼', 'SNS ID', '팔로워 수', '게시물 수', '상태', '오류']
-        st.dataframe(display_df, use_container_width=True)
+        # 크롤 → 파싱 → 저장 파이프라인 (브라우저는 파싱/DB 저장을 기다리지 않음)
+        pipeline = CrawlPipeline(CrawlEngine(**engine_kwargs), parse_profile_result, persist_profile_batch)
         
-        # CSV 다운로드
-        csv = display_df.to_csv(index=False, encoding='utf-8-sig')
-        st.download_button(
-            label="📥 결과 CSV 다운로드",
-            data=csv,
-            file_name="influencer_batch_crawl_results.csv",
-            mime="text/csv"
-        )
+        # 저장까지 끝난 순서대로 결과 기록
+        for item in pipeline.run(jobs):
+            job, result, persisted = item['job'], item['result'], item['persisted']
+            stage_stats.add_result(result)
+            stage_stats.add(persisted.get('timings'))
+            influencer = job['influencer']
+            display_name = influencer.get('influencer_name') or influencer['sns_id']
+            
+            try:
+                # 항목 결과를 즉시 세션에 기록
+                result_ref = None
+                if result['status'] == 'success':
+                    crawl_result = InstagramCrawlResult(
+                        session_id=session_id,
+                        post_name=f"Profile - {display_name}",
+                        post_url=job['url'],
+                        likes=0,  # 프로필 크롤링에서는 좋아요 수가 없음
+                        comments=0,  # 프로필 크롤링에서는 댓글 수가 없음
+                        status=result['status']
+                    )
+                    with stage_stats.timer('save_crawl_result'):
+                        save_result = db_manager.save_instagram_crawl_result(crawl_result)
+                    if save_result["success"] and save_result["data"]:
+                        result_ref = save_result["data"][0].get("id")
+                
+                if ledger:
+                    if result['status'] == 'success':
+                        ledger.complete(job['ledger_item'], result_ref)
+                    elif result['status'] == 'deferred':
+                        ledger.defer(job['ledger_item'], result.get('error', ''))
+                    else:
+                        ledger.fail(job['ledger_item'], result.get('error', ''))
+                
+                results_view.add({
+                    'name': display_name,
+                    'platform': influencer['platform'],
+                    'sns_id': influencer['sns_id'],
+                    'url': job['url'],
+                    'followers': result.get('followers_count', 0),
+                    'posts': result.get('post_count', 0),
+                    'status': result['status'],
+                    'error': result.get('error', ''),
+                    'updated_at': result.get('updated_at', '')
+                })
+                progress.advance(display_name, result['status'], result.get('error', ''), updated=bool(persisted.get('updated')))
+                
+            except Exception as e:
+                results_view.add({
+                    'name': display_name,
+                    'platform': influencer['platform'],
+                    'sns_id': influencer['sns_id'],
+                    'url': 'N/A',
+                    'followers': 0,
+                    'posts': 0,
+                    'status': 'error',
+                    'error': str(e),
+                    'updated_at': ''
+                })
+                progress.advance(display_name, 'error', str(e))
         
-        # 에러가 있는 경우 상세 표시
-        error_results = results_df[results_df['status'] == 'error']
-        if len(error_results) > 0:
-            st.subheader("⚠️ 에러 상세 정보")
-            error_display = error_results[['name', 'platform', 'sns_id', 'error']].copy()
-            error_display.columns = ['인플루언서명', '플랫폼', 'SNS ID', '오류 메시지']
-            st.dataframe(error_display, use_container_width=True)
+        progress.finish("크롤링 완료")
+    results_df = results_view.close()
+    
+    # 세션 업데이트 (원장 기준 집계)
+    if ledger:
+        ledger.finish()
+    
+    # 결과 표시
+    st.success("일괄 크롤링이 완료되었습니다!")
+    render_deferred_notice(results_view, ledger)
+    
+    if results_df.empty:
+        return
+    
+    render_driver_restarts(supervisor_snapshot)
+    render_stage_timings(stage_stats)
+    
+    # CSV 다운로드용 (필요한 컬럼만)
+    display_df = results_df[['name', 'platform', 'sns_id', 'followers', 'posts', 'status', 'error']].copy()
+    display_df.columns = ['인플루언서명', '플랫폼', 'SNS ID', '팔로워 수', '게시물 수', '상태', '오류']
+    
+    # CSV 다운로드
+    csv = display_df.to_csv(index=False, encoding='utf-8-sig')
+    st.download_button(
+        label="📥 결과 CSV 다운로드",
+        data=csv,
+        file_name="influencer_batch_crawl_results.csv",
+        mime="text/csv"
+    )
+    
+    # 에러가 있는 경우 상세 표시
+    error_results = results_df[results_df['status'] == 'error']
+    if len(error_results) > 0:
+        st.subheader("⚠️ 에러 상세 정보")
+        error_display = error_results[['name', 'platform', 'sns_id', 'error']].copy()
+        error_display.columns = ['인플루언서명', '플랫폼', 'SNS ID', '오류 메시지']
+        st.dataframe(error_display, use_container_width=True)
 
 def render_campaign_management():
     """캠페인 관리 컴포넌트"""
@@ -1936,16 +2022,17 @@ def render_performance_crawling_modal():
     
     # 크롤링 옵션
     debug_mode = st.checkbox("🔍 디버그 모드", help="페이지의 HTML 요소들을 확인할 수 있습니다", key="performance_crawl_debug_mode")
+    force_refresh = st.checkbox("🔄 강제 새로고침", help="최근 크롤링 결과(캐시)를 사용하지 않고 새로 크롤링합니다", key="performance_crawl_force_refresh")
     
     if st.button("🚀 성과 크롤링 시작", type="primary", key="performance_crawl_start"):
         with st.spinner(""):
             try:
-                crawler = InstagramCrawler()
+                crawler = InstagramCrawler(pool=driver_pool)
                 
                 # URL 생성
                 if influencer['platform'] == 'instagram':
                     url = f"https://www.instagram.com/{influencer['sns_id'].replace('@', '')}/"
-                    result = crawler.crawl_instagram_post(url, debug_mode)
+                    result = crawler.crawl_instagram_post(url, debug_mode, force_refresh=force_refresh)
                 else:
                     st.warning(f"{influencer['platform']} 크롤링은 아직 지원되지 않습니다.")
                     return
@@ -0,0 +1,124 @@
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from .crawl_session import CrawlSessionLedger
+from .db.database import db_manager
+from .instagram_crawler import global_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+class LeasedSessionLedger(CrawlSessionLedger):
+    """워커가 임대한 세션 항목 원장 (여러 호스트의 워커가 같은 세션을 나눠 크롤링)
+
+    항목은 임대 시 FOR UPDATE SKIP LOCKED로 in_flight가 되므로 다른 워커와 겹치지 않고,
+    renew()로 임대를 연장하는 동안만 완료/실패가 반영됩니다. 여러 세션의 항목이 섞일 수 있습니다.
+    """
+    def __init__(self, worker_id: str, items: List[Dict[str, Any]], lease_seconds: int):
+        super().__init__(None, items)
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.lost = 0  # 임대가 만료되어 결과가 반영되지 않은 항목 수
+        self._unfinished = {item["id"] for item in items if item.get("id")}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def lease(cls, worker_id: str, limit: int, lease_seconds: int, item_kind: str = "profile",
+              session_id: Optional[str] = None, max_attempts: int = 3) -> "LeasedSessionLedger":
+        """대기 중이거나 임대가 만료된 항목을 최대 limit개 임대"""
+        result = db_manager.claim_crawl_session_items(worker_id, limit, lease_seconds, item_kind, session_id, max_attempts)
+        if not result["success"]:
+            logger.warning(result["message"])
+        items = sorted(result["data"], key=lambda item: (item.get("created_at") or "", item["item_index"]))
+        return cls(worker_id, items, lease_seconds)
+
+    @property
+    def session_ids(self) -> List[str]:
+        return sorted({item["session_id"] for item in self.items if item.get("session_id")})
+
+    def claim(self):
+        """임대할 때 이미 in_flight로 표시되므로 할 일 없음"""
+
+    def _finish(self, item: Dict[str, Any], status: str, result_ref: str = None, error_message: str = None):
+        if not item.get("id"):
+            return
+        with self._lock:
+            self._unfinished.discard(item["id"])
+        result = db_manager.finish_crawl_session_item(self.worker_id, item["id"], status, result_ref, error_message)
+        if not result["success"]:
+            logger.warning(result["message"])
+        elif not result["data"]:
+            with self._lock:
+                self.lost += 1
+            logger.warning(f"임대가 만료된 항목이라 결과를 반영하지 않았습니다: {item.get('item_key')}")
+
+    def complete(self, item: Dict[str, Any], result_ref: str = None):
+        self._finish(item, "done", result_ref)
+
+    def fail(self, item: Dict[str, Any], error_message: str = "", result_ref: str = None):
+        self._finish(item, "failed", result_ref, error_message or "")
+
+    def defer(self, item: Dict[str, Any], reason: str = ""):
+        """차단기로 보류한 항목의 임대 반환 (실패로 세지 않고 다른 워커/다음 임대에서 다시 크롤링)"""
+        if not item.get("id"):
+            return
+        with self._lock:
+            self._unfinished.discard(item["id"])
+        result = db_manager.release_crawl_session_item_leases(self.worker_id, [item["id"]])
+        if not result["success"]:
+            logger.warning(result["message"])
+
+    def renew(self) -> int:
+        """아직 끝나지 않은 항목의 임대 연장 (하트비트), 연장된 항목 수 반환"""
+        with self._lock:
+            item_ids = list(self._unfinished)
+        if not item_ids:
+            return 0
+        result = db_manager.renew_crawl_session_item_leases(self.worker_id, item_ids, self.lease_seconds)
+        if not result["success"]:
+            logger.warning(result["message"])
+        elif result["data"] < len(item_ids):
+            logger.warning(f"임대 {len(item_ids) - result['data']}건이 이미 만료되어 다른 워커에 넘어갔습니다.")
+        return result["data"]
+
+    def release(self) -> int:
+        """끝내지 못한 항목을 pending으로 반환 (워커 종료 시)"""
+        with self._lock:
+            item_ids = list(self._unfinished)
+            self._unfinished.clear()
+        if not item_ids:
+            return 0
+        result = db_manager.release_crawl_session_item_leases(self.worker_id, item_ids)
+        if not result["success"]:
+            logger.warning(result["message"])
+        return result["data"]
+
+    def finish(self) -> Dict[str, int]:
+        """임대한 항목이 속한 세션마다 원장 기준 집계 갱신 (남은 항목이 없으면 completed)"""
+        totals = {"pending": 0, "in_flight": 0, "done": 0, "failed": 0}
+        for session_id in self.session_ids:
+            counts = CrawlSessionLedger(session_id, []).finish()
+            for status, count in counts.items():
+                totals[status] = totals.get(status, 0) + count
+        return totals
+
+class DatabaseRateLimiter:
+    """워커 전체가 공유하는 분당 요청 예산 (crawl_rate_limits, TokenBucket과 같은 wait() 인터페이스)
+
+    토큰 예약은 DB 함수 한 번으로 처리하고, DB 호출이 실패하면 프로세스 전역 예산으로 대신 대기합니다.
+    """
+    def __init__(self, name: str = "instagram", fallback=None):
+        self.name = name
+        self.fallback = fallback or global_rate_limiter
+
+    def wait(self) -> float:
+        """토큰 하나를 예약하고 사용 가능해질 때까지 대기, 실제 대기한 시간 반환"""
+        result = db_manager.take_crawl_rate_token(self.name)
+        if not result["success"]:
+            logger.warning(result["message"])
+            return self.fallback.wait()
+        waited = result["data"]
+        if waited > 0:
+            time.sleep(waited)
+        return waited
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+크롤링 원시 데이터 레코드 생성 테스트 (page_source가 PageHandle인 결과)
+"""
+
+import json
+
+from src.db.database import db_manager
+from src.page_store import PageStore
+
+PAGE = "<html><head><title>test</title></head><body><p>팔로워 1,234명</p></body></html>"
+
+def test_record_from_page_handle_result_is_json_serializable(tmp_path):
+    store = PageStore(str(tmp_path))
+    handle = store.put(PAGE)
+    result = {
+        'status': 'success',
+        'influencer_name': 'test',
+        'followers_count': 1234,
+        'page_source': handle,
+        'debug_info': {'tier': 'browser'}
+    }
+
+    record = db_manager.build_crawl_raw_record('influencer-1', 'instagram', 'test', handle, result, result['debug_info'])
+
+    json.dumps(record)
+    raw = record['raw_json']
+    assert raw['page_source_length'] == len(PAGE)
+    assert 'page_source' not in raw['profile_data']
+    assert raw['profile_data']['followers_count'] == 1234
+    assert raw['debug_info'] == {'tier': 'browser'}
+    # 결과의 핸들은 그대로 남아 저장 후 해제할 수 있어야 함
+    assert result['page_source'] is handle and not handle.released